@@ -125,6 +125,8 @@ while [ "$current_ord" -le "$end_ord" ]; do
         --batch-id "$batch_id"
         --target-size-mb 96
         --source-prefix "gs://${BUCKET}/${PREFIX}"
+        --incremental  # reruns skip partitions whose inputs are unchanged
+        --csv-cache    # parse each CSV once; reruns memory-map the .arrow cache
       )
 
       # Export dimension tables only on first chunk
@@ -138,45 +140,30 @@ while [ "$current_ord" -le "$end_ord" ]; do
       fi
       ecomlake export-raw "${export_args[@]}"
 
-      # Mark dimensions as exported and upload them on first chunk
-      if [ ! -f "$DIMENSIONS_EXPORTED_FILE" ]; then
-        echo "☁️  Uploading dimension tables (customers, product_catalog) to gs://${BUCKET}/${PREFIX}"
+      upload_args=(
+        --source "$TARGET_ROOT"
+        --bucket "$BUCKET"
+        --prefix "$PREFIX"
+        --start-date "$chunk_start"
+        --end-date "$chunk_end"
+        --concurrency 8
+      )
 
-        # Upload customers (partitioned by signup_date)
-        if [ -d "${TARGET_ROOT}/customers" ]; then
-          echo "  📤 Uploading customers partitions (signup_date=*)"
-          gsutil -m cp -r "${TARGET_ROOT}/customers" "gs://${BUCKET}/${PREFIX}/"
-        fi
+      # Upload dimension partitions (signup_date=*, category=*) along with the first chunk
+      if [ ! -f "$DIMENSIONS_EXPORTED_FILE" ]; then
+        upload_args+=( --dimensions )
+      fi
 
-        # Upload product_catalog (partitioned by category)
-        if [ -d "${TARGET_ROOT}/product_catalog" ]; then
-          echo "  📤 Uploading product_catalog partitions (category=*)"
-          gsutil -m cp -r "${TARGET_ROOT}/product_catalog" "gs://${BUCKET}/${PREFIX}/"
-        fi
+      echo "☁️  Uploading table partitions to gs://${BUCKET}/${PREFIX}"
+      # One process, client, and worker pool for every partition in the chunk
+      ecomlake upload-raw "${upload_args[@]}"
 
+      # Mark dimensions as exported and uploaded after the first chunk
+      if [ ! -f "$DIMENSIONS_EXPORTED_FILE" ]; then
         echo "dimensions_exported" > "$DIMENSIONS_EXPORTED_FILE"
         echo "✅ Dimension tables exported and uploaded (will not be re-processed in subsequent chunks)"
       fi
 
-      echo "☁️  Uploading transactional table partitions to gs://${BUCKET}/${PREFIX}"
-      current_date="$chunk_start"
-      while true; do
-        ecomlake upload-raw \
-          --source "$TARGET_ROOT" \
-          --bucket "$BUCKET" \
-          --prefix "$PREFIX" \
-          --ingest-date "$current_date"
-        if [ "$current_date" = "$chunk_end" ]; then
-          break
-        fi
-        current_date=$( \
-          python - "$current_date" <<'PY'
-import sys, datetime as dt
-print((dt.date.fromisoformat(sys.argv[1]) + dt.timedelta(days=1)).isoformat())
-PY
-        )
-      done
-
       echo "🧹 Cleaning latest raw run directory $latest_run"
       rm -rf "$latest_run"
 
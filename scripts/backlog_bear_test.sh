@@ -125,6 +125,8 @@ while [ "$current_ord" -le "$end_ord" ]; do
         --batch-id "$batch_id"
         --target-size-mb 96
         --source-prefix "gs://${BUCKET}/${PREFIX}"
+        --incremental  # reruns skip partitions whose inputs are unchanged
+        --csv-cache    # parse each CSV once; reruns memory-map the .arrow cache
       )
 
       # Export dimension tables only on first chunk
@@ -144,24 +146,17 @@ while [ "$current_ord" -le "$end_ord" ]; do
         echo "✅ Dimension tables exported (will not be re-exported in subsequent chunks)"
       fi
 
+      upload_args=(
+        --source "$TARGET_ROOT"
+        --bucket "$BUCKET"
+        --prefix "$PREFIX"
+        --start-date "$chunk_start"
+        --end-date "$chunk_end"
+        --concurrency 8
+      )
       echo "☁️  Uploading partitions to gs://${BUCKET}/${PREFIX}"
-      current_date="$chunk_start"
-      while true; do
-        ecomlake upload-raw \
-          --source "$TARGET_ROOT" \
-          --bucket "$BUCKET" \
-          --prefix "$PREFIX" \
-          --ingest-date "$current_date"
-        if [ "$current_date" = "$chunk_end" ]; then
-          break
-        fi
-        current_date=$( \
-          python - "$current_date" <<'PY'
-import sys, datetime as dt
-print((dt.date.fromisoformat(sys.argv[1]) + dt.timedelta(days=1)).isoformat())
-PY
-        )
-      done
+      # One process, client, and worker pool for every partition in the chunk
+      ecomlake upload-raw "${upload_args[@]}"
 
       echo "🧹 Cleaning latest raw run directory $latest_run"
       rm -rf "$latest_run"
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Compare peak RSS of the copy-heavy legacy write path with the current one.
+
+Each mode runs in a fresh process: it builds the same synthetic `orders` frame,
+records RSS, writes one partition, and reports the peak RSS growth.
+
+Usage:
+    python scripts/benchmark_export_memory.py --rows 2000000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from ecom_datalake_extension.config import require_table_config
+from ecom_datalake_extension.lineage import compute_event_ids
+from ecom_datalake_extension.parquet_writer import write_partitioned_parquet
+
+
+def _rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def _orders(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "order_id": [f"ORD-{n:09d}" for n in range(rows)],
+            "order_date": "2024-02-15T12:00:00",
+            "customer_id": [f"CUST-{n:06d}" for n in rng.integers(0, 300_000, rows)],
+            "order_channel": rng.choice(["Web", "App", "Phone"], rows),
+            "gross_total": rng.normal(80, 30, rows).round(2),
+            "net_total": rng.normal(75, 30, rows).round(2),
+        }
+    )
+
+
+def _legacy_write(df: pd.DataFrame, output_root: Path, rows_per_chunk: int) -> None:
+    """The pre-optimization path: filter copy, chunk copies, lineage copy."""
+    config = require_table_config("orders")
+    filtered = df[df["order_date"].astype(str).str[:10] == "2024-02-15"].copy()
+    chunks = [
+        filtered.iloc[start : start + rows_per_chunk].copy()
+        for start in range(0, len(filtered), rows_per_chunk)
+    ]
+    partition_dir = output_root / "orders" / "ingest_dt=2024-02-15"
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    for index, chunk in enumerate(chunks):
+        enriched = chunk.copy()
+        enriched["batch_id"] = "batch_benchmark"
+        enriched["ingestion_ts"] = "2024-02-15T00:00:00+00:00"
+        enriched["event_id"] = compute_event_ids("orders", enriched, config.primary_keys)
+        enriched.to_parquet(partition_dir / f"part-{index:04d}.parquet", index=False)
+
+
+def _current_write(df: pd.DataFrame, output_root: Path, rows_per_chunk: int) -> None:
+    filtered = df[df["order_date"].astype(str).str[:10] == "2024-02-15"]
+    write_partitioned_parquet(
+        filtered,
+        table_config=require_table_config("orders"),
+        output_root=output_root,
+        ingest_dt=date(2024, 2, 15),
+        batch_id="batch_benchmark",
+    )
+
+
+def _run(mode: str, rows: int, queue: multiprocessing.Queue) -> None:
+    df = _orders(rows)
+    baseline = _rss_mb()
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = _legacy_write if mode == "legacy" else _current_write
+        writer(df, Path(tmp), rows_per_chunk=max(1, rows // 4))
+    queue.put((mode, baseline, _rss_mb(), time.perf_counter() - started))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'mode':<8} {'data_mb':>9} {'peak_mb':>9} {'growth_mb':>10} {'seconds':>8}")
+    for mode in ("legacy", "current"):
+        queue = context.Queue()
+        process = context.Process(target=_run, args=(mode, args.rows, queue))
+        process.start()
+        name, baseline, peak, elapsed = queue.get()
+        process.join()
+        print(f"{name:<8} {baseline:>9.1f} {peak:>9.1f} {peak - baseline:>10.1f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
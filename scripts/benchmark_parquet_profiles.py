@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark Parquet encoding profiles (write time and file size) per table.
+
+Usage:
+    python scripts/benchmark_parquet_profiles.py --source artifacts/raw_run_<ts>
+    python scripts/benchmark_parquet_profiles.py --rows 500000   # synthetic data
+"""
+
+import argparse
+import tempfile
+import time
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from ecom_datalake_extension.config import (
+    TABLE_EXPORT_CONFIGS,
+    ParquetEncodingProfile,
+    TableExportConfig,
+)
+from ecom_datalake_extension.parquet_writer import write_partitioned_parquet
+
+PROFILES = {
+    "snappy": ParquetEncodingProfile(compression="snappy"),
+    "zstd-3": ParquetEncodingProfile(compression="zstd", compression_level=3),
+    "zstd-9": ParquetEncodingProfile(compression="zstd", compression_level=9),
+    "gzip-6": ParquetEncodingProfile(compression="gzip", compression_level=6),
+    "lz4": ParquetEncodingProfile(compression="lz4"),
+    "none": ParquetEncodingProfile(compression="none"),
+}
+
+
+def synthetic_frame(config: TableExportConfig, rows: int) -> pd.DataFrame:
+    """Builds a generator-shaped frame: keys, an event timestamp, and typical attributes."""
+    rng = np.random.default_rng(42)
+    data: dict[str, object] = {}
+    for key in config.primary_keys:
+        data[key] = [f"{key.upper()}-{n:08d}" for n in range(rows)]
+    if config.event_date_column:
+        seconds = rng.integers(0, 86_400, rows)
+        data[config.event_date_column] = pd.to_datetime("2024-02-15") + pd.to_timedelta(
+            seconds, unit="s"
+        )
+        data[config.event_date_column] = data[config.event_date_column].strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+    data["customer_id"] = [f"CUST-{n:06d}" for n in rng.integers(0, 300_000, rows)]
+    data["category"] = rng.choice(["Electronics", "Books", "Home", "Toys", "Apparel"], rows)
+    data["channel"] = rng.choice(["Web", "App", "Phone"], rows)
+    data["quantity"] = rng.integers(1, 6, rows)
+    data["unit_price"] = rng.normal(45, 20, rows).round(2)
+    return pd.DataFrame(data)
+
+
+def load_frame(config: TableExportConfig, source: Path | None, rows: int) -> pd.DataFrame:
+    if source:
+        csv_path = source / f"{config.table_name}.csv"
+        if csv_path.exists():
+            return pd.read_csv(csv_path)
+    return synthetic_frame(config, rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", type=Path, default=None, help="Directory of generator CSVs.")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows per synthetic table.")
+    parser.add_argument("--table", action="append", dest="tables", help="Restrict to tables.")
+    parser.add_argument("--target-size-mb", type=int, default=16)
+    args = parser.parse_args()
+
+    tables = args.tables or sorted(TABLE_EXPORT_CONFIGS)
+    print(f"{'table':<16} {'profile':<12} {'rows':>10} {'seconds':>8} {'size_mb':>8} {'files':>5}")
+    print("-" * 64)
+    with tempfile.TemporaryDirectory() as tmp:
+        for table in tables:
+            config = TABLE_EXPORT_CONFIGS[table]
+            df = load_frame(config, args.source, args.rows)
+            profiles = {"configured": config.encoding, **PROFILES}
+            for name, profile in profiles.items():
+                output_root = Path(tmp) / table / name
+                started = time.perf_counter()
+                manifest_files, *_ = write_partitioned_parquet(
+                    df,
+                    table_config=replace(config, encoding=profile),
+                    output_root=output_root,
+                    ingest_dt=date(2024, 2, 15),
+                    batch_id="batch_benchmark",
+                    target_size_mb=args.target_size_mb,
+                )
+                elapsed = time.perf_counter() - started
+                size_mb = sum((output_root / f.path).stat().st_size for f in manifest_files) / 2**20
+                print(
+                    f"{table:<16} {name:<12} {len(df):>10} {elapsed:>8.2f} "
+                    f"{size_mb:>8.2f} {len(manifest_files):>5}"
+                )
+
+
+if __name__ == "__main__":
+    main()
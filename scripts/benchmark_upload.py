@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Measure partition upload throughput offline against a local-directory bucket.
+
+Synthetic partitions are uploaded through `upload_partitions` with a
+`LocalBackend` whose requests are slowed to a fixed latency and per-request
+bandwidth, so concurrency settings can be compared reproducibly without GCS.
+A second pass over the same files reports the skip-unchanged cost.
+With `--throttle-above N` the link answers like a throttling store whenever
+more than N uploads are in flight, which shows what `--adaptive` settles on.
+
+Usage:
+    python scripts/benchmark_upload.py --partitions 8 --files 4 --file-mb 16
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from ecom_datalake_extension.gcs_uploader import upload_partitions
+from ecom_datalake_extension.storage_backends import LocalBackend
+from ecom_datalake_extension.upload_control import UploadController, report_throttle
+
+
+class _SimulatedLinkBackend(LocalBackend):
+    """A local bucket where each upload pays a round trip plus transfer time."""
+
+    def __init__(
+        self, root: Path, latency_ms: float, request_mbps: float, throttle_above: int | None
+    ) -> None:
+        super().__init__(root)
+        self.latency = latency_ms / 1000
+        self.request_bytes_per_s = request_mbps * 1024 * 1024
+        self.throttle_above = throttle_above
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
+    def upload(self, path: Path, key: str) -> None:
+        while True:
+            with self.lock:
+                overloaded = (
+                    self.throttle_above is not None and self.in_flight >= self.throttle_above
+                )
+                if not overloaded:
+                    self.in_flight += 1
+            if not overloaded:
+                break
+            # A 429 costs a round trip and a one second retry backoff
+            report_throttle()
+            time.sleep(self.latency + 1.0)
+        try:
+            time.sleep(self.latency + path.stat().st_size / self.request_bytes_per_s)
+            super().upload(path, key)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def _partitions(root: Path, partitions: int, files: int, file_mb: float) -> list[tuple[Path, str]]:
+    pairs = []
+    for index in range(partitions):
+        partition_dir = root / "orders" / f"ingest_dt=2024-02-{index + 1:02d}"
+        partition_dir.mkdir(parents=True)
+        for part in range(files):
+            (partition_dir / f"part-{part:04d}.parquet").write_bytes(
+                os.urandom(int(file_mb * 1024 * 1024))
+            )
+        (partition_dir / "_MANIFEST.json").write_text("{}")
+        (partition_dir / "_SUCCESS").touch()
+        pairs.append((partition_dir, f"ecom/raw/orders/{partition_dir.name}"))
+    return pairs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--partitions", type=int, default=8)
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--file-mb", type=float, default=8.0)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--request-mbps", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--throttle-above", type=int, default=None)
+    parser.add_argument("--adaptive", action="store_true")
+    parser.add_argument("--max-bandwidth", type=float, default=None, help="MiB/s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pairs = _partitions(Path(tmp) / "raw", args.partitions, args.files, args.file_mb)
+        total_mb = (
+            sum(path.stat().st_size for directory, _ in pairs for path in directory.iterdir())
+            / 2**20
+        )
+        print(
+            f"{'concurrency':>11} {'pass':>10} {'seconds':>8} {'MB/s':>8} {'skipped':>8} "
+            f"{'limit':>6} {'throttled':>9}"
+        )
+        for concurrency in args.concurrency:
+            backend = _SimulatedLinkBackend(
+                Path(tmp) / f"bucket{concurrency}",
+                args.latency_ms,
+                args.request_mbps,
+                args.throttle_above,
+            )
+            for label in ("cold", "unchanged"):
+                controller = UploadController(
+                    max_concurrency=concurrency,
+                    adaptive=args.adaptive,
+                    max_bandwidth_mbps=args.max_bandwidth,
+                )
+                started = time.perf_counter()
+                results = upload_partitions(
+                    pairs, backend=backend, concurrency=concurrency, controller=controller
+                )
+                elapsed = time.perf_counter() - started
+                skipped = sum(result.files_skipped for result in results)
+                print(
+                    f"{concurrency:>11} {label:>10} {elapsed:>8.2f} "
+                    f"{total_mb / elapsed:>8.1f} {skipped:>8} "
+                    f"{controller.limit:>6} {controller.throttle_events:>9}"
+                )
+
+
+if __name__ == "__main__":
+    main()
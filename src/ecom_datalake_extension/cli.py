@@ -1,30 +1,72 @@
 from __future__ import annotations
 
+import functools
 import sys
+from collections import Counter
 from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import click
 import pandas as pd
+import pyarrow as pa
 
 from .config import (
+    CHECKSUM_MODES,
+    DEFAULT_CHECKSUM_MODE,
+    DEFAULT_EXPORT_ENGINE,
+    DEFAULT_STREAM_BLOCK_MB,
     DEFAULT_TARGET_SIZE_MB,
+    DEFAULT_UPLOAD_CHUNK_MB,
+    EXPORT_ENGINES,
+    TABLE_EXPORT_CONFIGS,
+    TableExportConfig,
+    apply_encoding_overrides,
     default_output_root,
     list_supported_tables,
     require_table_config,
 )
+from .csv_cache import load_csv_table
 from .gcs_uploader import (
-    GCSDependencyError,
+    GCSCredentialsError,
+    PartitionUploadError,
+    PartitionUploadPipeline,
     build_partition_prefix,
+    open_backend,
     upload_partition,
+    upload_partitions,
 )
 from .generator_runner import run_generator_cli
-from .hooks import ExportContext, execute_hooks, load_hook
+from .hooks import ExportContext, HookCallable, execute_hooks, load_hook
 from .lineage import generate_batch_id, utc_now_iso
-from .manifest import build_manifest, write_manifest, write_success_marker
-from .parquet_writer import write_partitioned_parquet
-from .utils import iter_csv_tables
+from .manifest import (
+    PartitionManifest,
+    build_manifest,
+    read_manifest,
+    write_manifest,
+    write_success_marker,
+)
+from .parquet_writer import (
+    PartitionWriteResult,
+    write_dimension_partitions,
+    write_partitioned_parquet,
+)
+from .storage_backends import StorageDependencyError
+from .streaming import (
+    ParentDateIndex,
+    read_csv_table,
+    route_table,
+    stream_table_partitions,
+)
+from .upload_control import UploadController
+from .utils import (
+    OrderedTaskPool,
+    input_fingerprint,
+    parent_date_index,
+    partition_by_date,
+    partition_by_keys,
+)
 
 
 def _parse_date(value: str) -> date:
@@ -40,6 +82,512 @@ def _parse_optional_date(value: str | None) -> date | None:
     return _parse_date(value)
 
 
+def _resolve_dates(
+    *,
+    ingest_date: date | None,
+    start_date: date | None,
+    end_date: date | None,
+    days: int | None,
+    dates: str | None,
+) -> list[date]:
+    """
+    Resolves the `--dates`, `--start-date/--end-date/--days`, and `--ingest-date` options.
+
+    Returns sorted, unique dates; empty when none of the options were given.
+    """
+    resolved_dates: list[date] = []
+    if dates:
+        date_items = [item.strip() for item in dates.split(",")]
+        try:
+            resolved_dates = [_parse_date(item) for item in date_items if item]
+        except click.BadParameter as exc:
+            raise click.ClickException(str(exc)) from exc
+    elif start_date:
+        if days is not None and days < 1:
+            raise click.ClickException("--days must be >= 1 when provided.")
+        if end_date and end_date < start_date:
+            raise click.ClickException("--end-date must be on or after --start-date.")
+        actual_days = days or 1
+        final_end = end_date or (start_date + timedelta(days=actual_days - 1))
+        current = start_date
+        while current <= final_end:
+            resolved_dates.append(current)
+            current += timedelta(days=1)
+    elif ingest_date:
+        resolved_dates = [ingest_date]
+    return sorted(set(resolved_dates))
+
+
+def _finalize_partition(
+    *,
+    target: Path,
+    table_name: str,
+    ingest_dt: date,
+    batch_id: str,
+    result: PartitionWriteResult,
+    hook_functions: Sequence[HookCallable],
+    input_fingerprint: str | None = None,
+) -> PartitionManifest | None:
+    """
+    Writes the manifest and `_SUCCESS` marker for a written partition and runs hooks.
+
+    Returns None when the partition produced no files.
+    """
+    manifest_files, min_event_dt, max_event_dt, total_rows, checksums = result
+    if not manifest_files:
+        click.echo(
+            f"ℹ️  Table {table_name} produced no rows for {ingest_dt:%Y-%m-%d}; skipping manifest."
+        )
+        return None
+
+    partition_dir = target / table_name / f"ingest_dt={ingest_dt:%Y-%m-%d}"
+    manifest_path = partition_dir / "_MANIFEST.json"
+    manifest = build_manifest(
+        table=table_name,
+        batch_id=batch_id,
+        partition=f"ingest_dt={ingest_dt:%Y-%m-%d}",
+        files=manifest_files,
+        created_at=utc_now_iso(),
+        min_event_dt=min_event_dt,
+        max_event_dt=max_event_dt,
+        total_rows=total_rows,
+        checksums=checksums,
+        input_fingerprint=input_fingerprint,
+    )
+    write_manifest(manifest_path, manifest)
+    write_success_marker(partition_dir)
+    if hook_functions:
+        context = ExportContext(
+            table=table_name,
+            partition_dir=partition_dir,
+            manifest_path=manifest_path,
+            manifest=manifest,
+        )
+        execute_hooks(hook_functions, context)
+    click.echo(f"✅ Wrote {len(manifest_files)} file(s) for {table_name} [{ingest_dt:%Y-%m-%d}]")
+    return manifest
+
+
+def _partition_unchanged(target: Path, partition_dir: Path, fingerprint: str) -> bool:
+    """
+    True when the partition's manifest records `fingerprint` and all of its files exist.
+    """
+    manifest = read_manifest(partition_dir / "_MANIFEST.json")
+    if manifest is None or manifest.input_fingerprint != fingerprint:
+        return False
+    if not (partition_dir / "_SUCCESS").exists():
+        return False
+    return all((target / item.path).exists() for item in manifest.files)
+
+
+def _write_dimension_manifests(
+    *,
+    target: Path,
+    table_name: str,
+    batch_id: str,
+    results: dict[str, PartitionWriteResult],
+) -> None:
+    """
+    Writes the manifests and `_SUCCESS` markers of a dimension export in one batch.
+
+    Called once every partition is written; all manifests share one `created_at`.
+    """
+    created_at = utc_now_iso()
+    for partition_path, result in results.items():
+        manifest_files, min_event_dt, max_event_dt, total_rows, checksums = result
+        partition_dir = target / partition_path
+        manifest = build_manifest(
+            table=table_name,
+            batch_id=batch_id,
+            partition=partition_dir.name,
+            files=manifest_files,
+            created_at=created_at,
+            min_event_dt=min_event_dt,
+            max_event_dt=max_event_dt,
+            total_rows=total_rows,
+            checksums=checksums,
+        )
+        write_manifest(partition_dir / "_MANIFEST.json", manifest)
+        write_success_marker(partition_dir)
+
+
+@dataclass
+class _ExportSummary:
+    """
+    Collects finalized partitions for the end-of-run report.
+    """
+
+    target: Path
+    batch_id: str
+    hook_functions: Sequence[HookCallable]
+    processed_tables: list[str] = field(default_factory=list)
+    files: int = 0
+    rows: int = 0
+    skipped: int = 0
+    uploader: PartitionUploadPipeline | None = None
+    upload_prefix: str = ""
+
+    def finalize(
+        self,
+        table_name: str,
+        ingest_dt: date,
+        result: PartitionWriteResult,
+        input_fingerprint: str | None = None,
+    ) -> None:
+        manifest = _finalize_partition(
+            target=self.target,
+            table_name=table_name,
+            ingest_dt=ingest_dt,
+            batch_id=self.batch_id,
+            result=result,
+            hook_functions=self.hook_functions,
+            input_fingerprint=input_fingerprint,
+        )
+        if manifest is None:
+            return
+        self.processed_tables.append(f"{table_name}@{ingest_dt:%Y-%m-%d}")
+        self.files += len(manifest.files)
+        self.rows += manifest.total_rows or 0
+        self.publish(f"{table_name}/ingest_dt={ingest_dt:%Y-%m-%d}")
+
+    def skip_unchanged(self, table_name: str, ingest_dt: date) -> None:
+        click.echo(f"⏭️  Unchanged {table_name} [{ingest_dt:%Y-%m-%d}], skipping")
+        self.processed_tables.append(f"{table_name}@{ingest_dt:%Y-%m-%d}")
+        self.skipped += 1
+        self.publish(f"{table_name}/ingest_dt={ingest_dt:%Y-%m-%d}")
+
+    def publish(self, partition_path: str) -> None:
+        """
+        Queues a committed partition (`_SUCCESS` written) for upload under --upload-to.
+        """
+        if self.uploader is None:
+            return
+        prefix = "/".join([self.upload_prefix, partition_path]).strip("/")
+        self.uploader.submit(self.target / partition_path, prefix)
+
+
+def _submit_partition(
+    pool: OrderedTaskPool,
+    summary: _ExportSummary,
+    data: pd.DataFrame | pa.Table,
+    *,
+    table_config: TableExportConfig,
+    ingest_dt: date,
+    source_prefix: str | None,
+    target_size_mb: int,
+    checksum_mode: str,
+    sort: bool,
+    incremental: bool,
+) -> None:
+    """
+    Queues one `ingest_dt=` partition write, or skips it when its inputs are unchanged.
+    """
+    table_name = table_config.table_name
+    partition_prefix = None
+    if source_prefix:
+        partition_prefix = f"{source_prefix}/{table_name}/ingest_dt={ingest_dt:%Y-%m-%d}"
+
+    # Everything that shapes the output except batch_id and ingestion_ts
+    settings = repr((table_config, partition_prefix, target_size_mb, checksum_mode, sort))
+    fingerprint = input_fingerprint(data, settings)
+    partition_dir = summary.target / table_name / f"ingest_dt={ingest_dt:%Y-%m-%d}"
+    if incremental and _partition_unchanged(summary.target, partition_dir, fingerprint):
+        summary.skip_unchanged(table_name, ingest_dt)
+        return
+
+    pool.submit(
+        write_partitioned_parquet,
+        data,
+        table_config=table_config,
+        output_root=summary.target,
+        ingest_dt=ingest_dt,
+        batch_id=summary.batch_id,
+        source_prefix=partition_prefix,
+        target_size_mb=target_size_mb,
+        checksum_mode=checksum_mode,
+        sort=sort,
+        on_done=functools.partial(
+            summary.finalize, table_name, ingest_dt, input_fingerprint=fingerprint
+        ),
+    )
+
+
+def _report_export(processed_tables: Sequence[str], summary: _ExportSummary) -> None:
+    if not processed_tables:
+        click.echo("⚠️  No tables were exported. Check the source directory and filters.")
+        sys.exit(1)
+
+    partitions = len(summary.processed_tables) - summary.skipped
+    click.echo(
+        f"📦 Wrote {summary.files} file(s) and {summary.rows} row(s) across {partitions} partition(s)"
+    )
+    if summary.skipped:
+        click.echo(f"⏭️  Skipped {summary.skipped} unchanged partition(s)")
+    if summary.uploader is not None:
+        try:
+            results = summary.uploader.close()
+        except PartitionUploadError as exc:
+            raise click.ClickException(str(exc)) from exc
+        skipped_note = ""
+        files_skipped = sum(result.files_skipped for result in results)
+        if files_skipped:
+            skipped_note = f", skipped {files_skipped} unchanged"
+        click.echo(
+            f"☁️  Uploaded {sum(result.files_uploaded for result in results)} file(s){skipped_note}"
+            f" across {len(results)} partition(s) → {summary.uploader.backend.uri(summary.upload_prefix)}"
+        )
+        _report_upload_controller(summary.uploader.controller)
+    click.echo(f"🎉 Export complete for: {', '.join(processed_tables)}")
+
+
+def _report_upload_controller(controller: UploadController | None) -> None:
+    if controller is None or not controller.adaptive:
+        return
+    click.echo(
+        f"📈 Adaptive concurrency settled at {controller.limit} (peak {controller.peak} of "
+        f"{controller.max_concurrency}, {controller.throttle_events} throttle signal(s))"
+    )
+
+
+def _upload_target(
+    bucket: str, *, concurrency: int, chunk_size_mb: float
+) -> tuple[dict[str, object], str]:
+    """
+    Resolves upload-raw's --bucket into upload keyword arguments and a key prefix.
+
+    A plain bucket name uploads to GCS, with the client created by the upload
+    itself; a URL is opened with `open_backend`, which picks the backend from
+    its scheme (gs://, file://, or fsspec).
+    """
+    if "://" not in bucket:
+        return {"bucket_name": bucket}, ""
+    try:
+        backend, base_prefix = open_backend(
+            bucket, concurrency=concurrency, chunk_size_mb=chunk_size_mb
+        )
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--bucket") from exc
+    except (StorageDependencyError, GCSCredentialsError) as exc:
+        raise click.ClickException(str(exc)) from exc
+    return {"backend": backend}, base_prefix
+
+
+def _read_source_frame(
+    csv_path: Path,
+    csv_cache: bool,
+    block_size_mb: int,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Loads a source CSV as a DataFrame, typed by its declared columns when configured.
+
+    Configured tables are parsed by the multi-threaded Arrow reader (through
+    the IPC cache when enabled); other CSVs fall back to `pd.read_csv`.
+    `columns` restricts the load to those columns.
+    """
+    table_config = TABLE_EXPORT_CONFIGS.get(csv_path.stem)
+    if csv_cache:
+        table = load_csv_table(csv_path, block_size_mb=block_size_mb, table_config=table_config)
+        return (table.select(list(columns)) if columns else table).to_pandas()
+    if table_config is not None and table_config.columns:
+        table = read_csv_table(
+            csv_path,
+            block_size_mb=block_size_mb,
+            include_columns=columns,
+            table_config=table_config,
+        )
+        return table.to_pandas()
+    return pd.read_csv(csv_path, usecols=list(columns) if columns else None)
+
+
+@dataclass
+class _LoadPlan:
+    """
+    Export order for the source CSVs and the parent date indexes it needs.
+
+    Tables are loaded one at a time in `ordered`; a parent's date index is
+    kept only until the last selected child table that routes through it
+    has been exported.
+    """
+
+    csv_paths: dict[str, Path]
+    ordered: list[str]
+    index_users: Counter[tuple[str, str]]
+
+    @classmethod
+    def build(
+        cls,
+        source: Path,
+        table_order: Sequence[str],
+        tables: Sequence[str],
+        skip_tables: Sequence[str],
+    ) -> _LoadPlan:
+        csv_paths = {path.stem: path for path in sorted(source.glob("*.csv"))}
+        ordered = [name for name in table_order if name in csv_paths]
+        ordered += [name for name in csv_paths if name not in table_order]
+        index_users: Counter[tuple[str, str]] = Counter()
+        for name in ordered:
+            config = TABLE_EXPORT_CONFIGS.get(name)
+            if config is None or name in skip_tables or (tables and name not in tables):
+                continue
+            if config.parent is not None:
+                index_users[(config.parent.table, config.parent.join_key)] += 1
+        return cls(csv_paths=csv_paths, ordered=ordered, index_users=index_users)
+
+    def indexes_from(self, table_name: str) -> list[tuple[str, str]]:
+        """
+        Date indexes that selected child tables need from `table_name`.
+        """
+        return [key for key in self.index_users if key[0] == table_name]
+
+    def release(self, index_key: tuple[str, str]) -> bool:
+        """
+        Records one child's use of an index; True once no selected child needs it.
+        """
+        self.index_users[index_key] -= 1
+        return self.index_users[index_key] <= 0
+
+
+def _export_tables_arrow(
+    *,
+    source: Path,
+    target: Path,
+    table_order: Sequence[str],
+    tables: Sequence[str],
+    resolved_dates: Sequence[date],
+    batch_id: str,
+    source_prefix: str | None,
+    target_size_mb: int,
+    block_size_mb: int,
+    streaming: bool,
+    checksum_mode: str,
+    encoding_overrides: dict[str, object],
+    sort: bool,
+    incremental: bool,
+    csv_cache: bool,
+    skip_tables: Sequence[str],
+    pool: OrderedTaskPool,
+    summary: _ExportSummary,
+) -> None:
+    """
+    Exports each source CSV through the Arrow engine.
+
+    With `streaming`, CSVs are read in record batches without loading whole
+    tables and each table is one pool task. Otherwise each CSV is read into
+    one Arrow table, parent tables are kept for child-table routing, and each
+    partition is one pool task. Results are finalized in submission order.
+    """
+    plan = _LoadPlan.build(source, table_order, tables, skip_tables)
+    csv_paths = plan.csv_paths
+    date_keys = [d.isoformat() for d in resolved_dates]
+    parent_indexes: dict[tuple[str, str], ParentDateIndex] = {}
+
+    def finalize_table(table_name: str, results: dict[date, PartitionWriteResult]) -> None:
+        for current_date in resolved_dates:
+            if current_date not in results:
+                click.echo(f"ℹ️  No rows for {table_name} on {current_date:%Y-%m-%d}, skipping")
+                continue
+            summary.finalize(table_name, current_date, results[current_date])
+
+    for table_name in plan.ordered:
+        if table_name in skip_tables:
+            click.echo(f"ℹ️  Skipping {table_name} (already exported from static lookups)")
+            continue
+        if tables and table_name not in tables:
+            continue
+        try:
+            table_config = apply_encoding_overrides(
+                require_table_config(table_name), encoding_overrides
+            )
+        except KeyError:
+            click.echo(f"⚠️  Skipping unconfigured table: {table_name}")
+            continue
+
+        parent_index = None
+        join_key = None
+        index_key = None
+        link = table_config.parent
+        if link is not None:
+            join_key = link.join_key
+            index_key = (link.table, link.join_key)
+            parent_index = parent_indexes.get(index_key)
+            if parent_index is None and link.table in csv_paths:
+                # Parent not loaded in this run: index it from its key columns only
+                parent_index = ParentDateIndex.from_csv(
+                    csv_paths[link.table],
+                    join_key=join_key,
+                    date_column=require_table_config(link.table).event_date_column,
+                    dates=date_keys,
+                    block_size_mb=block_size_mb,
+                )
+                parent_indexes[index_key] = parent_index
+            elif parent_index is None:
+                click.echo(f"⚠️  Cannot filter {table_name}: parent table {link.table} not found")
+
+        if streaming:
+            click.echo(f"🌊 Streaming {table_name} from {csv_paths[table_name].name}")
+            pool.submit(
+                stream_table_partitions,
+                csv_paths[table_name],
+                table_config=table_config,
+                ingest_dates=resolved_dates,
+                output_root=target,
+                batch_id=batch_id,
+                source_prefix=source_prefix,
+                target_size_mb=target_size_mb,
+                block_size_mb=block_size_mb,
+                parent_index=parent_index,
+                join_key=join_key,
+                checksum_mode=checksum_mode,
+                sort=sort,
+                on_done=functools.partial(finalize_table, table_name),
+            )
+        else:
+            click.echo(f"🏹 Loading {table_name} from {csv_paths[table_name].name}")
+            read_table = load_csv_table if csv_cache else read_csv_table
+            table = read_table(
+                csv_paths[table_name], block_size_mb=block_size_mb, table_config=table_config
+            )
+            # Index this table for its child tables before it is released
+            for key in plan.indexes_from(table_name):
+                parent_indexes[key] = ParentDateIndex.from_table(
+                    table,
+                    join_key=key[1],
+                    date_column=table_config.event_date_column,
+                    dates=date_keys,
+                )
+            pieces = dict(
+                route_table(
+                    table,
+                    table_config=table_config,
+                    ingest_dates=resolved_dates,
+                    parent_index=parent_index,
+                    join_key=join_key,
+                )
+            )
+            del table
+            for current_date in resolved_dates:
+                if current_date not in pieces:
+                    click.echo(f"ℹ️  No rows for {table_name} on {current_date:%Y-%m-%d}, skipping")
+                    continue
+                _submit_partition(
+                    pool,
+                    summary,
+                    pieces.pop(current_date),
+                    table_config=table_config,
+                    ingest_dt=current_date,
+                    source_prefix=source_prefix,
+                    target_size_mb=target_size_mb,
+                    checksum_mode=checksum_mode,
+                    sort=sort,
+                    incremental=incremental,
+                )
+            del pieces
+
+        if index_key is not None and plan.release(index_key):
+            parent_indexes.pop(index_key, None)
+
+
 @click.group()
 def cli() -> None:
     """
@@ -193,7 +741,7 @@ def run_generator_cmd(
     type=int,
     default=DEFAULT_TARGET_SIZE_MB,
     show_default=True,
-    help="Target Parquet file size in megabytes.",
+    help="Target on-disk Parquet file size in megabytes (files roll on bytes written).",
 )
 @click.option(
     "--table",
@@ -220,6 +768,107 @@ def run_generator_cmd(
     default=None,
     help="Directory containing static lookup CSVs (customers.csv, product_catalog.csv) to export as dimension tables.",
 )
+@click.option(
+    "--streaming/--no-streaming",
+    default=False,
+    show_default=True,
+    help="Stream CSVs in record batches instead of loading whole tables (bounded memory).",
+)
+@click.option(
+    "--stream-block-mb",
+    type=int,
+    default=DEFAULT_STREAM_BLOCK_MB,
+    show_default=True,
+    help="CSV read block size in megabytes for the Arrow engine and --streaming.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(EXPORT_ENGINES),
+    default=DEFAULT_EXPORT_ENGINE,
+    show_default=True,
+    help="In-memory engine: pandas DataFrames or Arrow tables end to end (--streaming is always Arrow).",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to write partitions in parallel.",
+)
+@click.option(
+    "--checksum-mode",
+    type=click.Choice(CHECKSUM_MODES),
+    default=DEFAULT_CHECKSUM_MODE,
+    show_default=True,
+    help="Manifest checksum: hash of the Parquet bytes as written, or the legacy JSON record hash.",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["snappy", "zstd", "gzip", "brotli", "lz4", "none"]),
+    default=None,
+    help="Override the Parquet compression codec configured for each table.",
+)
+@click.option(
+    "--compression-level",
+    type=int,
+    default=None,
+    help="Override the codec compression level (zstd, gzip, brotli).",
+)
+@click.option(
+    "--row-group-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Override the maximum rows per Parquet row group.",
+)
+@click.option(
+    "--sort/--no-sort",
+    default=False,
+    show_default=True,
+    help="Sort partitions by each table's default_sort_columns and write Parquet page indexes.",
+)
+@click.option(
+    "--incremental/--no-incremental",
+    default=False,
+    show_default=True,
+    help="Skip partitions whose input fingerprint matches the existing _MANIFEST.json.",
+)
+@click.option(
+    "--csv-cache/--no-csv-cache",
+    default=False,
+    show_default=True,
+    help="Parse each source CSV once into an Arrow IPC file beside it and memory-map it on later runs.",
+)
+@click.option(
+    "--upload-to",
+    type=str,
+    default=None,
+    help="gs://bucket/prefix (or file:// path, fsspec URL) to upload each partition to once its _SUCCESS is written.",
+)
+@click.option(
+    "--upload-concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Partitions uploaded in parallel with --upload-to.",
+)
+@click.option(
+    "--upload-queue-depth",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Committed partitions queued or uploading before export waits (default: 2x --upload-concurrency).",
+)
+@click.option(
+    "--upload-adaptive/--no-upload-adaptive",
+    default=False,
+    show_default=True,
+    help="Adapt in-flight uploads between 1 and --upload-concurrency to latency and 429/503 throttling.",
+)
+@click.option(
+    "--upload-max-bandwidth",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cap --upload-to throughput in MiB/s.",
+)
 def export_raw_cmd(
     source: Path,
     target: Path,
@@ -234,46 +883,78 @@ def export_raw_cmd(
     source_prefix: str | None,
     post_export_hooks: Sequence[str],
     lookups_from: Path | None,
+    streaming: bool,
+    stream_block_mb: int,
+    engine: str,
+    workers: int,
+    checksum_mode: str,
+    compression: str | None,
+    compression_level: int | None,
+    row_group_size: int | None,
+    sort: bool,
+    incremental: bool,
+    csv_cache: bool,
+    upload_to: str | None,
+    upload_concurrency: int,
+    upload_queue_depth: int | None,
+    upload_adaptive: bool,
+    upload_max_bandwidth: float | None,
 ) -> None:
     """
     Converts generator CSVs into partitioned Parquet for the raw zone.
     """
-    # Resolve ingestion dates
-    resolved_dates: list[date] = []
-    if dates:
-        date_items = [item.strip() for item in dates.split(",")]
-        try:
-            resolved_dates = [_parse_date(item) for item in date_items if item]
-        except click.BadParameter as exc:
-            raise click.ClickException(str(exc)) from exc
-    elif start_date:
-        if days is not None and days < 1:
-            raise click.ClickException("--days must be >= 1 when provided.")
-        if end_date and end_date < start_date:
-            raise click.ClickException("--end-date must be on or after --start-date.")
-        actual_days = days or 1
-        final_end = end_date or (start_date + timedelta(days=actual_days - 1))
-        current = start_date
-        while current <= final_end:
-            resolved_dates.append(current)
-            current += timedelta(days=1)
-    elif ingest_date:
-        resolved_dates = [ingest_date]
-    else:
-        resolved_dates = [date.today()]
+    resolved_dates = _resolve_dates(
+        ingest_date=ingest_date, start_date=start_date, end_date=end_date, days=days, dates=dates
+    ) or [date.today()]
 
-    resolved_dates = sorted(set(resolved_dates))
+    if incremental and streaming:
+        raise click.UsageError(
+            "--incremental needs whole partitions in memory; use it without --streaming."
+        )
 
     hook_functions = [load_hook(path) for path in post_export_hooks]
 
+    encoding_overrides: dict[str, object] = {
+        key: value
+        for key, value in (
+            ("compression", compression),
+            ("compression_level", compression_level),
+            ("row_group_size", row_group_size),
+        )
+        if value is not None
+    }
+
     batch = batch_id or generate_batch_id()
     click.echo(
         f"🚚 Exporting raw partitions for {', '.join(d.isoformat() for d in resolved_dates)} (batch={batch})"
     )
     processed_tables: list[str] = []
-
-    # Cache parent tables for JOIN filtering of child tables
-    parent_tables_cache: dict[str, pd.DataFrame] = {}
+    summary = _ExportSummary(target=target, batch_id=batch, hook_functions=hook_functions)
+    if upload_to is not None:
+        try:
+            backend, summary.upload_prefix = open_backend(upload_to, concurrency=upload_concurrency)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="--upload-to") from exc
+        except (StorageDependencyError, GCSCredentialsError) as exc:
+            raise click.ClickException(str(exc)) from exc
+        controller = None
+        if upload_adaptive or upload_max_bandwidth:
+            controller = UploadController(
+                max_concurrency=upload_concurrency,
+                adaptive=upload_adaptive,
+                max_bandwidth_mbps=upload_max_bandwidth,
+            )
+        pipeline = PartitionUploadPipeline(
+            backend=backend,
+            concurrency=upload_concurrency,
+            max_pending=upload_queue_depth,
+            controller=controller,
+        )
+        # Drains queued uploads even if the export fails part way
+        summary.uploader = click.get_current_context().with_resource(pipeline)
+
+    # Parent join key -> partition date, built once per run and shared by child tables
+    parent_indexes: dict[tuple[str, str], pd.Series] = {}
 
     # Export dimension tables from static lookups (customers partitioned by signup_date, products by category)
     if lookups_from:
@@ -284,58 +965,29 @@ def export_raw_cmd(
         if customers_path.exists():
             if not tables or "customers" in tables:
                 click.echo("  └─ customers (partitioned by signup_date)")
-                customers_df = pd.read_csv(customers_path)
-
-                # Group by signup_date and export each partition
-                customers_df["signup_date_only"] = pd.to_datetime(
-                    customers_df["signup_date"]
-                ).dt.date
-                for signup_dt, group_df in customers_df.groupby("signup_date_only"):
-                    partition_df = group_df.drop(columns=["signup_date_only"])
-
-                    # Create partition path: customers/signup_date=YYYY-MM-DD/
-                    partition_dir = target / "customers" / f"signup_date={signup_dt}"
-                    partition_dir.mkdir(parents=True, exist_ok=True)
-
-                    partition_prefix = None
-                    if source_prefix:
-                        partition_prefix = f"{source_prefix}/customers/signup_date={signup_dt}"
-
-                    table_config = require_table_config("customers")
-                    (
-                        manifest_files,
-                        min_event_dt,
-                        max_event_dt,
-                        total_rows,
-                        checksums,
-                    ) = write_partitioned_parquet(
-                        partition_df,
-                        table_config=table_config,
-                        output_root=target,
-                        ingest_dt=None,  # No ingest_dt for dimension tables
-                        batch_id=batch,
-                        source_prefix=partition_prefix,
-                        target_size_mb=target_size_mb,
-                        partition_path_override=f"customers/signup_date={signup_dt}",
-                    )
-
-                    manifest_path = partition_dir / "_MANIFEST.json"
-                    manifest = build_manifest(
-                        table="customers",
-                        batch_id=batch,
-                        partition=f"signup_date={signup_dt}",
-                        files=manifest_files,
-                        created_at=utc_now_iso(),
-                        min_event_dt=min_event_dt,
-                        max_event_dt=max_event_dt,
-                        total_rows=total_rows,
-                        checksums=checksums,
-                    )
-                    write_manifest(manifest_path, manifest)
-                    write_success_marker(partition_dir)
-
+                customers_df = _read_source_frame(customers_path, csv_cache, stream_block_mb)
+
+                results = write_dimension_partitions(
+                    customers_df,
+                    pd.to_datetime(customers_df["signup_date"]).dt.date,
+                    table_config=apply_encoding_overrides(
+                        require_table_config("customers"), encoding_overrides
+                    ),
+                    output_root=target,
+                    partition_column="signup_date",
+                    batch_id=batch,
+                    source_prefix=source_prefix,
+                    target_size_mb=target_size_mb,
+                    checksum_mode=checksum_mode,
+                    sort=sort,
+                )
+                _write_dimension_manifests(
+                    target=target, table_name="customers", batch_id=batch, results=results
+                )
+                for partition_path in results:
+                    summary.publish(partition_path)
                 click.echo(
-                    f"    ✅ Exported {len(customers_df.groupby('signup_date_only'))} signup_date partitions ({len(customers_df)} total customers)"
+                    f"    ✅ Exported {len(results)} signup_date partitions ({len(customers_df)} total customers)"
                 )
                 processed_tables.append("customers")
 
@@ -344,53 +996,29 @@ def export_raw_cmd(
         if products_path.exists():
             if not tables or "product_catalog" in tables:
                 click.echo("  └─ product_catalog (partitioned by category)")
-                products_df = pd.read_csv(products_path)
-
-                # Group by category and export each partition
-                for category, group_df in products_df.groupby("category"):
-                    # Create partition path: product_catalog/category=Electronics/
-                    partition_dir = target / "product_catalog" / f"category={category}"
-                    partition_dir.mkdir(parents=True, exist_ok=True)
-
-                    partition_prefix = None
-                    if source_prefix:
-                        partition_prefix = f"{source_prefix}/product_catalog/category={category}"
-
-                    table_config = require_table_config("product_catalog")
-                    (
-                        manifest_files,
-                        min_event_dt,
-                        max_event_dt,
-                        total_rows,
-                        checksums,
-                    ) = write_partitioned_parquet(
-                        group_df,
-                        table_config=table_config,
-                        output_root=target,
-                        ingest_dt=None,  # No ingest_dt for dimension tables
-                        batch_id=batch,
-                        source_prefix=partition_prefix,
-                        target_size_mb=target_size_mb,
-                        partition_path_override=f"product_catalog/category={category}",
-                    )
-
-                    manifest_path = partition_dir / "_MANIFEST.json"
-                    manifest = build_manifest(
-                        table="product_catalog",
-                        batch_id=batch,
-                        partition=f"category={category}",
-                        files=manifest_files,
-                        created_at=utc_now_iso(),
-                        min_event_dt=min_event_dt,
-                        max_event_dt=max_event_dt,
-                        total_rows=total_rows,
-                        checksums=checksums,
-                    )
-                    write_manifest(manifest_path, manifest)
-                    write_success_marker(partition_dir)
-
+                products_df = _read_source_frame(products_path, csv_cache, stream_block_mb)
+
+                results = write_dimension_partitions(
+                    products_df,
+                    products_df["category"],
+                    table_config=apply_encoding_overrides(
+                        require_table_config("product_catalog"), encoding_overrides
+                    ),
+                    output_root=target,
+                    partition_column="category",
+                    batch_id=batch,
+                    source_prefix=source_prefix,
+                    target_size_mb=target_size_mb,
+                    checksum_mode=checksum_mode,
+                    sort=sort,
+                )
+                _write_dimension_manifests(
+                    target=target, table_name="product_catalog", batch_id=batch, results=results
+                )
+                for partition_path in results:
+                    summary.publish(partition_path)
                 click.echo(
-                    f"    ✅ Exported {len(products_df.groupby('category'))} category partitions ({len(products_df)} total products)"
+                    f"    ✅ Exported {len(results)} category partitions ({len(products_df)} total products)"
                 )
                 processed_tables.append("product_catalog")
 
@@ -406,92 +1034,98 @@ def export_raw_cmd(
         "return_items",  # Child of returns
     ]
 
-    # Load all tables into memory first
-    all_tables = {name: df for name, df in iter_csv_tables(str(source))}
-
-    # Process in dependency order
-    tables_to_process = []
-    for table_name in table_processing_order:
-        if table_name in all_tables:
-            tables_to_process.append((table_name, all_tables[table_name]))
-
-    # Add any tables not in the explicit order (for future-proofing)
-    for table_name, df in all_tables.items():
-        if table_name not in table_processing_order:
-            tables_to_process.append((table_name, df))
+    if streaming or engine == "arrow":
+        with OrderedTaskPool(workers) as pool:
+            _export_tables_arrow(
+                source=source,
+                target=target,
+                table_order=table_processing_order,
+                tables=tuple(tables),
+                resolved_dates=resolved_dates,
+                batch_id=batch,
+                source_prefix=source_prefix,
+                target_size_mb=target_size_mb,
+                block_size_mb=stream_block_mb,
+                streaming=streaming,
+                checksum_mode=checksum_mode,
+                encoding_overrides=encoding_overrides,
+                sort=sort,
+                incremental=incremental,
+                csv_cache=csv_cache,
+                skip_tables=("customers", "product_catalog") if lookups_from else (),
+                pool=pool,
+                summary=summary,
+            )
+        processed_tables.extend(summary.processed_tables)
+        _report_export(processed_tables, summary)
+        return
+
+    # Load only the selected tables, one at a time; parents are kept as date indexes
+    plan = _LoadPlan.build(
+        source,
+        table_processing_order,
+        tables,
+        ("customers", "product_catalog") if lookups_from else (),
+    )
 
-    for table_name, df in tables_to_process:
-        # Skip dimension tables if they were exported from static lookups
-        if lookups_from and table_name in ("customers", "product_catalog"):
-            click.echo(f"ℹ️  Skipping {table_name} (already exported from static lookups)")
-            # Still cache for potential use by child tables
-            parent_tables_cache[table_name] = df
-            continue
+    with OrderedTaskPool(workers) as pool:
+        for table_name in plan.ordered:
+            # Skip dimension tables if they were exported from static lookups
+            if lookups_from and table_name in ("customers", "product_catalog"):
+                click.echo(f"ℹ️  Skipping {table_name} (already exported from static lookups)")
+                continue
 
-        if tables and table_name not in tables:
-            continue
-        try:
-            table_config = require_table_config(table_name)
-        except KeyError:
-            click.echo(f"⚠️  Skipping unconfigured table: {table_name}")
-            continue
+            if tables and table_name not in tables:
+                continue
+            try:
+                table_config = apply_encoding_overrides(
+                    require_table_config(table_name), encoding_overrides
+                )
+            except KeyError:
+                click.echo(f"⚠️  Skipping unconfigured table: {table_name}")
+                continue
 
-        # Cache this table for potential use by child tables
-        parent_tables_cache[table_name] = df
+            df = _read_source_frame(plan.csv_paths[table_name], csv_cache, stream_block_mb)
+            # Index this table for its child tables before it is released
+            for key in plan.indexes_from(table_name):
+                parent_indexes[key] = parent_date_index(df, key[1], table_config.event_date_column)
 
-        for current_date in resolved_dates:
-            # Filter dataframe by date for this partition
             date_column = table_config.event_date_column
-
+            link = table_config.parent
+            wanted = [d.isoformat() for d in resolved_dates]
+            # Split once per table instead of rescanning it for every resolved date
+            date_groups: dict[str, pd.DataFrame] | None = None
+            routed_by = ""
             if date_column and date_column in df.columns:
                 # Type A: Table has its own date column
-                current_date_str = current_date.isoformat()
-
-                # Extract date portion from datetime strings (e.g., "2020-01-05T23:20:04" -> "2020-01-05")
-                df_dates = df[date_column].astype(str).str[:10]
-                filtered_df = df[df_dates == current_date_str].copy()
-
-                if filtered_df.empty:
-                    click.echo(
-                        f"ℹ️  No rows for {table_name} on {current_date:%Y-%m-%d} (filtered by {date_column}), skipping"
+                date_groups = partition_by_date(df, date_column, wanted)
+                routed_by = f"filtered by {date_column}"
+            elif link is not None:
+                # Type B: Child tables without date - route through the parent's date index
+                index_key = (link.table, link.join_key)
+                if index_key not in parent_indexes and link.table in plan.csv_paths:
+                    # Parent not exported in this run: index it from its key columns only
+                    parent_date_column = require_table_config(link.table).event_date_column
+                    parent_indexes[index_key] = parent_date_index(
+                        _read_source_frame(
+                            plan.csv_paths[link.table],
+                            csv_cache,
+                            stream_block_mb,
+                            columns=[link.join_key, parent_date_column],
+                        ),
+                        link.join_key,
+                        parent_date_column,
                     )
-                    continue
-            elif table_name in ("order_items", "return_items"):
-                # Type B: Child tables without date - JOIN with parent
-                if table_name == "order_items":
-                    parent_table = "orders"
-                    join_key = "order_id"
-                    parent_date_column = "order_date"
-                elif table_name == "return_items":
-                    parent_table = "returns"
-                    join_key = "return_id"
-                    parent_date_column = "return_date"
-
-                # Check if parent table is available
-                if parent_table not in parent_tables_cache:
+                if index_key not in parent_indexes:
                     click.echo(
-                        f"⚠️  Cannot filter {table_name}: parent table {parent_table} not found"
+                        f"⚠️  Cannot filter {table_name}: parent table {link.table} not found"
                     )
-                    filtered_df = df.copy()  # Fallback: replicate to all partitions
                 else:
-                    # JOIN with parent to get date
-                    parent_df = parent_tables_cache[parent_table]
-                    current_date_str = current_date.isoformat()
-
-                    # Get IDs for this date from parent
-                    # Extract date portion from datetime strings
-                    parent_dates = parent_df[parent_date_column].astype(str).str[:10]
-                    parent_for_date = parent_df[parent_dates == current_date_str]
-                    valid_ids = set(parent_for_date[join_key])
-
-                    # Filter child table to only matching IDs
-                    filtered_df = df[df[join_key].isin(valid_ids)].copy()
-
-                    if filtered_df.empty:
-                        click.echo(
-                            f"ℹ️  No rows for {table_name} on {current_date:%Y-%m-%d} (filtered via {parent_table}), skipping"
-                        )
-                        continue
+                    child_dates = df[link.join_key].map(parent_indexes[index_key])
+                    date_groups = partition_by_keys(df, child_dates, wanted)
+                    routed_by = f"filtered via {link.table}"
+                if plan.release(index_key):
+                    parent_indexes.pop(index_key, None)
             else:
                 # Type C: Lookup tables - should not reach here if --lookups-from is used
                 # These tables are now partitioned by their natural keys (signup_date, category)
@@ -499,67 +1133,35 @@ def export_raw_cmd(
                     f"⚠️  Table {table_name} has no date column and is not a child table. "
                     f"Consider using --lookups-from to export as a dimension table."
                 )
-                filtered_df = df.copy()  # Fallback: replicate to all partitions
-
-            partition_prefix = None
-            if source_prefix:
-                partition_prefix = f"{source_prefix}/{table_name}/ingest_dt={current_date:%Y-%m-%d}"
-
-            (
-                manifest_files,
-                min_event_dt,
-                max_event_dt,
-                total_rows,
-                checksums,
-            ) = write_partitioned_parquet(
-                filtered_df,
-                table_config=table_config,
-                output_root=target,
-                ingest_dt=current_date,
-                batch_id=batch,
-                source_prefix=partition_prefix,
-                target_size_mb=target_size_mb,
-            )
 
-            if not manifest_files:
-                click.echo(
-                    f"ℹ️  Table {table_name} produced no rows for {current_date:%Y-%m-%d}; skipping manifest."
-                )
-                continue
+            for current_date in resolved_dates:
+                if date_groups is None:
+                    filtered_df = df  # Fallback: replicate to all partitions
+                else:
+                    filtered_df = date_groups.get(current_date.isoformat())
+                    if filtered_df is None:
+                        click.echo(
+                            f"ℹ️  No rows for {table_name} on {current_date:%Y-%m-%d} ({routed_by}), skipping"
+                        )
+                        continue
 
-            partition_dir = target / table_name / f"ingest_dt={current_date:%Y-%m-%d}"
-            manifest_path = partition_dir / "_MANIFEST.json"
-            manifest = build_manifest(
-                table=table_name,
-                batch_id=batch,
-                partition=f"ingest_dt={current_date:%Y-%m-%d}",
-                files=manifest_files,
-                created_at=utc_now_iso(),
-                min_event_dt=min_event_dt,
-                max_event_dt=max_event_dt,
-                total_rows=total_rows,
-                checksums=checksums,
-            )
-            write_manifest(manifest_path, manifest)
-            write_success_marker(partition_dir)
-            if hook_functions:
-                context = ExportContext(
-                    table=table_name,
-                    partition_dir=partition_dir,
-                    manifest_path=manifest_path,
-                    manifest=manifest,
+                _submit_partition(
+                    pool,
+                    summary,
+                    filtered_df,
+                    table_config=table_config,
+                    ingest_dt=current_date,
+                    source_prefix=source_prefix,
+                    target_size_mb=target_size_mb,
+                    checksum_mode=checksum_mode,
+                    sort=sort,
+                    incremental=incremental,
                 )
-                execute_hooks(hook_functions, context)
-            processed_tables.append(f"{table_name}@{current_date:%Y-%m-%d}")
-            click.echo(
-                f"✅ Wrote {len(manifest_files)} file(s) for {table_name} [{current_date:%Y-%m-%d}]"
-            )
+            # Release this table before the next one is loaded
+            df = date_groups = filtered_df = None
 
-    if not processed_tables:
-        click.echo("⚠️  No tables were exported. Check the source directory and filters.")
-        sys.exit(1)
-
-    click.echo(f"🎉 Export complete for: {', '.join(processed_tables)}")
+    processed_tables.extend(summary.processed_tables)
+    _report_export(processed_tables, summary)
 
 
 @cli.command("upload-raw")
@@ -574,7 +1176,7 @@ def export_raw_cmd(
     "--bucket",
     type=str,
     required=True,
-    help="Destination GCS bucket (without gs:// prefix).",
+    help="Destination GCS bucket (without gs:// prefix), or a gs://, file:// or fsspec URL.",
 )
 @click.option(
     "--prefix",
@@ -585,10 +1187,37 @@ def export_raw_cmd(
 )
 @click.option(
     "--ingest-date",
-    "ingest_date_str",
-    required=True,
+    callback=lambda _, __, value: _parse_optional_date(value),
     help="Hive partition date to upload (YYYY-MM-DD).",
 )
+@click.option(
+    "--start-date",
+    callback=lambda _, __, value: _parse_optional_date(value),
+    help="Start date for a range of ingest dates (inclusive).",
+)
+@click.option(
+    "--end-date",
+    callback=lambda _, __, value: _parse_optional_date(value),
+    help="End date for a range of ingest dates (inclusive).",
+)
+@click.option(
+    "--days",
+    type=int,
+    default=None,
+    help="Number of consecutive days to upload starting from --start-date (defaults to 1).",
+)
+@click.option(
+    "--dates",
+    type=str,
+    default=None,
+    help="Comma-separated list of ingest dates (YYYY-MM-DD).",
+)
+@click.option(
+    "--dimensions/--no-dimensions",
+    default=False,
+    show_default=True,
+    help="Also upload dimension partitions (e.g. customers/signup_date=*, product_catalog/category=*).",
+)
 @click.option(
     "--table",
     "tables",
@@ -601,24 +1230,72 @@ def export_raw_cmd(
     show_default=True,
     help="Only print what would be uploaded.",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of files uploaded in parallel across all selected partitions.",
+)
+@click.option(
+    "--chunk-size-mb",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_UPLOAD_CHUNK_MB,
+    show_default=True,
+    help="Upload files larger than this as resumable sessions in chunks of this size (0 disables).",
+)
+@click.option(
+    "--skip-unchanged/--no-skip-unchanged",
+    default=True,
+    show_default=True,
+    help="Skip files whose remote blob already has the same size and CRC32C/MD5.",
+)
+@click.option(
+    "--adaptive/--no-adaptive",
+    default=False,
+    show_default=True,
+    help="Adapt in-flight uploads between 1 and --concurrency to latency and 429/503 throttling.",
+)
+@click.option(
+    "--max-bandwidth",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cap upload throughput in MiB/s.",
+)
 def upload_raw_cmd(
     source: Path,
     bucket: str,
     prefix: str,
-    ingest_date_str: str,
+    ingest_date: date | None,
+    start_date: date | None,
+    end_date: date | None,
+    days: int | None,
+    dates: str | None,
+    dimensions: bool,
     tables: Iterable[str],
     dry_run: bool,
+    concurrency: int,
+    chunk_size_mb: float,
+    skip_unchanged: bool,
+    adaptive: bool,
+    max_bandwidth: float | None,
 ) -> None:
     """
-    Uploads previously exported raw partitions to Google Cloud Storage.
+    Uploads previously exported raw partitions to Google Cloud Storage (or another storage URL).
+
+    All partitions matching the selected dates (plus dimension partitions with
+    `--dimensions`) are discovered in one scan and uploaded over one client.
     """
-    try:
-        ingest_date = _parse_date(ingest_date_str)
-    except click.BadParameter as exc:
-        raise click.BadParameter(str(exc)) from exc
+    resolved_dates = _resolve_dates(
+        ingest_date=ingest_date, start_date=start_date, end_date=end_date, days=days, dates=dates
+    )
+    if not resolved_dates and not dimensions:
+        raise click.UsageError(
+            "Select partitions with --ingest-date, --dates, --start-date, or --dimensions."
+        )
 
     tables = tuple(tables)
-    partition_name = f"ingest_dt={ingest_date:%Y-%m-%d}"
+    wanted = {f"ingest_dt={current_date:%Y-%m-%d}" for current_date in resolved_dates}
     source = source.resolve()
     if not source.exists():
         raise click.ClickException(f"Source directory does not exist: {source}")
@@ -632,36 +1309,104 @@ def upload_raw_cmd(
         click.echo("⚠️  No tables available in the source directory.")
         sys.exit(1)
 
+    # A plain bucket name keeps the GCS default; URLs choose their backend
+    destination = bucket.rstrip("/") if "://" in bucket else f"gs://{bucket}"
+
     uploaded = []
     skipped = []
+    selected: list[tuple[str, Path, str]] = []
     for table in candidate_tables:
-        partition_dir = source / table / partition_name
-        if not partition_dir.exists():
+        table_dir = source / table
+        present = (
+            {child.name for child in table_dir.iterdir() if child.is_dir()}
+            if table_dir.is_dir()
+            else set()
+        )
+        matched = sorted(present & wanted)
+        if dimensions:
+            # Dimension tables are partitioned by their own key instead of ingest_dt
+            matched += sorted(
+                name for name in present if "=" in name and not name.startswith("ingest_dt=")
+            )
+        missing = wanted - present
+        if not matched:
             skipped.append((table, "missing partition"))
             continue
+        if missing and any(name.startswith("ingest_dt=") for name in present):
+            skipped.append(
+                (table, f"missing {len(missing)} of {len(wanted)} ingest_dt partition(s)")
+            )
 
-        table_prefix = "/".join(
-            [
-                prefix.strip("/"),
-                build_partition_prefix(table, partition_name),
-            ]
-        ).strip("/")
-
-        if dry_run:
-            click.echo(f"📝 [dry-run] Would upload {partition_dir} → gs://{bucket}/{table_prefix}")
-            uploaded.append((table, 0))
-            continue
+        for partition_name in matched:
+            partition_dir = table_dir / partition_name
+            table_prefix = "/".join(
+                [
+                    prefix.strip("/"),
+                    build_partition_prefix(table, partition_name),
+                ]
+            ).strip("/")
 
-        try:
-            result = upload_partition(
-                bucket_name=bucket,
-                prefix=table_prefix,
-                local_partition_dir=partition_dir,
+            if dry_run:
+                click.echo(
+                    f"📝 [dry-run] Would upload {partition_dir} → {destination}/{table_prefix}"
+                )
+                uploaded.append((table, 0))
+                continue
+            selected.append((table, partition_dir, table_prefix))
+
+    # Nothing to send on --dry-run or when no partition matched; never touch the store
+    if selected:
+        target, base_prefix = _upload_target(
+            bucket, concurrency=concurrency, chunk_size_mb=chunk_size_mb
+        )
+        keys = ["/".join([base_prefix, table_prefix]).strip("/") for _, _, table_prefix in selected]
+        controller = None
+        if adaptive or max_bandwidth:
+            controller = UploadController(
+                max_concurrency=concurrency, adaptive=adaptive, max_bandwidth_mbps=max_bandwidth
             )
-        except GCSDependencyError as exc:
+        try:
+            if concurrency > 1:
+                # One pool for the part files of every partition; markers follow each partition
+                results = upload_partitions(
+                    [
+                        (partition_dir, key)
+                        for (_, partition_dir, _), key in zip(selected, keys, strict=True)
+                    ],
+                    concurrency=concurrency,
+                    chunk_size_mb=chunk_size_mb,
+                    skip_unchanged=skip_unchanged,
+                    controller=controller,
+                    **target,
+                )
+            else:
+                results = [
+                    upload_partition(
+                        prefix=key,
+                        local_partition_dir=partition_dir,
+                        chunk_size_mb=chunk_size_mb,
+                        skip_unchanged=skip_unchanged,
+                        controller=controller,
+                        **target,
+                    )
+                    for (_, partition_dir, _), key in zip(selected, keys, strict=True)
+                ]
+        except (StorageDependencyError, GCSCredentialsError) as exc:
+            raise click.ClickException(str(exc)) from exc
+        except PartitionUploadError as exc:
             raise click.ClickException(str(exc)) from exc
-        uploaded.append((table, result.files_uploaded))
-        click.echo(f"☁️  Uploaded {result.files_uploaded} file(s) → gs://{bucket}/{table_prefix}")
+        for (table, _, table_prefix), result in zip(selected, results, strict=False):
+            uploaded.append((table, result.files_uploaded))
+            skipped_note = ""
+            if result.files_skipped:
+                skipped_note = (
+                    f", skipped {result.files_skipped} unchanged"
+                    f" ({result.bytes_skipped} bytes saved)"
+                )
+            click.echo(
+                f"☁️  Uploaded {result.files_uploaded} file(s){skipped_note} → {destination}/{table_prefix}"
+            )
+        _report_upload_controller(controller)
 
     if skipped:
         for table, reason in skipped:
@@ -670,5 +1415,5 @@ def upload_raw_cmd(
     if not uploaded:
         click.echo("⚠️  No tables were uploaded.")
     else:
-        uploaded_tables = ", ".join(table for table, _ in uploaded)
+        uploaded_tables = ", ".join(dict.fromkeys(table for table, _ in uploaded))
         click.echo(f"✅ Upload complete for tables: {uploaded_tables}")
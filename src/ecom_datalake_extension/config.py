@@ -5,7 +5,7 @@ Configuration models and defaults for the data lake extension toolkit.
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date
 from pathlib import Path
 
@@ -36,6 +36,91 @@ class BucketLayout:
         return f"{self.silver_prefix}/{table}/{partition}"
 
 
+@dataclass(frozen=True)
+class ParquetEncodingProfile:
+    """
+    Parquet writer settings applied to every part file of a table.
+
+    `use_dictionary` and `write_statistics` accept either a flag or the list of
+    columns to enable it for. `row_group_size` caps rows per row group on top
+    of size-based rolling.
+    """
+
+    compression: str = "snappy"
+    compression_level: int | None = None
+    row_group_size: int | None = None
+    use_dictionary: bool | Sequence[str] = True
+    write_statistics: bool | Sequence[str] = True
+    data_page_size: int | None = None
+    data_page_version: str = "1.0"
+    write_page_index: bool = False
+
+    def writer_options(self) -> dict[str, object]:
+        """
+        Keyword arguments for `pyarrow.parquet.ParquetWriter`.
+        """
+        options: dict[str, object] = {
+            "compression": self.compression,
+            "use_dictionary": _flag_or_list(self.use_dictionary),
+            "write_statistics": _flag_or_list(self.write_statistics),
+            "data_page_version": self.data_page_version,
+            "write_page_index": self.write_page_index,
+        }
+        if self.compression_level is not None:
+            options["compression_level"] = self.compression_level
+        if self.data_page_size is not None:
+            options["data_page_size"] = self.data_page_size
+        return options
+
+
+def _flag_or_list(value: bool | Sequence[str]) -> bool | list[str]:
+    return value if isinstance(value, bool) else list(value)
+
+
+COLUMN_TYPES = ("string", "int64", "float64", "bool", "timestamp", "category")
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """
+    Declared type of one source column.
+
+    `type` is one of `COLUMN_TYPES`; "category" columns are dictionary
+    encoded. `timestamp_format` is the strptime format used to parse
+    "timestamp" columns; on "string" columns it documents the expected text
+    format of values that are kept verbatim.
+    """
+
+    name: str
+    type: str = "string"
+    timestamp_format: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.type not in COLUMN_TYPES:
+            raise ValueError(f"Unknown column type '{self.type}' for column '{self.name}'")
+
+
+def _columns(*specs: tuple[str, ...]) -> tuple[ColumnSpec, ...]:
+    return tuple(ColumnSpec(*spec) for spec in specs)
+
+
+# Raw event timestamps are kept as source text so messy formats survive into the raw zone.
+_ISO_DATETIME = "%Y-%m-%dT%H:%M:%S"
+
+
+@dataclass(frozen=True)
+class ParentTableLink:
+    """
+    Routes a table without its own event date through its parent table.
+
+    Child rows land in the partition date of the parent row that shares
+    `join_key`; the date comes from the parent's `event_date_column`.
+    """
+
+    table: str
+    join_key: str
+
+
 @dataclass(frozen=True)
 class TableExportConfig:
     """
@@ -47,6 +132,9 @@ class TableExportConfig:
     primary_keys: Sequence[str]
     event_date_column: str | None
     default_sort_columns: Sequence[str] = field(default_factory=tuple)
+    encoding: ParquetEncodingProfile = field(default_factory=ParquetEncodingProfile)
+    parent: ParentTableLink | None = None
+    columns: Sequence[ColumnSpec] = field(default_factory=tuple)
 
 
 TABLE_EXPORT_CONFIGS: Mapping[str, TableExportConfig] = {
@@ -55,54 +143,178 @@ TABLE_EXPORT_CONFIGS: Mapping[str, TableExportConfig] = {
         primary_keys=("customer_id",),
         event_date_column="signup_date",
         default_sort_columns=("customer_id",),
+        columns=_columns(
+            ("customer_id",),
+            ("first_name",),
+            ("last_name",),
+            ("email",),
+            ("phone_number",),
+            ("signup_date", "string", "%Y-%m-%d"),
+            ("gender", "category"),
+            ("age", "int64"),
+            ("is_guest", "bool"),
+            ("customer_status", "category"),
+            ("signup_channel", "category"),
+            ("loyalty_tier", "category"),
+            ("initial_loyalty_tier", "category"),
+            ("email_verified", "bool"),
+            ("marketing_opt_in", "bool"),
+            ("mailing_address",),
+            ("billing_address",),
+            ("loyalty_enrollment_date", "string", "%Y-%m-%d"),
+            ("clv_bucket", "category"),
+        ),
     ),
     "product_catalog": TableExportConfig(
         table_name="product_catalog",
         primary_keys=("product_id",),
         event_date_column=None,
         default_sort_columns=("product_id",),
+        columns=_columns(
+            ("product_id", "int64"),
+            ("product_name",),
+            ("category", "category"),
+            ("unit_price", "float64"),
+            ("cost_price", "float64"),
+            ("inventory_quantity", "int64"),
+        ),
     ),
     "shopping_carts": TableExportConfig(
         table_name="shopping_carts",
         primary_keys=("cart_id",),
         event_date_column="created_at",
         default_sort_columns=("created_at", "cart_id"),
+        columns=_columns(
+            ("cart_id",),
+            ("customer_id",),
+            ("created_at", "string", _ISO_DATETIME),
+            ("updated_at", "string", _ISO_DATETIME),
+            ("cart_total", "float64"),
+            ("status", "category"),
+        ),
     ),
     "cart_items": TableExportConfig(
         table_name="cart_items",
         primary_keys=("cart_item_id",),
         event_date_column="added_at",
         default_sort_columns=("added_at", "cart_item_id"),
+        # Largest table and mostly cold: trade CPU for smaller objects.
+        encoding=ParquetEncodingProfile(compression="zstd", compression_level=3),
+        columns=_columns(
+            ("cart_item_id", "int64"),
+            ("cart_id",),
+            ("product_id", "int64"),
+            ("product_name",),
+            ("category", "category"),
+            ("added_at", "string", _ISO_DATETIME),
+            ("quantity", "int64"),
+            ("unit_price", "float64"),
+        ),
     ),
     "orders": TableExportConfig(
         table_name="orders",
         primary_keys=("order_id",),
         event_date_column="order_date",
         default_sort_columns=("order_date", "order_id"),
+        # Hot table read by most downstream jobs: keep decode cheap.
+        encoding=ParquetEncodingProfile(compression="snappy"),
+        columns=_columns(
+            ("order_id",),
+            ("total_items", "int64"),
+            ("order_date", "string", _ISO_DATETIME),
+            ("customer_id",),
+            ("email",),
+            ("order_channel", "category"),
+            ("is_expedited", "bool"),
+            ("customer_tier", "category"),
+            ("gross_total", "float64"),
+            ("net_total", "float64"),
+            ("total_discount_amount", "float64"),
+            ("payment_method", "category"),
+            ("shipping_speed", "category"),
+            ("shipping_cost", "float64"),
+            ("agent_id",),
+            ("actual_shipping_cost", "float64"),
+            ("payment_processing_fee",),
+            ("shipping_address",),
+            ("billing_address",),
+            ("clv_bucket", "category"),
+            ("is_reactivated", "bool"),
+        ),
     ),
     "order_items": TableExportConfig(
         table_name="order_items",
         primary_keys=("order_id", "product_id"),
         event_date_column=None,
         default_sort_columns=("order_id", "product_id"),
+        parent=ParentTableLink(table="orders", join_key="order_id"),
+        columns=_columns(
+            ("order_id",),
+            ("product_id", "int64"),
+            ("product_name",),
+            ("category", "category"),
+            ("quantity", "int64"),
+            ("unit_price", "float64"),
+            ("discount_amount", "float64"),
+            ("cost_price", "float64"),
+        ),
     ),
     "returns": TableExportConfig(
         table_name="returns",
         primary_keys=("return_id",),
         event_date_column="return_date",
         default_sort_columns=("return_date", "return_id"),
+        columns=_columns(
+            ("return_id",),
+            ("order_id",),
+            ("customer_id",),
+            ("email",),
+            ("return_date", "string", _ISO_DATETIME),
+            ("reason", "category"),
+            ("return_type", "category"),
+            ("refunded_amount", "float64"),
+            ("return_channel", "category"),
+            ("agent_id",),
+            ("refund_method", "category"),
+        ),
     ),
     "return_items": TableExportConfig(
         table_name="return_items",
         primary_keys=("return_item_id",),
         event_date_column=None,
         default_sort_columns=("return_id", "return_item_id"),
+        parent=ParentTableLink(table="returns", join_key="return_id"),
+        columns=_columns(
+            ("return_item_id", "int64"),
+            ("return_id",),
+            ("order_id",),
+            ("product_id", "int64"),
+            ("product_name",),
+            ("category", "category"),
+            ("quantity_returned", "int64"),
+            ("unit_price", "float64"),
+            ("cost_price", "float64"),
+            ("refunded_amount", "float64"),
+        ),
     ),
 }
 
 
 DEFAULT_TARGET_SIZE_MB = 16
+# Part files close once they are within this fraction of the target size.
+DEFAULT_FILE_SIZE_TOLERANCE = 0.1
+DEFAULT_STREAM_BLOCK_MB = 16
+# "parquet" hashes the encoded file bytes as they are written; "json" is the
+# legacy record-serialization checksum kept for compatibility.
+CHECKSUM_MODES = ("parquet", "json")
+DEFAULT_CHECKSUM_MODE = "parquet"
+# "pandas" loads CSVs as DataFrames; "arrow" keeps tables in Arrow end to end.
+EXPORT_ENGINES = ("pandas", "arrow")
+DEFAULT_EXPORT_ENGINE = "pandas"
 DEFAULT_MANIFEST_SCHEMA_VERSION = "0.1.0"
+# Files larger than one chunk are uploaded as resumable sessions in chunks of
+# this size; a transient error resends only the uncommitted chunk.
+DEFAULT_UPLOAD_CHUNK_MB = 8
 
 
 def list_supported_tables() -> list[str]:
@@ -119,5 +331,23 @@ def require_table_config(table: str) -> TableExportConfig:
         ) from exc
 
 
+def apply_encoding_overrides(
+    config: TableExportConfig,
+    overrides: Mapping[str, object] | None,
+) -> TableExportConfig:
+    """
+    Returns `config` with selected `ParquetEncodingProfile` fields replaced.
+
+    Overriding `compression` without `compression_level` drops the table's
+    configured level, which belongs to its own codec (snappy takes none).
+    """
+    if not overrides:
+        return config
+    overrides = dict(overrides)
+    if "compression" in overrides:
+        overrides.setdefault("compression_level", None)
+    return replace(config, encoding=replace(config.encoding, **overrides))
+
+
 def default_output_root() -> Path:
     return Path("output") / "raw"
@@ -0,0 +1,127 @@
+"""
+Arrow IPC cache for generator CSV artifacts.
+
+Each CSV is parsed once into an uncompressed Arrow IPC file stored next to it
+(`orders.csv` -> `orders.arrow`). Later reads memory-map the cache instead of
+parsing the CSV again. A cache entry records the CSV's size, mtime, and
+SHA-256 plus the read settings (block size and declared columns): a size or
+settings change invalidates it, a matching mtime accepts it, and a changed
+mtime falls back to comparing the content hash (and, when it matches, records
+the new mtime so the hash is not recomputed on later reads).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pyarrow as pa
+
+from .config import DEFAULT_STREAM_BLOCK_MB, TableExportConfig
+from .streaming import read_csv_table
+
+CACHE_SUFFIX = ".arrow"
+_METADATA_KEY = b"ecom_csv_cache"
+# Bumped when parsing changes what a cache holds (2: empty strings read as nulls)
+_CACHE_FORMAT = 2
+
+
+def cache_path_for(csv_path: Path) -> Path:
+    return csv_path.with_suffix(CACHE_SUFFIX)
+
+
+def _content_sha256(path: Path, block_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fp:
+        for block in iter(lambda: fp.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_settings(block_size_mb: int, table_config: TableExportConfig | None) -> str:
+    columns = table_config.columns if table_config is not None else ()
+    return repr((_CACHE_FORMAT, block_size_mb, tuple(columns)))
+
+
+def _read_cache(csv_path: Path, cache_path: Path, settings: str) -> pa.Table | None:
+    if not cache_path.exists():
+        return None
+    try:
+        reader = pa.ipc.open_file(pa.memory_map(str(cache_path), "r"))
+        metadata = dict(reader.schema.metadata or {})
+        key = json.loads(metadata.pop(_METADATA_KEY))
+    except (OSError, KeyError, ValueError, pa.ArrowInvalid):
+        return None
+
+    stat = csv_path.stat()
+    if key.get("size") != stat.st_size or key.get("settings") != settings:
+        return None
+    if key.get("mtime_ns") == stat.st_mtime_ns:
+        return reader.read_all().replace_schema_metadata(metadata or None)
+    sha256 = _content_sha256(csv_path)
+    if key.get("sha256") != sha256:
+        return None
+    table = reader.read_all().replace_schema_metadata(metadata or None)
+    # Same content under a new mtime (touched or re-copied): record the new
+    # mtime so later reads accept the cache without hashing the CSV again
+    try:
+        _write_cache(csv_path, cache_path, table, settings, sha256=sha256)
+    except OSError:
+        pass
+    return table
+
+
+def _write_cache(
+    csv_path: Path,
+    cache_path: Path,
+    table: pa.Table,
+    settings: str,
+    *,
+    sha256: str | None = None,
+) -> None:
+    stat = csv_path.stat()
+    key = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256 or _content_sha256(csv_path),
+        "settings": settings,
+    }
+    metadata = dict(table.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps(key, sort_keys=True).encode("utf-8")
+    schema = table.schema.with_metadata(metadata)
+
+    # Write beside the target and rename so readers never map a partial file
+    partial = cache_path.with_name(f".{cache_path.name}.partial")
+    with pa.OSFile(str(partial), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        writer.write_table(table.replace_schema_metadata(metadata))
+    os.replace(partial, cache_path)
+
+
+def load_csv_table(
+    csv_path: Path,
+    *,
+    block_size_mb: int = DEFAULT_STREAM_BLOCK_MB,
+    table_config: TableExportConfig | None = None,
+) -> pa.Table:
+    """
+    Returns a CSV as an Arrow table, memory-mapped from its IPC cache when valid.
+
+    On a miss the CSV is parsed with `read_csv_table` (typed by `table_config`
+    when given) and the cache is (re)written; a cache that cannot be written
+    (e.g. a read-only source directory) is skipped silently.
+    """
+    csv_path = Path(csv_path)
+    cache_path = cache_path_for(csv_path)
+    settings = _read_settings(block_size_mb, table_config)
+    table = _read_cache(csv_path, cache_path, settings)
+    if table is not None:
+        return table
+
+    table = read_csv_table(csv_path, block_size_mb=block_size_mb, table_config=table_config)
+    try:
+        _write_cache(csv_path, cache_path, table, settings)
+    except OSError:
+        pass
+    return table
@@ -1,36 +1,138 @@
 """
 Google Cloud Storage upload helper functions.
+
+Uploads go through a `StorageBackend`; GCS is the default and
+`open_backend` maps `file://` paths and fsspec URLs to the offline backends.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
 
 try:
+    import google.auth  # type: ignore
+    import google.auth.exceptions  # type: ignore
+    import requests  # type: ignore
+    from google.api_core import exceptions as api_exceptions  # type: ignore
     from google.api_core import retry  # type: ignore
+    from google.auth.transport.requests import AuthorizedSession  # type: ignore
     from google.cloud import storage  # type: ignore
 except ImportError as exc:  # pragma: no cover - handled at runtime
+    requests = None
     storage = None
+    api_exceptions = None
     retry = None
+    AuthorizedSession = None
     _IMPORT_ERROR = exc
 else:
     _IMPORT_ERROR = None
 
+from .config import DEFAULT_UPLOAD_CHUNK_MB
+from .storage_backends import (
+    FsspecBackend,
+    LocalBackend,
+    RemoteObject,
+    StorageBackend,
+    StorageDependencyError,
+    matches_remote,
+)
+from .upload_control import UploadController, report_throttle
+
+# Resumable chunks must be a multiple of 256 KiB.
+_CHUNK_ALIGNMENT = 256 * 1024
+_TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+# Statuses that mean "slow down" to an adaptive UploadController.
+_THROTTLE_STATUS = {429, 503}
+# Attempts per chunk, backing off 1s, 2s, 4s, ... up to 60s between them.
+_CHUNK_ATTEMPTS = 6
+# HTTP connections kept per host beyond the upload threads (listing, markers).
+_POOL_HEADROOM = 4
+
+_shared_client: storage.Client | None = None
+_shared_pool_size = 0
+_shared_client_lock = threading.Lock()
+
 
-class GCSDependencyError(RuntimeError):
+class GCSDependencyError(StorageDependencyError):
     """
     Raised when google-cloud-storage is not installed.
     """
 
 
-def _ensure_storage_client() -> storage.Client:
+class GCSCredentialsError(RuntimeError):
+    """
+    Raised when no usable Google credentials are available for an upload.
+    """
+
+
+def _serialize_refresh(credentials: google.auth.credentials.Credentials) -> None:
+    """
+    Makes concurrent token refreshes of shared credentials run once.
+
+    Threads that hit an expired token together wait on one lock; whoever
+    gets it second sees the token already replaced and returns, so only one
+    refresh request is made.
+    """
+    refresh = credentials.refresh
+    lock = threading.Lock()
+
+    def locked_refresh(request: object) -> None:
+        stale_token = credentials.token
+        with lock:
+            if credentials.token != stale_token and credentials.valid:
+                return
+            refresh(request)
+
+    credentials.refresh = locked_refresh
+
+
+def _mount_pool(session: requests.Session, pool_size: int) -> None:
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _ensure_storage_client(concurrency: int = 1) -> storage.Client:
+    """
+    Returns the process-wide storage client, creating it on first use.
+
+    The client's authorized session keeps one connection pool sized for
+    `concurrency` upload threads (grown, never shrunk, by later calls) and
+    refreshes the access token in place when it expires, so long runs
+    survive token expiry without rebuilding the client or its pool.
+    """
+    global _shared_client, _shared_pool_size
     if storage is None or _IMPORT_ERROR:
         raise GCSDependencyError(
             "google-cloud-storage is required for this command. "
             "Install with `pip install ecom-datalake-extension[gcs]`."
         )
-    return storage.Client()
+    with _shared_client_lock:
+        if _shared_client is None:
+            try:
+                credentials, project = google.auth.default(scopes=storage.Client.SCOPE)
+            except google.auth.exceptions.DefaultCredentialsError as exc:
+                raise GCSCredentialsError(
+                    "No Google credentials found. Run `gcloud auth application-default login` "
+                    "or set GOOGLE_APPLICATION_CREDENTIALS."
+                ) from exc
+            _serialize_refresh(credentials)
+            _shared_client = storage.Client(
+                project=project,
+                credentials=credentials,
+                _http=AuthorizedSession(credentials),
+            )
+            _shared_pool_size = 0
+        pool_size = concurrency + _POOL_HEADROOM
+        if pool_size > _shared_pool_size:
+            _mount_pool(_shared_client._http, pool_size)
+            _shared_pool_size = pool_size
+        return _shared_client
 
 
 @dataclass(frozen=True)
@@ -38,59 +140,505 @@ class UploadResult:
     files_uploaded: int
     bucket: str
     prefix: str
+    files_skipped: int = 0
+    bytes_uploaded: int = 0
+    # Bytes not sent because the remote blob already matched
+    bytes_skipped: int = 0
+
+
+# Uploaded last, in this order, once every part file of the partition is in place.
+COMMIT_MARKERS = ("_MANIFEST.json", "_SUCCESS")
+
+
+class PartitionUploadError(RuntimeError):
+    """
+    Raised when one or more partitions could not be uploaded completely.
+
+    `failures` maps each failed local partition directory to its first error;
+    the commit markers of those partitions were not uploaded.
+    """
+
+    def __init__(self, failures: dict[Path, BaseException]) -> None:
+        self.failures = failures
+        details = "; ".join(f"{path}: {error}" for path, error in failures.items())
+        super().__init__(f"Failed to upload {len(failures)} partition(s): {details}")
+
+
+@dataclass(frozen=True)
+class _PartitionUpload:
+    local_dir: Path
+    prefix: str
+    part_files: list[Path]
+    markers: list[Path]
+    # Remote blobs under the prefix by file name, listed once before uploading
+    remote: dict[str, RemoteObject] = field(default_factory=dict)
+
+    @classmethod
+    def scan(cls, local_partition_dir: Path, prefix: str) -> _PartitionUpload:
+        local_dir = local_partition_dir.resolve()
+        if not local_dir.exists():
+            raise FileNotFoundError(f"Partition directory not found: {local_dir}")
+        files = sorted(path for path in local_dir.glob("*") if path.is_file())
+        markers = [local_dir / name for name in COMMIT_MARKERS if (local_dir / name).is_file()]
+        part_files = [path for path in files if path.name not in COMMIT_MARKERS]
+        return cls(local_dir=local_dir, prefix=prefix, part_files=part_files, markers=markers)
+
+    def blob_path(self, path: Path) -> str:
+        return f"{self.prefix.strip('/')}/{path.name}"
+
+    def result(self, bucket: str, sent: dict[Path, bool]) -> UploadResult:
+        """
+        Summarizes which files were uploaded (True) or skipped as unchanged (False).
+        """
+        sizes = {path: path.stat().st_size for path in sent}
+        return UploadResult(
+            files_uploaded=sum(sent.values()),
+            bucket=bucket,
+            prefix=self.prefix,
+            files_skipped=len(sent) - sum(sent.values()),
+            bytes_uploaded=sum(sizes[path] for path, was_sent in sent.items() if was_sent),
+            bytes_skipped=sum(sizes[path] for path, was_sent in sent.items() if not was_sent),
+        )
+
+
+def _report_retry(error: Exception) -> None:
+    if isinstance(error, api_exceptions.TooManyRequests | api_exceptions.ServiceUnavailable):
+        report_throttle()
+
+
+def _upload_retry() -> retry.Retry | None:
+    # Configure retry strategy for transient failures
+    if not retry:
+        return None
+    return retry.Retry(
+        initial=1.0,
+        maximum=60.0,
+        multiplier=2.0,
+        deadline=600.0,  # 10 minute total retry deadline
+        predicate=retry.if_transient_error,
+        on_error=_report_retry,
+    )
+
+
+class _TransientUploadError(Exception):
+    """
+    A chunk request failed with a retryable HTTP status.
+    """
+
+
+def _committed_offset(response: requests.Response, total: int) -> int:
+    # 200/201 finalize the object; 308 reports the persisted range as `bytes=0-N`
+    if response.status_code in (200, 201):
+        return total
+    if response.status_code == 308:
+        committed = response.headers.get("Range")
+        return int(committed.rsplit("-", 1)[1]) + 1 if committed else 0
+    if response.status_code in _THROTTLE_STATUS:
+        report_throttle()
+    if response.status_code in _TRANSIENT_STATUS:
+        raise _TransientUploadError(f"HTTP {response.status_code}")
+    response.raise_for_status()
+    raise _TransientUploadError(f"Unexpected HTTP {response.status_code}")
+
+
+def _upload_resumable(
+    blob: storage.Blob,
+    path: Path,
+    *,
+    chunk_size: int,
+    client: storage.Client,
+    timeout: float = 300,
+) -> None:
+    """
+    Uploads a file through a resumable session, `chunk_size` bytes per request.
+
+    After a connection error or retryable status the session is asked how many
+    bytes it persisted and the upload resumes from there, so a transient
+    failure resends only the uncommitted part of one chunk.
+    """
+    total = path.stat().st_size
+    session_url = blob.create_resumable_upload_session(size=total, client=client)
+    # Chunks share the client's pooled, authorized HTTP session
+    http = client._http
+    offset = 0
+    attempt = 0
+    with path.open("rb") as fp:
+        while offset < total:
+            try:
+                if attempt:
+                    # Resume from what the session persisted before the failure
+                    status = http.put(
+                        session_url, headers={"Content-Range": f"bytes */{total}"}, timeout=timeout
+                    )
+                    offset = _committed_offset(status, total)
+                    if offset >= total:
+                        break
+                fp.seek(offset)
+                data = fp.read(chunk_size)
+                response = http.put(
+                    session_url,
+                    data=data,
+                    headers={"Content-Range": f"bytes {offset}-{offset + len(data) - 1}/{total}"},
+                    timeout=timeout,
+                )
+                offset = _committed_offset(response, total)
+                attempt = 0
+            except (requests.ConnectionError, requests.Timeout, _TransientUploadError):
+                attempt += 1
+                if attempt >= _CHUNK_ATTEMPTS:
+                    raise
+                time.sleep(min(60.0, 2.0 ** (attempt - 1)))
+
+
+def _chunk_bytes(chunk_size_mb: float) -> int:
+    chunk_size = int(chunk_size_mb * 1024 * 1024)
+    return max(_CHUNK_ALIGNMENT, chunk_size - chunk_size % _CHUNK_ALIGNMENT) if chunk_size else 0
+
+
+class GCSBackend:
+    """
+    Uploads to a GCS bucket over the shared storage client.
+
+    Files larger than `chunk_size_mb` (0 disables) are sent as chunked
+    resumable uploads; smaller ones in a single request with API-core retries.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        *,
+        concurrency: int = 1,
+        chunk_size_mb: float = DEFAULT_UPLOAD_CHUNK_MB,
+        client: storage.Client | None = None,
+    ) -> None:
+        self.bucket_name = bucket_name
+        self.client = client or _ensure_storage_client(concurrency)
+        self.bucket = self.client.bucket(bucket_name)
+        self.chunk_size = _chunk_bytes(chunk_size_mb)
+        self.upload_retry = _upload_retry()
+
+    def uri(self, key: str) -> str:
+        return f"gs://{self.bucket_name}/{key}".rstrip("/")
+
+    def list(self, prefix: str) -> dict[str, RemoteObject]:
+        blob_prefix = f"{prefix.strip('/')}/"
+        return {
+            blob.name[len(blob_prefix) :]: RemoteObject(
+                size=blob.size, crc32c=blob.crc32c, md5=blob.md5_hash
+            )
+            for blob in self.client.list_blobs(self.bucket_name, prefix=blob_prefix)
+        }
+
+    def upload(self, path: Path, key: str) -> None:
+        try:
+            self._upload(path, key)
+        except google.auth.exceptions.RefreshError as exc:
+            raise GCSCredentialsError(f"Could not refresh Google credentials: {exc}") from exc
+
+    def _upload(self, path: Path, key: str) -> None:
+        blob = self.bucket.blob(key)
+        if self.chunk_size and path.stat().st_size > self.chunk_size:
+            _upload_resumable(blob, path, chunk_size=self.chunk_size, client=self.client)
+        elif self.upload_retry:
+            # Upload with retry and timeout configuration
+            blob.upload_from_filename(
+                path,
+                timeout=300,  # 5 minute timeout per file
+                retry=self.upload_retry,
+            )
+        else:
+            # Fallback without retry if google.api_core not available
+            blob.upload_from_filename(path)
+
+
+def open_backend(
+    uri: str, *, concurrency: int = 1, chunk_size_mb: float = DEFAULT_UPLOAD_CHUNK_MB
+) -> tuple[StorageBackend, str]:
+    """
+    Returns the backend for a destination URI and the key prefix within it.
+
+    `gs://bucket/prefix` uploads to GCS, `file:///dir` or a plain path to a
+    local directory, and any other `scheme://` URL through fsspec.
+    """
+    scheme, separator, rest = uri.partition("://")
+    if not separator:
+        return LocalBackend(Path(uri)), ""
+    if scheme == "gs":
+        bucket_name, _, prefix = rest.partition("/")
+        if not bucket_name:
+            raise ValueError(f"Expected gs://bucket[/prefix], got {uri!r}")
+        backend = GCSBackend(bucket_name, concurrency=concurrency, chunk_size_mb=chunk_size_mb)
+        return backend, prefix.strip("/")
+    if scheme == "file":
+        return LocalBackend(Path(rest)), ""
+    return FsspecBackend(uri), ""
+
+
+def _upload_file(
+    backend: StorageBackend,
+    path: Path,
+    key: str,
+    remote: RemoteObject | None = None,
+    controller: UploadController | None = None,
+) -> bool:
+    """
+    Uploads one file unless `remote` already matches it; returns whether it was sent.
+    """
+    if matches_remote(path, remote):
+        return False
+    if controller is None:
+        backend.upload(path, key)
+        return True
+    with controller.slot(path.stat().st_size):
+        backend.upload(path, key)
+    return True
+
+
+def _commit_partition(
+    backend: StorageBackend,
+    partition: _PartitionUpload,
+    controller: UploadController | None = None,
+) -> list[bool]:
+    return [
+        _upload_file(
+            backend,
+            path,
+            partition.blob_path(path),
+            partition.remote.get(path.name),
+            controller,
+        )
+        for path in partition.markers
+    ]
+
+
+def upload_partitions(
+    partitions: Sequence[tuple[Path, str]],
+    *,
+    bucket_name: str | None = None,
+    concurrency: int = 1,
+    chunk_size_mb: float = DEFAULT_UPLOAD_CHUNK_MB,
+    skip_unchanged: bool = True,
+    client: storage.Client | None = None,
+    backend: StorageBackend | None = None,
+    controller: UploadController | None = None,
+) -> list[UploadResult]:
+    """
+    Uploads local Hive-style partitions, given as `(directory, prefix)` pairs, to GCS.
+
+    Files go to `backend` when given, otherwise to the GCS bucket `bucket_name`.
+    A `controller` gates every file upload; the pool then has
+    `controller.max_concurrency` threads and the controller decides how many
+    of them may upload at once.
+
+    Part files from all partitions share a pool of `concurrency` upload
+    threads, each file with its own retries. A partition's `_MANIFEST.json`
+    and then `_SUCCESS` are uploaded only after all of its part files
+    succeeded, so a committed partition is never missing data. Files larger
+    than `chunk_size_mb` (0 disables) are sent as resumable uploads in chunks
+    of that size. With `skip_unchanged`, each destination prefix is listed
+    once and files whose remote blob has the same size and CRC32C (or MD5)
+    are not sent again. Every partition is attempted; `PartitionUploadError`
+    is raised at the end if any of them failed. Results are returned in
+    input order.
+    """
+    plans = [_PartitionUpload.scan(Path(directory), prefix) for directory, prefix in partitions]
+    if controller is not None:
+        concurrency = max(concurrency, controller.max_concurrency)
+    if backend is None:
+        if bucket_name is None:
+            raise ValueError("upload_partitions needs a bucket_name or a backend")
+        backend = GCSBackend(
+            bucket_name, concurrency=concurrency, chunk_size_mb=chunk_size_mb, client=client
+        )
+    if skip_unchanged:
+        for plan in plans:
+            plan.remote.update(backend.list(plan.prefix))
+
+    remaining = [len(plan.part_files) for plan in plans]
+    # Per partition: whether each file was uploaded (True) or skipped (False)
+    sent_by_plan: list[dict[Path, bool]] = [{} for _ in plans]
+    failures: dict[int, BaseException] = {}
+    pending: dict[Future[object], tuple[int, list[Path]]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+
+        def commit(index: int) -> None:
+            future = executor.submit(_commit_partition, backend, plans[index], controller)
+            pending[future] = (index, plans[index].markers)
+
+        for index, plan in enumerate(plans):
+            for path in plan.part_files:
+                future = executor.submit(
+                    _upload_file,
+                    backend,
+                    path,
+                    plan.blob_path(path),
+                    plan.remote.get(path.name),
+                    controller,
+                )
+                pending[future] = (index, [path])
+            if not plan.part_files:
+                commit(index)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, paths = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    failures.setdefault(index, error)
+                    continue
+                result = future.result()
+                is_commit = isinstance(result, list)
+                sent_by_plan[index].update(
+                    zip(paths, result if is_commit else [result], strict=True)
+                )
+                if is_commit:
+                    continue
+                remaining[index] -= 1
+                if not remaining[index] and index not in failures:
+                    commit(index)
+
+    if failures:
+        error = PartitionUploadError(
+            {plans[index].local_dir: error for index, error in sorted(failures.items())}
+        )
+        raise error from next(iter(error.failures.values()))
+    bucket = bucket_name if bucket_name is not None else backend.uri("")
+    return [plan.result(bucket, sent) for plan, sent in zip(plans, sent_by_plan, strict=True)]
+
+
+def _upload_partition_serially(
+    local_partition_dir: Path,
+    prefix: str,
+    *,
+    backend: StorageBackend,
+    bucket: str,
+    skip_unchanged: bool,
+    controller: UploadController | None,
+) -> UploadResult:
+    """
+    Uploads one partition file by file on the calling thread, commit markers last.
+    """
+    plan = _PartitionUpload.scan(Path(local_partition_dir), prefix)
+    if skip_unchanged:
+        plan.remote.update(backend.list(plan.prefix))
+    sent = {
+        path: _upload_file(
+            backend, path, plan.blob_path(path), plan.remote.get(path.name), controller
+        )
+        for path in plan.part_files
+    }
+    sent.update(zip(plan.markers, _commit_partition(backend, plan, controller), strict=True))
+    return plan.result(bucket, sent)
 
 
 def upload_partition(
     *,
-    bucket_name: str,
+    bucket_name: str | None = None,
     prefix: str,
     local_partition_dir: Path,
+    chunk_size_mb: float = DEFAULT_UPLOAD_CHUNK_MB,
+    skip_unchanged: bool = True,
     client: storage.Client | None = None,
+    backend: StorageBackend | None = None,
+    controller: UploadController | None = None,
 ) -> UploadResult:
     """
     Uploads all files from a local Hive-style partition directory to GCS.
+
+    Part files are uploaded first, then `_MANIFEST.json` and `_SUCCESS`.
     """
-    local_partition_dir = local_partition_dir.resolve()
-    if not local_partition_dir.exists():
-        raise FileNotFoundError(f"Partition directory not found: {local_partition_dir}")
+    try:
+        (result,) = upload_partitions(
+            [(local_partition_dir, prefix)],
+            bucket_name=bucket_name,
+            chunk_size_mb=chunk_size_mb,
+            skip_unchanged=skip_unchanged,
+            client=client,
+            backend=backend,
+            controller=controller,
+        )
+    except PartitionUploadError as exc:
+        # A single partition surfaces its underlying upload error unchanged
+        raise exc.__cause__ from None
+    return result
 
-    client = client or _ensure_storage_client()
-    bucket = client.bucket(bucket_name)
 
-    # Configure retry strategy for transient failures
-    upload_retry = (
-        retry.Retry(
-            initial=1.0,
-            maximum=60.0,
-            multiplier=2.0,
-            deadline=600.0,  # 10 minute total retry deadline
-            predicate=retry.if_transient_error,
-        )
-        if retry
-        else None
-    )
+class PartitionUploadPipeline:
+    """
+    Uploads partitions in the background while a producer keeps committing them.
 
-    files_uploaded = 0
-    for path in local_partition_dir.glob("*"):
-        if path.is_file():
-            relative_name = path.name
-            blob_path = f"{prefix.strip('/')}/{relative_name}"
-            blob = bucket.blob(blob_path)
+    `submit()` queues a finished partition and returns at once unless
+    `max_pending` partitions (default `2 * concurrency`) are already queued
+    or uploading; then it blocks until one finishes, which bounds how far the
+    producer runs ahead. Each partition is uploaded file by file on one of
+    `concurrency` worker threads (commit markers last, unchanged files
+    skipped) over one shared client or `backend`, so at most `concurrency`
+    files are in flight; `controller`, when given, gates them further.
+    `close()` waits for the queue to drain and returns results in submission
+    order, raising `PartitionUploadError` if any partition failed.
+    """
 
-            # Upload with retry and timeout configuration
-            if upload_retry:
-                blob.upload_from_filename(
-                    path,
-                    timeout=300,  # 5 minute timeout per file
-                    retry=upload_retry,
-                )
+    def __init__(
+        self,
+        *,
+        bucket_name: str | None = None,
+        concurrency: int = 4,
+        max_pending: int | None = None,
+        chunk_size_mb: float = DEFAULT_UPLOAD_CHUNK_MB,
+        skip_unchanged: bool = True,
+        client: storage.Client | None = None,
+        backend: StorageBackend | None = None,
+        controller: UploadController | None = None,
+    ) -> None:
+        concurrency = max(1, concurrency)
+        if backend is None:
+            if bucket_name is None:
+                raise ValueError("PartitionUploadPipeline needs a bucket_name or a backend")
+            backend = GCSBackend(
+                bucket_name, concurrency=concurrency, chunk_size_mb=chunk_size_mb, client=client
+            )
+        self.backend = backend
+        self.controller = controller
+        self._options = {
+            "backend": backend,
+            "bucket": bucket_name if bucket_name is not None else backend.uri(""),
+            "skip_unchanged": skip_unchanged,
+            "controller": controller,
+        }
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="upload")
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * concurrency)
+        self._futures: list[tuple[Path, Future[UploadResult]]] = []
+
+    def submit(self, local_partition_dir: Path, prefix: str) -> None:
+        self._slots.acquire()
+        future = self._executor.submit(
+            _upload_partition_serially, local_partition_dir, prefix, **self._options
+        )
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append((Path(local_partition_dir).resolve(), future))
+
+    def close(self) -> list[UploadResult]:
+        self._executor.shutdown(wait=True)
+        results: list[UploadResult] = []
+        failures: dict[Path, BaseException] = {}
+        for local_dir, future in self._futures:
+            error = future.exception()
+            if error is None:
+                results.append(future.result())
             else:
-                # Fallback without retry if google.api_core not available
-                blob.upload_from_filename(path)
+                failures[local_dir] = error
+        if failures:
+            raise PartitionUploadError(failures) from next(iter(failures.values()))
+        return results
 
-            files_uploaded += 1
+    def __enter__(self) -> PartitionUploadPipeline:
+        return self
 
-    return UploadResult(files_uploaded=files_uploaded, bucket=bucket_name, prefix=prefix)
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        # On success callers collect results with close(); on error stop queued uploads
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
 
 
 def build_partition_prefix(table: str, partition: str) -> str:
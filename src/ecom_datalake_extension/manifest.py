@@ -32,6 +32,7 @@ class PartitionManifest:
     generator_version: str | None
     total_rows: int | None
     checksums: list[str] | None
+    input_fingerprint: str | None = None
 
 
 def build_manifest(
@@ -47,6 +48,7 @@ def build_manifest(
     schema_version: str = DEFAULT_MANIFEST_SCHEMA_VERSION,
     total_rows: int | None = None,
     checksums: Iterable[str] | None = None,
+    input_fingerprint: str | None = None,
 ) -> PartitionManifest:
     manifest_files = list(files)
     checksum_list = list(checksums) if checksums else None
@@ -62,6 +64,7 @@ def build_manifest(
         generator_version=generator_version,
         total_rows=total_rows,
         checksums=checksum_list,
+        input_fingerprint=input_fingerprint,
     )
 
 
@@ -71,6 +74,18 @@ def write_manifest(path: Path, manifest: PartitionManifest) -> None:
         json.dump(asdict(manifest), fp, indent=2, sort_keys=True)
 
 
+def read_manifest(path: Path) -> PartitionManifest | None:
+    """
+    Loads a manifest written by `write_manifest`; returns None if it is missing or unreadable.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload["files"] = [ManifestFile(**item) for item in payload.get("files", [])]
+        return PartitionManifest(**payload)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
 def write_success_marker(partition_dir: Path) -> None:
     marker = partition_dir / "_SUCCESS"
     marker.touch(exist_ok=True)
@@ -4,61 +4,456 @@ Core Parquet writing utilities for raw exports.
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, datetime
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
-from .config import DEFAULT_TARGET_SIZE_MB, TableExportConfig
-from .lineage import compute_event_id, utc_now_iso
+from .config import (
+    CHECKSUM_MODES,
+    DEFAULT_CHECKSUM_MODE,
+    DEFAULT_FILE_SIZE_TOLERANCE,
+    DEFAULT_TARGET_SIZE_MB,
+    TableExportConfig,
+)
+from .lineage import compute_event_ids, utc_now_iso
 from .manifest import ManifestFile
-from .utils import chunk_dataframe, compute_checksum, estimate_row_size_bytes
+from .utils import ChecksumAccumulator, HashingFileWriter
 
+# Rows encoded in memory to estimate compressed bytes per row before writing.
+_PROBE_ROWS = 4096
 
-def prepare_dataframe_with_lineage(
-    df: pd.DataFrame,
+# A whole ISO-8601 date or timestamp: `YYYY-MM-DD`, optionally followed by `T` or a
+# space, a valid time (seconds and fraction optional), and `Z` or a UTC offset.
+_ISO_VALUE = (
+    r"^\d{4}-\d{2}-\d{2}"
+    r"(?:[T ](?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d{1,9})?)?"
+    r"(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?)?$"
+)
+
+# (manifest files, min event date, max event date, total rows, checksums)
+PartitionWriteResult = tuple[list[ManifestFile], str | None, str | None, int, list[str]]
+
+_ARROW_TYPES = {
+    "string": pa.string(),
+    "int64": pa.int64(),
+    "float64": pa.float64(),
+    "bool": pa.bool_(),
+    "timestamp": pa.timestamp("s"),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+}
+
+
+def column_arrow_types(table_config: TableExportConfig) -> dict[str, pa.DataType]:
+    """
+    Arrow types of the table's declared columns (see `ColumnSpec`).
+    """
+    return {column.name: _ARROW_TYPES[column.type] for column in table_config.columns}
+
+
+def _fits_declared_type(values: pd.Series, column_type: str) -> bool:
+    dtype = values.dtype
+    if column_type in ("string", "category"):
+        return isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(dtype)
+    if column_type == "int64":
+        if pd.api.types.is_float_dtype(dtype):
+            # Integer columns with nulls arrive from pandas as float64
+            return bool((values.dropna() % 1 == 0).all())
+        return pd.api.types.is_integer_dtype(dtype)
+    if column_type == "float64":
+        return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    if column_type == "bool":
+        return pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_object_dtype(dtype)
+    return pd.api.types.is_datetime64_any_dtype(dtype)
+
+
+def declared_schema(df: pd.DataFrame, table_config: TableExportConfig) -> pa.Schema:
+    """
+    Arrow schema for `df` with declared column types in place of inferred ones.
+
+    Declared types keep Parquet schemas identical across partitions and
+    batches whatever pandas inferred for a slice; a column whose values do
+    not fit its declared type (e.g. a CSV read with inferred types) keeps
+    the inferred type.
+    """
+    # `Schema.from_pandas(df)` converts every object column to Arrow just to
+    # learn its type; infer object columns without building arrays instead
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    for index, (_, values) in enumerate(df.items()):
+        if values.dtype == object:
+            inferred = pa.infer_type(values.to_numpy(), from_pandas=True)
+            schema = schema.set(index, schema.field(index).with_type(inferred))
+    for column in table_config.columns:
+        index = schema.get_field_index(column.name)
+        if index >= 0 and _fits_declared_type(df[column.name], column.type):
+            arrow_type = _ARROW_TYPES[column.type]
+            schema = schema.set(index, schema.field(index).with_type(arrow_type))
+    return schema
+
+
+def prepare_table_with_lineage(
+    table: pa.Table,
     *,
     table_config: TableExportConfig,
     batch_id: str,
     ingestion_ts: str,
     source_prefix: str | None = None,
-) -> pd.DataFrame:
+) -> pa.Table:
     """
     Adds event_id, batch_id, ingestion_ts, and source_file columns.
+
+    Lineage columns are appended to the table without copying the source
+    columns; only the primary keys are converted to pandas to build event_id.
     """
-    enriched = df.copy()
-    enriched["batch_id"] = batch_id
-    enriched["ingestion_ts"] = ingestion_ts
+    keys = table.select(list(table_config.primary_keys)).to_pandas()
+    lineage = {
+        "batch_id": pa.array([batch_id] * table.num_rows, type=pa.string()),
+        "ingestion_ts": pa.array([ingestion_ts] * table.num_rows, type=pa.string()),
+        "event_id": pa.array(
+            compute_event_ids(table_config.table_name, keys, table_config.primary_keys),
+            type=pa.string(),
+        ),
+    }
+    if source_prefix:
+        lineage["source_file"] = pa.array([source_prefix] * table.num_rows, type=pa.string())
 
-    def event_id_builder(row: pd.Series) -> str:
-        return compute_event_id(
-            table_config.table_name,
-            row,
-            table_config.primary_keys,
-        )
+    for name, values in lineage.items():
+        index = table.schema.get_field_index(name)
+        if index >= 0:
+            table = table.set_column(index, name, values)
+        else:
+            table = table.append_column(name, values)
+    return table
+
+
+def _mixed_date_bounds(values: pd.Series) -> tuple[str | None, str | None]:
+    dates = pd.to_datetime(values, format="mixed", errors="coerce")
+    valid_dates = dates.dropna()
+    if valid_dates.empty:
+        return None, None
+    return valid_dates.min().date().isoformat(), valid_dates.max().date().isoformat()
+
+
+def _merge_bounds(
+    first: tuple[str | None, str | None], second: tuple[str | None, str | None]
+) -> tuple[str | None, str | None]:
+    mins = [value for value in (first[0], second[0]) if value]
+    maxes = [value for value in (first[1], second[1]) if value]
+    return (min(mins) if mins else None, max(maxes) if maxes else None)
 
-    enriched["event_id"] = enriched.apply(event_id_builder, axis=1)
-    if source_prefix:
-        enriched["source_file"] = source_prefix
-    return enriched
 
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
 
-def determine_rows_per_chunk(
-    df: pd.DataFrame,
+
+def event_date_bounds(
+    values: pd.Series | pa.Array | pa.ChunkedArray,
+) -> tuple[str | None, str | None]:
+    """
+    Returns the ISO min/max calendar dates found in an event date column.
+
+    Timestamp and date columns are reduced directly. For string columns,
+    well-formed ISO-8601 values (a valid `YYYY-MM-DD` date, optionally
+    followed by `T` or a space, a valid time, and a UTC offset) are reduced on
+    their date prefix with Arrow kernels, the same prefix partition routing
+    uses. Only the remaining non-null values are parsed with
+    `pd.to_datetime(format="mixed")`.
+    """
+    if isinstance(values, pd.Series):
+        try:
+            values = pa.chunked_array([pa.Array.from_pandas(values)])
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return _mixed_date_bounds(values)
+    elif isinstance(values, pa.Array):
+        values = pa.chunked_array([values])
+    if pa.types.is_dictionary(values.type):
+        values = values.cast(values.type.value_type)
+
+    if pa.types.is_timestamp(values.type) or pa.types.is_date(values.type):
+        bounds = pc.min_max(values)
+        if not bounds["min"].is_valid:
+            return None, None
+        return tuple(_as_date(bounds[key].as_py()).isoformat() for key in ("min", "max"))
+    if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        return _mixed_date_bounds(values.to_pandas())
+
+    # Check the shape of every value, then validate each distinct date prefix once
+    well_formed = pc.match_substring_regex(values, _ISO_VALUE)
+    prefixes = pc.utf8_slice_codeunits(values, 0, 10)
+    days = pc.unique(prefixes.filter(well_formed))
+    # Round-trip through a date so impossible days (e.g. 2024-02-30) are left to pandas
+    parsed = pc.strptime(days, format="%Y-%m-%d", unit="s", error_is_null=True)
+    days = days.filter(pc.equal(pc.strftime(parsed, format="%Y-%m-%d"), days))
+    # ISO dates order lexicographically, so the bounds are string min/max
+    bounds = pc.min_max(days)
+    iso_bounds = (bounds["min"].as_py(), bounds["max"].as_py())
+
+    is_iso = pc.and_(well_formed, pc.is_in(prefixes, value_set=days))
+    messy = values.filter(pc.and_(pc.is_valid(values), pc.invert(is_iso)))
+    if not len(messy):
+        return iso_bounds
+    return _merge_bounds(iso_bounds, _mixed_date_bounds(messy.to_pandas()))
+
+
+def probe_bytes_per_row(
+    table: pa.Table,
     *,
-    target_size_mb: int,
-) -> int:
+    table_config: TableExportConfig,
+    batch_id: str,
+    ingestion_ts: str,
+    source_prefix: str | None = None,
+) -> float:
+    """
+    Estimates compressed Parquet bytes per row from a small lineage-enriched sample.
+
+    The sample is encoded in memory with the table's `ParquetEncodingProfile`,
+    so the estimate reflects its compression and dictionary settings.
     """
-    Determines an appropriate number of rows per chunk based on the requested size.
+    sample = prepare_table_with_lineage(
+        table.slice(0, _PROBE_ROWS),
+        table_config=table_config,
+        batch_id=batch_id,
+        ingestion_ts=ingestion_ts,
+        source_prefix=source_prefix,
+    )
+    buffer = pa.BufferOutputStream()
+    pq.write_table(sample, buffer, **table_config.encoding.writer_options())
+    return max(buffer.tell() / sample.num_rows, 1e-9)
+
+
+class PartitionStreamWriter:
     """
-    target_bytes = max(1, target_size_mb) * 1024 * 1024
-    avg_row_bytes = estimate_row_size_bytes(df)
-    rows = max(int(target_bytes / avg_row_bytes), 1)
-    return rows
+    Incrementally writes one table partition as Parquet part files rolled by size.
+
+    Rows are appended as row groups through a `ParquetWriter` configured from
+    the table's `ParquetEncodingProfile`. A small probe
+    sample is encoded in memory to estimate compressed bytes per row; after
+    that the bytes actually written size each following group so the file
+    closes once it is within `size_tolerance` of `target_size_mb` on disk.
+
+    With `sort_columns`, the rows of every `write()` call are sorted before
+    they are split into row groups; the ordering is recorded as Parquet
+    sorting columns and page indexes are written so readers can prune by
+    range. A single `write()` of a whole partition is therefore sorted
+    globally, while streamed batches are sorted within each row group.
+
+    `close()` returns the same tuple as `write_partitioned_parquet` so callers
+    can build manifests identically for both paths. Writers for many
+    partitions of one table can share `ingestion_ts` and a `bytes_per_row`
+    estimate, which skips the probe.
+    """
+
+    def __init__(
+        self,
+        *,
+        table_config: TableExportConfig,
+        output_root: Path,
+        partition_path: str,
+        batch_id: str,
+        target_size_mb: float = DEFAULT_TARGET_SIZE_MB,
+        source_prefix: str | None = None,
+        checksum_mode: str = DEFAULT_CHECKSUM_MODE,
+        size_tolerance: float = DEFAULT_FILE_SIZE_TOLERANCE,
+        sort_columns: Sequence[str] = (),
+        ingestion_ts: str | None = None,
+        bytes_per_row: float | None = None,
+    ) -> None:
+        if checksum_mode not in CHECKSUM_MODES:
+            raise ValueError(f"Unknown checksum mode '{checksum_mode}'")
+        self.table_config = table_config
+        self.output_root = output_root
+        self.partition_dir = output_root / partition_path
+        self.batch_id = batch_id
+        self.target_bytes = max(1, int(target_size_mb * 1024 * 1024))
+        self.source_prefix = source_prefix
+        self.checksum_mode = checksum_mode
+        self.size_tolerance = size_tolerance
+        self.sort_columns = tuple(sort_columns)
+        self.ingestion_ts = ingestion_ts or utc_now_iso()
+
+        self._writer: pq.ParquetWriter | None = None
+        self._schema: pa.Schema | None = None
+        self._sink: HashingFileWriter | None = None
+        self._checksum: ChecksumAccumulator | None = None
+        self._part_rows = 0
+        self._bytes_per_row = bytes_per_row
+        self._manifest_files: list[ManifestFile] = []
+        self._checksums: list[str] = []
+        self._total_rows = 0
+        self._min_event_dt: str | None = None
+        self._max_event_dt: str | None = None
+
+    def _part_path(self) -> Path:
+        return self.partition_dir / f"part-{len(self._manifest_files):04d}.parquet"
+
+    def _open_part(self) -> None:
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+        self._sink = HashingFileWriter(self._part_path())
+        self._writer = pq.ParquetWriter(self._sink, self._schema, **self._writer_options())
+        if self.checksum_mode == "json":
+            self._checksum = ChecksumAccumulator()
+
+    def _close_part(self) -> None:
+        if self._writer is None or self._sink is None:
+            return
+        self._writer.close()
+        self._sink.close()
+        if self._checksum is not None:
+            self._checksums.append(self._checksum.hexdigest())
+        else:
+            self._checksums.append(self._sink.checksum())
+        self._manifest_files.append(
+            ManifestFile(
+                path=str(self._part_path().relative_to(self.output_root)),
+                rows=self._part_rows,
+                checksum=self._checksums[-1],
+            )
+        )
+        self._writer = None
+        self._sink = None
+        self._checksum = None
+        self._part_rows = 0
+
+    def _probe_bytes_per_row(self, table: pa.Table) -> float:
+        return probe_bytes_per_row(
+            table,
+            table_config=self.table_config,
+            batch_id=self.batch_id,
+            ingestion_ts=self.ingestion_ts,
+            source_prefix=self._source_file(self._part_path()),
+        )
+
+    def _sort_keys(self, column_names: Sequence[str]) -> list[tuple[str, str]]:
+        return [(name, "ascending") for name in self.sort_columns if name in column_names]
+
+    def _writer_options(self) -> dict[str, object]:
+        options = self.table_config.encoding.writer_options()
+        sort_keys = self._sort_keys(self._schema.names) if self._schema is not None else []
+        if sort_keys:
+            options["sorting_columns"] = pq.SortingColumn.from_ordering(self._schema, sort_keys)
+            options["write_page_index"] = True
+        return options
+
+    def _next_group_rows(self) -> int:
+        written = self._sink.bytes_written if self._sink is not None else 0
+        rows = max(1, int((self.target_bytes - written) / self._bytes_per_row))
+        row_group_size = self.table_config.encoding.row_group_size
+        return min(rows, row_group_size) if row_group_size else rows
+
+    def _track_event_dates(self, table: pa.Table) -> None:
+        column = self.table_config.event_date_column
+        if not column or column not in table.column_names:
+            return
+        self._merge_event_dates(*event_date_bounds(table.column(column)))
+
+    def _merge_event_dates(self, batch_min: str | None, batch_max: str | None) -> None:
+        if batch_min and (self._min_event_dt is None or batch_min < self._min_event_dt):
+            self._min_event_dt = batch_min
+        if batch_max and (self._max_event_dt is None or batch_max > self._max_event_dt):
+            self._max_event_dt = batch_max
+
+    def _source_file(self, path: Path) -> str | None:
+        return f"{self.source_prefix}/{path.name}" if self.source_prefix else None
+
+    def _enrich(self, piece: pa.Table, path: Path) -> pa.Table:
+        return prepare_table_with_lineage(
+            piece,
+            table_config=self.table_config,
+            batch_id=self.batch_id,
+            ingestion_ts=self.ingestion_ts,
+            source_prefix=self._source_file(path),
+        )
+
+    def write(self, table: pa.Table) -> None:
+        if not table.num_rows:
+            return
+        self._track_event_dates(table)
+        sort_keys = self._sort_keys(table.column_names)
+        if sort_keys:
+            table = table.sort_by(sort_keys)
+        if self._bytes_per_row is None:
+            self._bytes_per_row = self._probe_bytes_per_row(table)
+        remaining = table
+        while remaining.num_rows:
+            group_rows = self._next_group_rows()
+            self._write_group(remaining.slice(0, group_rows))
+            remaining = remaining.slice(group_rows)
+
+    def write_frame(self, df: pd.DataFrame) -> None:
+        """
+        Writes a pandas frame, converting it to Arrow one row group at a time.
+
+        Each group is converted from a positional view of `df`, so numeric
+        columns reach Arrow without a copy and lineage is appended to the
+        Arrow piece; peak memory stays close to `df` plus one row group. With
+        sort columns only the key columns are converted to compute the order,
+        and each group gathers its rows from `df` in that order.
+        """
+        if df.empty:
+            return
+        schema = declared_schema(df, self.table_config)
+        sort_keys = self._sort_keys(df.columns)
+        order = None
+        if sort_keys:
+            names = [name for name, _ in sort_keys]
+            keys = pa.Table.from_pandas(
+                df[names],
+                schema=pa.schema([schema.field(name) for name in names]),
+                preserve_index=False,
+            )
+            order = pc.sort_indices(keys, sort_keys=sort_keys).to_numpy()
+
+        def rows(start: int, stop: int) -> pa.Table:
+            piece = df.iloc[start:stop] if order is None else df.take(order[start:stop])
+            return pa.Table.from_pandas(piece, schema=schema, preserve_index=False)
+
+        if self._bytes_per_row is None:
+            self._bytes_per_row = self._probe_bytes_per_row(rows(0, _PROBE_ROWS))
+        start = 0
+        while start < len(df):
+            group_rows = self._next_group_rows()
+            piece = rows(start, start + group_rows)
+            self._track_event_dates(piece)
+            self._write_group(piece)
+            start += group_rows
+
+    def _write_group(self, piece: pa.Table) -> None:
+        enriched = self._enrich(piece, self._part_path())
+        if self._schema is None:
+            self._schema = enriched.schema
+        elif enriched.schema != self._schema:
+            enriched = enriched.cast(self._schema)
+
+        if self._writer is None:
+            self._open_part()
+        self._writer.write_table(enriched)
+        if self._checksum is not None:
+            self._checksum.update(enriched.to_pandas())
+        self._part_rows += piece.num_rows
+        self._total_rows += piece.num_rows
+
+        written = self._sink.bytes_written
+        self._bytes_per_row = max(written / self._part_rows, 1e-9)
+        if written >= self.target_bytes * (1 - self.size_tolerance):
+            self._close_part()
+
+    def close(self) -> PartitionWriteResult:
+        self._close_part()
+        return (
+            self._manifest_files,
+            self._min_event_dt,
+            self._max_event_dt,
+            self._total_rows,
+            self._checksums,
+        )
 
 
 def write_partitioned_parquet(
-    df: pd.DataFrame,
+    df: pd.DataFrame | pa.Table,
     *,
     table_config: TableExportConfig,
     output_root: Path,
@@ -67,15 +462,22 @@ def write_partitioned_parquet(
     source_prefix: str | None = None,
     target_size_mb: int = DEFAULT_TARGET_SIZE_MB,
     partition_path_override: str | None = None,
-) -> tuple[list[ManifestFile], str | None, str | None, int, list[str]]:
+    checksum_mode: str = DEFAULT_CHECKSUM_MODE,
+    sort: bool = False,
+) -> PartitionWriteResult:
     """
     Writes Parquet files for a single table partition and returns manifest metadata.
 
+    `df` may be a pandas DataFrame or an Arrow table (`--engine arrow`).
+
     Args:
         partition_path_override: If provided, use this path instead of table_name/ingest_dt=YYYY-MM-DD.
                                  Used for dimension tables with custom partitioning (e.g., customers/signup_date=YYYY-MM-DD)
+        checksum_mode: "parquet" hashes the file bytes while writing; "json" keeps the legacy
+                       record-serialization checksum.
+        sort: Sort the partition by `table_config.default_sort_columns` and write page indexes.
     """
-    if df.empty:
+    if not len(df):
         return [], None, None, 0, []
 
     if partition_path_override:
@@ -85,51 +487,81 @@ def write_partitioned_parquet(
     else:
         raise ValueError("Either ingest_dt or partition_path_override must be provided")
 
-    partition_dir.mkdir(parents=True, exist_ok=True)
-    ingestion_ts = utc_now_iso()
+    writer = PartitionStreamWriter(
+        table_config=table_config,
+        output_root=output_root,
+        partition_path=str(partition_dir.relative_to(output_root)),
+        batch_id=batch_id,
+        target_size_mb=target_size_mb,
+        source_prefix=source_prefix,
+        checksum_mode=checksum_mode,
+        sort_columns=table_config.default_sort_columns if sort else (),
+    )
+    if isinstance(df, pa.Table):
+        writer.write(df)
+    else:
+        writer.write_frame(df)
+    return writer.close()
 
-    rows_per_chunk = determine_rows_per_chunk(df, target_size_mb=target_size_mb)
-    chunks = chunk_dataframe(df, rows_per_chunk)
 
-    manifest_files: list[ManifestFile] = []
-    min_event_dt: str | None = None
-    max_event_dt: str | None = None
+def write_dimension_partitions(
+    df: pd.DataFrame | pa.Table,
+    partition_values: pd.Series,
+    *,
+    table_config: TableExportConfig,
+    output_root: Path,
+    partition_column: str,
+    batch_id: str,
+    source_prefix: str | None = None,
+    target_size_mb: int = DEFAULT_TARGET_SIZE_MB,
+    checksum_mode: str = DEFAULT_CHECKSUM_MODE,
+    sort: bool = False,
+) -> dict[str, PartitionWriteResult]:
+    """
+    Writes a dimension table into `<table>/<partition_column>=<value>` partitions in one pass.
+
+    `partition_values` holds each row's partition value; rows with a null
+    value are not written. The table is converted to Arrow once and split by
+    value, and partitions are written one after another so only one part file
+    is open at a time. All partitions share one ingestion timestamp and one
+    probe of the whole table, so small partitions cost one file write each.
 
-    if table_config.event_date_column and table_config.event_date_column in df.columns:
-        dates = pd.to_datetime(
-            df[table_config.event_date_column],
-            format="mixed",
-            errors="coerce",
+    Returns the write result of each partition keyed by its path relative to
+    `output_root`, in sorted value order; manifests are left to the caller.
+    """
+    if isinstance(df, pa.Table):
+        table = df
+    else:
+        table = pa.Table.from_pandas(
+            df, schema=declared_schema(df, table_config), preserve_index=False
         )
-        valid_dates = dates.dropna()
-        if not valid_dates.empty:
-            min_event_dt = valid_dates.min().date().isoformat()
-            max_event_dt = valid_dates.max().date().isoformat()
-
-    total_rows_written = 0
-    checksum_values: list[str] = []
-
-    for index, chunk in enumerate(chunks):
-        source_file = None
-        if source_prefix:
-            source_file = f"{source_prefix}/part-{index:04d}.parquet"
-        enriched = prepare_dataframe_with_lineage(
-            chunk,
+    values = pd.Series(partition_values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Categoricals group in category order (first seen, for Arrow dictionaries)
+        values = values.cat.reorder_categories(values.cat.categories.sort_values())
+    groups = values.groupby(values, sort=True, observed=True).indices
+
+    results: dict[str, PartitionWriteResult] = {}
+    if not groups:
+        return results
+    ingestion_ts = utc_now_iso()
+    bytes_per_row = probe_bytes_per_row(
+        table, table_config=table_config, batch_id=batch_id, ingestion_ts=ingestion_ts
+    )
+    for value, positions in groups.items():
+        partition_path = f"{table_config.table_name}/{partition_column}={value}"
+        writer = PartitionStreamWriter(
             table_config=table_config,
+            output_root=output_root,
+            partition_path=partition_path,
             batch_id=batch_id,
+            target_size_mb=target_size_mb,
+            source_prefix=f"{source_prefix}/{partition_path}" if source_prefix else None,
+            checksum_mode=checksum_mode,
+            sort_columns=table_config.default_sort_columns if sort else (),
             ingestion_ts=ingestion_ts,
-            source_prefix=source_file,
+            bytes_per_row=bytes_per_row,
         )
-        filename = partition_dir / f"part-{index:04d}.parquet"
-        enriched.to_parquet(filename, index=False)
-        total_rows_written += len(enriched)
-        checksum_values.append(compute_checksum(enriched))
-        manifest_files.append(
-            ManifestFile(
-                path=str(filename.relative_to(output_root)),
-                rows=len(enriched),
-                checksum=checksum_values[-1],
-            )
-        )
-
-    return manifest_files, min_event_dt, max_event_dt, total_rows_written, checksum_values
+        writer.write(table.take(positions))
+        results[partition_path] = writer.close()
+    return results
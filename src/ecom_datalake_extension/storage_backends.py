@@ -0,0 +1,159 @@
+"""
+Storage backends that partition uploads write to.
+
+A backend lists what already exists under a prefix (so unchanged files can be
+skipped) and uploads one local file to a key. `GCSBackend` in `gcs_uploader`
+is the production target; `LocalBackend` and `FsspecBackend` let the same
+upload path (concurrency, commit ordering, skip-unchanged) run offline.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+try:
+    import google_crc32c  # type: ignore
+except ImportError:  # pragma: no cover - md5 is compared instead
+    google_crc32c = None
+
+
+class StorageDependencyError(RuntimeError):
+    """
+    Raised when the client library a storage backend needs is not installed.
+    """
+
+
+@dataclass(frozen=True)
+class RemoteObject:
+    """
+    Size and base64 digests of an object already stored under an upload prefix.
+    """
+
+    size: int
+    crc32c: str | None = None
+    md5: str | None = None
+
+
+class StorageBackend(Protocol):
+    def uri(self, key: str) -> str:
+        """Returns a display URI such as `gs://bucket/key` for an object key."""
+        ...
+
+    def list(self, prefix: str) -> dict[str, RemoteObject]:
+        """Returns the objects under `prefix/`, keyed by their path relative to it."""
+        ...
+
+    def upload(self, path: Path, key: str) -> None:
+        """Stores the local file at `path` under `key`."""
+        ...
+
+
+def file_digests(path: Path, block_size: int = 1024 * 1024) -> tuple[str | None, str]:
+    """
+    Returns the base64 CRC32C (None without google-crc32c) and MD5 of a file.
+    """
+    crc32c = google_crc32c.Checksum() if google_crc32c is not None else None
+    md5 = hashlib.md5()
+    with path.open("rb") as fp:
+        for block in iter(lambda: fp.read(block_size), b""):
+            if crc32c is not None:
+                crc32c.update(block)
+            md5.update(block)
+    return (
+        base64.b64encode(crc32c.digest()).decode("ascii") if crc32c is not None else None,
+        base64.b64encode(md5.digest()).decode("ascii"),
+    )
+
+
+def matches_remote(path: Path, remote: RemoteObject | None) -> bool:
+    """
+    True when `remote` has the local file's size and CRC32C (or MD5 if it has no CRC32C).
+    """
+    if remote is None or remote.size != path.stat().st_size:
+        return False
+    crc32c, md5 = file_digests(path)
+    if remote.crc32c and crc32c:
+        return remote.crc32c == crc32c
+    return bool(remote.md5) and remote.md5 == md5
+
+
+class LocalBackend:
+    """
+    Treats a local directory as the bucket; keys become paths below `root`.
+
+    Files are copied beside their destination and renamed into place, so a
+    reader never sees a partially written object.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root).resolve()
+
+    def uri(self, key: str) -> str:
+        return (self.root / key).as_uri()
+
+    def list(self, prefix: str) -> dict[str, RemoteObject]:
+        base = self.root / prefix.strip("/")
+        if not base.is_dir():
+            return {}
+        objects = {}
+        for path in base.rglob("*"):
+            if path.is_file() and not path.name.endswith(".partial"):
+                _, md5 = file_digests(path)
+                objects[path.relative_to(base).as_posix()] = RemoteObject(
+                    size=path.stat().st_size, md5=md5
+                )
+        return objects
+
+    def upload(self, path: Path, key: str) -> None:
+        destination = self.root / key
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        partial = destination.with_name(f".{destination.name}.partial")
+        shutil.copyfile(path, partial)
+        os.replace(partial, destination)
+
+
+class FsspecBackend:
+    """
+    Uploads to any fsspec filesystem URL (`memory://`, `s3://`, `abfs://`, ...).
+
+    Skip-unchanged uses the `crc32c`/`md5Hash` fields a filesystem reports in
+    its listings; where it reports neither, every file is uploaded.
+    """
+
+    def __init__(self, url: str, **storage_options: object) -> None:
+        try:
+            import fsspec  # type: ignore
+        except ImportError as exc:
+            raise StorageDependencyError(
+                "fsspec is required for this storage URL. "
+                "Install with `pip install ecom-datalake-extension[fsspec]`."
+            ) from exc
+        self.url = url.rstrip("/")
+        self.fs, self.root = fsspec.core.url_to_fs(self.url, **storage_options)
+        self.root = self.root.rstrip("/")
+
+    def uri(self, key: str) -> str:
+        return f"{self.url}/{key}".rstrip("/")
+
+    def list(self, prefix: str) -> dict[str, RemoteObject]:
+        base = f"{self.root}/{prefix.strip('/')}".rstrip("/")
+        if not self.fs.exists(base):
+            return {}
+        objects = {}
+        for name, info in self.fs.find(base, detail=True).items():
+            relative = name.rstrip("/")[len(base.rstrip("/")) :].lstrip("/")
+            objects[relative] = RemoteObject(
+                size=int(info.get("size") or 0),
+                crc32c=info.get("crc32c"),
+                md5=info.get("md5Hash"),
+            )
+        return objects
+
+    def upload(self, path: Path, key: str) -> None:
+        self.fs.put_file(str(path), f"{self.root}/{key}")
@@ -0,0 +1,423 @@
+"""
+Arrow-native CSV-to-Parquet export.
+
+Tables stay in Arrow from CSV read through date routing, lineage columns and
+the Parquet write. CSVs are either loaded whole (`--engine arrow`) or streamed
+in record batches with memory bounded by the read block size (`--streaming`).
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date
+from pathlib import Path
+from typing import TypeVar
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+from .config import (
+    DEFAULT_CHECKSUM_MODE,
+    DEFAULT_STREAM_BLOCK_MB,
+    DEFAULT_TARGET_SIZE_MB,
+    TableExportConfig,
+)
+from .parquet_writer import (
+    PartitionStreamWriter,
+    PartitionWriteResult,
+    column_arrow_types,
+)
+
+_T = TypeVar("_T")
+
+# pandas' default `na_values`; Arrow's defaults lack "None" and "<NA>"
+_PANDAS_NA_VALUES = (
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+)
+
+
+class SchemaMismatchWarning(UserWarning):
+    """
+    A CSV could not be parsed with its table's declared column types.
+    """
+
+
+def _csv_options(
+    csv_path: Path,
+    *,
+    block_size_mb: int,
+    include_columns: Sequence[str] | None,
+    table_config: TableExportConfig | None = None,
+) -> tuple[pacsv.ReadOptions, pacsv.ConvertOptions]:
+    """
+    Builds CSV read options from the table's declared columns.
+
+    Undeclared columns are inferred from the first block; date, timestamp,
+    and all-null ones are pinned to strings so that later blocks cannot
+    disagree with the inferred schema and values match what `pd.read_csv`
+    would produce. Empty cells and pandas' other default NA markers are read
+    as nulls in every column, strings included.
+    """
+    read_options = pacsv.ReadOptions(block_size=max(1, block_size_mb) * 1024 * 1024)
+    declared: dict[str, pa.DataType] = {}
+    timestamp_parsers: list[str] = []
+    if table_config is not None:
+        # Integers are parsed as floats so null-bearing columns written by pandas
+        # ("2.0") still load; `conform_table` casts them back to int64.
+        declared = {
+            name: pa.float64() if pa.types.is_int64(arrow_type) else arrow_type
+            for name, arrow_type in column_arrow_types(table_config).items()
+        }
+        timestamp_parsers = [
+            column.timestamp_format
+            for column in table_config.columns
+            if column.type == "timestamp" and column.timestamp_format
+        ]
+
+    def convert_options(column_types: dict[str, pa.DataType]) -> pacsv.ConvertOptions:
+        return pacsv.ConvertOptions(
+            include_columns=list(include_columns or []),
+            column_types=column_types,
+            timestamp_parsers=timestamp_parsers or None,
+            null_values=list(_PANDAS_NA_VALUES),
+            strings_can_be_null=True,
+        )
+
+    reader = pacsv.open_csv(
+        csv_path, read_options=read_options, convert_options=convert_options(declared)
+    )
+    overrides = {
+        field.name: pa.string()
+        for field in reader.schema
+        if field.name not in declared
+        and (pa.types.is_null(field.type) or pa.types.is_temporal(field.type))
+    }
+    reader.close()
+    return read_options, convert_options({**declared, **overrides})
+
+
+def conform_table(table: pa.Table, table_config: TableExportConfig | None) -> pa.Table:
+    """
+    Casts declared int64 columns that were parsed as floats back to int64.
+
+    Columns holding fractional values keep their parsed type, like any other
+    column whose values do not fit its declaration.
+    """
+    if table_config is None:
+        return table
+    for name, arrow_type in column_arrow_types(table_config).items():
+        index = table.schema.get_field_index(name)
+        if index < 0 or not pa.types.is_int64(arrow_type):
+            continue
+        if pa.types.is_floating(table.schema.field(index).type):
+            try:
+                table = table.set_column(index, name, pc.cast(table.column(index), arrow_type))
+            except pa.ArrowInvalid:
+                continue
+    return table
+
+
+def _typed_or_inferred(
+    read: Callable[[TableExportConfig | None], _T],
+    csv_path: Path,
+    table_config: TableExportConfig | None,
+) -> _T:
+    """
+    Runs `read(table_config)`, retrying with inferred types if the declared ones do not fit.
+    """
+    if table_config is None or not table_config.columns:
+        return read(None)
+    try:
+        return read(table_config)
+    except pa.ArrowInvalid as exc:
+        warnings.warn(
+            f"{csv_path.name} does not match the declared columns of "
+            f"{table_config.table_name} ({exc}); falling back to type inference",
+            SchemaMismatchWarning,
+            stacklevel=3,
+        )
+        return read(None)
+
+
+def open_csv_stream(
+    csv_path: Path,
+    *,
+    block_size_mb: int = DEFAULT_STREAM_BLOCK_MB,
+    include_columns: Sequence[str] | None = None,
+    table_config: TableExportConfig | None = None,
+) -> pacsv.CSVStreamingReader:
+    """
+    Opens a CSV as a record batch stream typed by `table_config.columns`.
+
+    Declared types are checked against the first block only; a later block
+    that does not parse raises `pyarrow.ArrowInvalid` while iterating.
+    Batches still need `conform_table`, which `iter_csv_batches` applies.
+    """
+
+    def read(config: TableExportConfig | None) -> pacsv.CSVStreamingReader:
+        read_options, convert_options = _csv_options(
+            csv_path,
+            block_size_mb=block_size_mb,
+            include_columns=include_columns,
+            table_config=config,
+        )
+        return pacsv.open_csv(csv_path, read_options=read_options, convert_options=convert_options)
+
+    return _typed_or_inferred(read, csv_path, table_config)
+
+
+def read_csv_table(
+    csv_path: Path,
+    *,
+    block_size_mb: int = DEFAULT_STREAM_BLOCK_MB,
+    include_columns: Sequence[str] | None = None,
+    table_config: TableExportConfig | None = None,
+) -> pa.Table:
+    """
+    Reads a whole CSV into one Arrow table using the multi-threaded reader.
+
+    Declared column types from `table_config` are applied while parsing; a
+    file that does not fit them is re-read with inferred types and a
+    `SchemaMismatchWarning`.
+    """
+
+    def read(config: TableExportConfig | None) -> pa.Table:
+        read_options, convert_options = _csv_options(
+            csv_path,
+            block_size_mb=block_size_mb,
+            include_columns=include_columns,
+            table_config=config,
+        )
+        table = pacsv.read_csv(csv_path, read_options=read_options, convert_options=convert_options)
+        return conform_table(table, config)
+
+    return _typed_or_inferred(read, csv_path, table_config)
+
+
+def iter_csv_batches(
+    csv_path: Path,
+    *,
+    block_size_mb: int = DEFAULT_STREAM_BLOCK_MB,
+    include_columns: Sequence[str] | None = None,
+    table_config: TableExportConfig | None = None,
+) -> Iterator[pa.Table]:
+    """
+    Yields a CSV file as a sequence of single-batch Arrow tables.
+    """
+    reader = open_csv_stream(
+        csv_path,
+        block_size_mb=block_size_mb,
+        include_columns=include_columns,
+        table_config=table_config,
+    )
+    for batch in reader:
+        if batch.num_rows:
+            yield conform_table(pa.Table.from_batches([batch]), table_config)
+
+
+def date_keys(values: pa.ChunkedArray | pa.Array) -> pa.Array:
+    """
+    Arrow equivalent of `values.astype(str).str[:10]`.
+    """
+    return pc.utf8_slice_codeunits(pc.cast(values, pa.string()), 0, 10)
+
+
+class ParentDateIndex:
+    """
+    Maps parent identifiers to their partition date for child-table routing.
+    """
+
+    def __init__(self, ids: pa.Array, dates: pa.Array) -> None:
+        self.ids = ids
+        self.dates = dates
+
+    @classmethod
+    def from_table(
+        cls,
+        table: pa.Table,
+        *,
+        join_key: str,
+        date_column: str,
+        dates: Sequence[str],
+    ) -> ParentDateIndex:
+        """
+        Builds the index from an in-memory parent table.
+        """
+        keys = date_keys(table.column(date_column))
+        mask = pc.is_in(keys, value_set=pa.array(list(dates), type=pa.string()))
+        return cls(
+            pc.filter(table.column(join_key), mask).combine_chunks(),
+            pc.filter(keys, mask).combine_chunks(),
+        )
+
+    @classmethod
+    def from_csv(
+        cls,
+        csv_path: Path,
+        *,
+        join_key: str,
+        date_column: str,
+        dates: Sequence[str],
+        block_size_mb: int = DEFAULT_STREAM_BLOCK_MB,
+    ) -> ParentDateIndex:
+        """
+        Builds the index from a column-projected scan of the parent CSV.
+        """
+        parts = [
+            cls.from_table(table, join_key=join_key, date_column=date_column, dates=dates)
+            for table in iter_csv_batches(
+                csv_path, block_size_mb=block_size_mb, include_columns=[join_key, date_column]
+            )
+        ]
+        if not parts:
+            return cls(pa.array([], type=pa.string()), pa.array([], type=pa.string()))
+        return cls(
+            pa.concat_arrays([part.ids for part in parts]),
+            pa.concat_arrays([part.dates for part in parts]),
+        )
+
+    def lookup(self, values: pa.ChunkedArray | pa.Array) -> pa.Array:
+        """
+        Returns the partition date for each child key (null when unknown).
+        """
+        if values.type != self.ids.type:
+            values = pc.cast(values, self.ids.type)
+        positions = pc.index_in(values, value_set=self.ids)
+        return pc.take(self.dates, positions)
+
+
+def route_table(
+    table: pa.Table,
+    *,
+    table_config: TableExportConfig,
+    ingest_dates: Sequence[date],
+    parent_index: ParentDateIndex | None = None,
+    join_key: str | None = None,
+) -> Iterator[tuple[date, pa.Table]]:
+    """
+    Splits an Arrow table into its `ingest_dt=` partitions.
+
+    Rows are routed by the table's event date column, by `parent_index` for
+    child tables, or replicated to every date when neither applies (matching
+    the pandas exporter). Dates without rows are not yielded.
+    """
+    by_key = {current.isoformat(): current for current in ingest_dates}
+    date_column = table_config.event_date_column
+    if date_column and date_column in table.column_names:
+        keys = date_keys(table.column(date_column))
+    elif parent_index is not None and join_key:
+        keys = parent_index.lookup(table.column(join_key))
+    else:
+        for current in ingest_dates:
+            yield current, table
+        return
+
+    for key in pc.unique(keys).to_pylist():
+        if key in by_key:
+            yield by_key[key], table.filter(pc.equal(keys, key))
+
+
+def write_table_partitions(
+    tables: Iterable[pa.Table],
+    *,
+    table_config: TableExportConfig,
+    ingest_dates: Sequence[date],
+    output_root: Path,
+    batch_id: str,
+    source_prefix: str | None = None,
+    target_size_mb: int = DEFAULT_TARGET_SIZE_MB,
+    parent_index: ParentDateIndex | None = None,
+    join_key: str | None = None,
+    checksum_mode: str = DEFAULT_CHECKSUM_MODE,
+    sort: bool = False,
+) -> dict[date, PartitionWriteResult]:
+    """
+    Routes Arrow tables of one source table into per-partition writers.
+
+    Only dates that received rows are returned.
+    """
+    writers: dict[date, PartitionStreamWriter] = {}
+
+    def writer_for(current: date) -> PartitionStreamWriter:
+        if current not in writers:
+            partition_prefix = None
+            if source_prefix:
+                partition_prefix = (
+                    f"{source_prefix}/{table_config.table_name}/ingest_dt={current:%Y-%m-%d}"
+                )
+            writers[current] = PartitionStreamWriter(
+                table_config=table_config,
+                output_root=output_root,
+                partition_path=f"{table_config.table_name}/ingest_dt={current:%Y-%m-%d}",
+                batch_id=batch_id,
+                target_size_mb=target_size_mb,
+                source_prefix=partition_prefix,
+                checksum_mode=checksum_mode,
+                sort_columns=table_config.default_sort_columns if sort else (),
+            )
+        return writers[current]
+
+    for table in tables:
+        for current, piece in route_table(
+            table,
+            table_config=table_config,
+            ingest_dates=ingest_dates,
+            parent_index=parent_index,
+            join_key=join_key,
+        ):
+            writer_for(current).write(piece)
+
+    return {current: writers[current].close() for current in sorted(writers)}
+
+
+def stream_table_partitions(
+    csv_path: Path,
+    *,
+    table_config: TableExportConfig,
+    ingest_dates: Sequence[date],
+    output_root: Path,
+    batch_id: str,
+    source_prefix: str | None = None,
+    target_size_mb: int = DEFAULT_TARGET_SIZE_MB,
+    block_size_mb: int = DEFAULT_STREAM_BLOCK_MB,
+    parent_index: ParentDateIndex | None = None,
+    join_key: str | None = None,
+    checksum_mode: str = DEFAULT_CHECKSUM_MODE,
+    sort: bool = False,
+) -> dict[date, PartitionWriteResult]:
+    """
+    Streams one CSV into its `ingest_dt=` partitions, one record batch at a time.
+    """
+    return write_table_partitions(
+        iter_csv_batches(csv_path, block_size_mb=block_size_mb, table_config=table_config),
+        table_config=table_config,
+        ingest_dates=ingest_dates,
+        output_root=output_root,
+        batch_id=batch_id,
+        source_prefix=source_prefix,
+        target_size_mb=target_size_mb,
+        parent_index=parent_index,
+        join_key=join_key,
+        checksum_mode=checksum_mode,
+        sort=sort,
+    )
@@ -0,0 +1,160 @@
+"""
+Adaptive in-flight limit and bandwidth cap for partition uploads.
+
+`UploadController` gates each file upload through `slot()`. With `adaptive`
+it grows the number of uploads allowed in flight while latency stays near the
+best seen, and cuts it when the store throttles (429/503) or latency inflates,
+in the spirit of TCP congestion control. An optional bandwidth cap paces when
+each upload may start so the run's average rate stays under it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+_MIB = 1024 * 1024
+# Multiplicative decrease on throttling, as in CUBIC.
+_DECREASE_FACTOR = 0.7
+
+_local = threading.local()
+
+
+def report_throttle() -> None:
+    """
+    Tells the controller of the calling upload that the store pushed back.
+
+    Backends call this when they retry internally after a 429/503, which
+    would otherwise be invisible to the controller. Outside `slot()` it is a
+    no-op.
+    """
+    controller = getattr(_local, "controller", None)
+    if controller is not None:
+        _local.throttled = True
+        controller.throttled(_local.epoch)
+
+
+class UploadController:
+    """
+    Limits in-flight uploads (adaptively or fixed) and optionally their bandwidth.
+
+    Adaptive mode starts at `initial` (default 1) and doubles the limit after
+    every `limit` fast uploads until the first slowdown, then adds one per
+    round. A throttling signal or a failed upload cuts it to 70%; an upload
+    whose seconds-per-MiB exceeds `latency_tolerance` times the best seen
+    lowers it by one. Each cut starts a new epoch: signals and completions
+    from uploads started before it are ignored, so one burst of errors cuts
+    once and growth resumes only on evidence gathered at the new limit. The
+    limit stays within `[1, max_concurrency]`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        adaptive: bool = True,
+        initial: int | None = None,
+        max_bandwidth_mbps: float | None = None,
+        latency_tolerance: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.adaptive = adaptive
+        initial = initial or (1 if adaptive else self.max_concurrency)
+        self.limit = min(self.max_concurrency, max(1, initial))
+        self.peak = self.limit
+        self.throttle_events = 0
+        self._bytes_per_second = max_bandwidth_mbps * _MIB if max_bandwidth_mbps else None
+        self._latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._sleep = sleep
+        self._in_flight = 0
+        self._successes = 0
+        self._slow_start = True
+        self._best_cost: float | None = None
+        self._epoch = 0
+        self._send_at = float("-inf")
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self, nbytes: int) -> Iterator[None]:
+        """
+        Holds one in-flight upload of `nbytes` for the duration of the block.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            epoch = self._epoch
+        _local.controller, _local.epoch, _local.throttled = self, epoch, False
+        try:
+            self._pace(nbytes)
+            started = self._clock()
+            try:
+                yield
+            except BaseException:
+                with self._condition:
+                    self._decrease(epoch, lambda limit: int(limit * _DECREASE_FACTOR))
+                raise
+            # An upload that had to be retried after throttling is not a fast one
+            if not _local.throttled:
+                self._observe(epoch, self._clock() - started, nbytes)
+        finally:
+            _local.controller = None
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def throttled(self, epoch: int | None = None) -> None:
+        """
+        Records a throttling response for an upload started in `epoch` (default: now).
+        """
+        with self._condition:
+            self.throttle_events += 1
+            self._decrease(
+                self._epoch if epoch is None else epoch,
+                lambda limit: int(limit * _DECREASE_FACTOR),
+            )
+
+    def _pace(self, nbytes: int) -> None:
+        if self._bytes_per_second is None:
+            return
+        with self._condition:
+            now = self._clock()
+            start = max(now, self._send_at)
+            self._send_at = start + nbytes / self._bytes_per_second
+        if start > now:
+            self._sleep(start - now)
+
+    def _observe(self, epoch: int, seconds: float, nbytes: int) -> None:
+        if not self.adaptive:
+            return
+        # Normalize by size so small marker files and large parts compare fairly
+        cost = seconds / max(nbytes / _MIB, 1.0)
+        with self._condition:
+            if self._best_cost is None or cost < self._best_cost:
+                self._best_cost = cost
+            if epoch != self._epoch:
+                return
+            if cost > self._latency_tolerance * self._best_cost:
+                self._decrease(epoch, lambda limit: limit - 1)
+                return
+            self._successes += 1
+            if self._successes < self.limit:
+                return
+            self._successes = 0
+            grown = self.limit * 2 if self._slow_start else self.limit + 1
+            self.limit = min(self.max_concurrency, grown)
+            self.peak = max(self.peak, self.limit)
+            self._condition.notify_all()
+
+    def _decrease(self, epoch: int, shrink: Callable[[int], int]) -> None:
+        # Caller holds the condition
+        if not self.adaptive or epoch != self._epoch:
+            return
+        self._epoch += 1
+        self._slow_start = False
+        self._successes = 0
+        self.limit = max(1, shrink(self.limit))
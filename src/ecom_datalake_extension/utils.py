@@ -5,46 +5,250 @@ Shared helper utilities.
 from __future__ import annotations
 
 import hashlib
-import math
-from collections.abc import Iterator
+import io
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 
-def estimate_row_size_bytes(df: pd.DataFrame) -> int:
+def partition_by_keys(
+    df: pd.DataFrame,
+    keys: pd.Series,
+    wanted: Iterable[str] | None = None,
+) -> dict[str, pd.DataFrame]:
     """
-    Approximates the average row size by using DataFrame memory usage.
+    Splits a DataFrame into frames keyed by a per-row partition key in one pass.
+
+    Rows whose key is missing are dropped. When `wanted` is given, only those
+    groups are materialized.
     """
-    total_bytes = df.memory_usage(deep=True).sum()
-    rows = max(len(df), 1)
-    return max(1, math.ceil(total_bytes / rows))
+    positions = keys.groupby(keys, sort=False).indices
+    selected = positions.keys() if wanted is None else set(wanted)
+    return {key: df.take(positions[key]) for key in selected if key in positions}
 
 
-def chunk_dataframe(df: pd.DataFrame, rows_per_chunk: int) -> list[pd.DataFrame]:
+def partition_by_date(
+    df: pd.DataFrame,
+    date_column: str,
+    dates: Iterable[str] | None = None,
+) -> dict[str, pd.DataFrame]:
     """
-    Splits a DataFrame into chunks of roughly equal size by row count.
+    Splits a DataFrame into per-day frames keyed by `YYYY-MM-DD` in one pass.
+
+    The date key is derived once from the first ten characters of the column
+    (e.g. "2020-01-05T23:20:04" -> "2020-01-05") and grouped, so callers can
+    look up many dates without rescanning the table. When `dates` is given,
+    only those groups are materialized.
     """
-    if rows_per_chunk <= 0 or len(df) <= rows_per_chunk:
-        return [df]
-    chunks: list[pd.DataFrame] = []
-    for start in range(0, len(df), rows_per_chunk):
-        end = start + rows_per_chunk
-        chunks.append(df.iloc[start:end].copy())
-    return chunks
+    return partition_by_keys(df, df[date_column].astype(str).str[:10], dates)
 
 
-def iter_csv_tables(source_dir: str) -> Iterator[tuple[str, pd.DataFrame]]:
+def parent_date_index(parent_df: pd.DataFrame, join_key: str, date_column: str) -> pd.Series:
     """
-    Yields pairs of table name and DataFrame for every CSV in a directory.
+    Maps each parent `join_key` value to its `YYYY-MM-DD` partition date.
+
+    Map a child's join column through the result to get per-row partition
+    keys for `partition_by_keys`.
     """
-    path = Path(source_dir)
-    for csv_path in sorted(path.glob("*.csv")):
-        yield csv_path.stem, pd.read_csv(csv_path)
+    dates = parent_df[date_column].astype(str).str[:10].to_numpy()
+    index = pd.Series(dates, index=parent_df[join_key].to_numpy())
+    return index[~index.index.duplicated()]
+
+
+def _serialize_records(df: pd.DataFrame) -> str:
+    return df.to_json(orient="records", date_format="iso", date_unit="s", default_handler=str)
 
 
 def compute_checksum(df: pd.DataFrame) -> str:
     """Compute a stable SHA256 checksum over the DataFrame contents."""
-    serialized = df.to_json(orient="records", date_format="iso", date_unit="s", default_handler=str)
+    serialized = _serialize_records(df)
     digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
     return digest
+
+
+class ChecksumAccumulator:
+    """
+    Incremental `compute_checksum` over a sequence of DataFrame chunks.
+
+    Feeding the chunks of a frame in order yields the same digest as hashing
+    the concatenated frame, without ever holding it in memory.
+    """
+
+    def __init__(self) -> None:
+        self._digest = hashlib.sha256()
+        self._has_rows = False
+
+    def update(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        body = _serialize_records(df)[1:-1]
+        self._digest.update(b"," if self._has_rows else b"[")
+        self._digest.update(body.encode("utf-8"))
+        self._has_rows = True
+
+    def hexdigest(self) -> str:
+        digest = self._digest.copy()
+        digest.update(b"]" if self._has_rows else b"[]")
+        return digest.hexdigest()
+
+
+PARQUET_CHECKSUM_ALGORITHM = "sha256-parquet"
+
+
+def format_checksum(algorithm: str, hexdigest: str) -> str:
+    """
+    Tags a digest with its algorithm, e.g. `sha256-parquet:<hex>`.
+
+    Untagged checksums in older manifests are legacy `compute_checksum` values.
+    """
+    return f"{algorithm}:{hexdigest}"
+
+
+class HashingFileWriter(io.RawIOBase):
+    """
+    Binary file sink that SHA-256 hashes every byte on its way to disk.
+
+    Pass it to `to_parquet`/`ParquetWriter` to checksum the encoded file
+    without re-reading it or serializing the data a second time.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self._fp = Path(path).open("wb")
+        self._digest = hashlib.sha256()
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._digest.update(data)
+        written = self._fp.write(data)
+        self.bytes_written += written
+        return written
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fp.close()
+        super().close()
+
+    def checksum(self) -> str:
+        return format_checksum(PARQUET_CHECKSUM_ALGORITHM, self._digest.hexdigest())
+
+
+def file_checksum(path: Path, block_size: int = 1024 * 1024) -> str:
+    """
+    Tagged SHA-256 of a file's bytes, read in fixed-size blocks.
+    """
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fp:
+        for block in iter(lambda: fp.read(block_size), b""):
+            digest.update(block)
+    return format_checksum(PARQUET_CHECKSUM_ALGORITHM, digest.hexdigest())
+
+
+class _DigestSink(io.RawIOBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self.digest = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.digest.update(data)
+        return memoryview(data).nbytes
+
+
+def input_fingerprint(data: pd.DataFrame | pa.Table, settings: str = "") -> str:
+    """
+    SHA-256 over a partition's input rows and the settings that shape its output.
+
+    DataFrames are hashed with `pd.util.hash_pandas_object` and Arrow tables
+    by their IPC stream bytes, so fingerprints only compare within an engine.
+    """
+    if isinstance(data, pa.Table):
+        sink = _DigestSink()
+        with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), data.schema) as writer:
+            writer.write_table(data)
+        digest = sink.digest
+    else:
+        digest = hashlib.sha256()
+        digest.update(repr(list(data.dtypes.astype(str).items())).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    digest.update(settings.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def verify_checksum(path: Path, checksum: str) -> bool:
+    """
+    Verifies a written Parquet file against a manifest checksum of any vintage.
+    """
+    algorithm, separator, _ = checksum.partition(":")
+    if not separator:
+        return compute_checksum(pd.read_parquet(path)) == checksum
+    if algorithm == PARQUET_CHECKSUM_ALGORITHM:
+        return file_checksum(path) == checksum
+    raise ValueError(f"Unsupported checksum algorithm '{algorithm}'")
+
+
+class OrderedTaskPool:
+    """
+    Runs tasks inline or on a process pool, delivering results in submission order.
+
+    With `workers <= 1` every task runs immediately in-process. Otherwise at
+    most `2 * workers` tasks are in flight; further submissions first complete
+    the oldest task so pending arguments do not accumulate in memory. The
+    `on_done` callbacks always run in the parent process, in submission order,
+    which keeps side effects (manifests, hooks, logging) deterministic.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        self.workers = max(1, workers)
+        self._executor: ProcessPoolExecutor | None = None
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context("spawn"),
+            )
+        self._pending: deque[tuple[Future[Any], Callable[[Any], None]]] = deque()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        /,
+        *args: Any,
+        on_done: Callable[[Any], None],
+        **kwargs: Any,
+    ) -> None:
+        if self._executor is None:
+            on_done(fn(*args, **kwargs))
+            return
+        self._pending.append((self._executor.submit(fn, *args, **kwargs), on_done))
+        while len(self._pending) > 2 * self.workers:
+            self._complete_oldest()
+
+    def _complete_oldest(self) -> None:
+        future, on_done = self._pending.popleft()
+        on_done(future.result())
+
+    def drain(self) -> None:
+        while self._pending:
+            self._complete_oldest()
+
+    def __enter__(self) -> OrderedTaskPool:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        try:
+            if exc_type is None:
+                self.drain()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
@@ -1,10 +1,13 @@
 import json
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pyarrow.parquet as pq
 from click.testing import CliRunner
+from ecom_datalake_extension import cli as cli_module
 from ecom_datalake_extension.cli import export_raw_cmd, upload_raw_cmd
+from ecom_datalake_extension.gcs_uploader import UploadResult
 
 
 def test_export_raw_cli(tmp_path):
@@ -84,6 +87,22 @@ def test_upload_raw_cli_dry_run(tmp_path):
     assert "dry-run" in result.output
 
 
+@patch("ecom_datalake_extension.gcs_uploader._ensure_storage_client")
+def test_upload_raw_cli_dry_run_never_opens_the_store(mock_client, tmp_path):
+    source_dir = tmp_path / "output" / "raw"
+    (source_dir / "orders" / "ingest_dt=2024-02-15").mkdir(parents=True)
+
+    for extra in (["--dry-run"], ["--ingest-date", "2024-03-01"]):
+        result = CliRunner().invoke(
+            upload_raw_cmd,
+            ["--source", str(source_dir), "--bucket", "test-bucket", "--concurrency", "4"]
+            + ["--ingest-date", "2024-02-15", *extra],
+        )
+        assert result.exit_code == 0, result.output
+
+    mock_client.assert_not_called()
+
+
 @patch("ecom_datalake_extension.cli.upload_partition")
 def test_upload_raw_cli_invokes_uploader(mock_upload, tmp_path):
     source_dir = tmp_path / "output" / "raw"
@@ -202,3 +221,351 @@ def write_manifest_summary(context):
     assert summary_file.read_text() == "orders|1"
 
     sys.path.pop(0)
+
+
+def test_export_raw_cli_partitions_by_event_date(tmp_path):
+    source_dir = tmp_path / "source"
+    target_dir = tmp_path / "target"
+    source_dir.mkdir()
+
+    data = pd.DataFrame(
+        [
+            {
+                "order_id": f"ORDER-{day}-{n}",
+                "order_date": f"2024-02-{day:02d}T10:0{n}:00",
+                "customer_id": "CUST-1",
+                "gross_total": 10.0,
+                "net_total": 9.0,
+                "order_channel": "Web",
+            }
+            for day, count in ((15, 2), (16, 1))
+            for n in range(count)
+        ]
+    )
+    data.to_csv(source_dir / "orders.csv", index=False)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        export_raw_cmd,
+        [
+            "--source",
+            str(source_dir),
+            "--target",
+            str(target_dir),
+            "--start-date",
+            "2024-02-15",
+            "--days",
+            "3",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+
+    first = json.loads(
+        (target_dir / "orders" / "ingest_dt=2024-02-15" / "_MANIFEST.json").read_text()
+    )
+    second = json.loads(
+        (target_dir / "orders" / "ingest_dt=2024-02-16" / "_MANIFEST.json").read_text()
+    )
+    assert first["total_rows"] == 2
+    assert second["total_rows"] == 1
+    assert not (target_dir / "orders" / "ingest_dt=2024-02-17").exists()
+
+
+def test_export_raw_cli_workers_match_serial(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    pd.DataFrame(
+        [
+            {
+                "order_id": f"ORDER-{day}-{n}",
+                "order_date": f"2024-02-{day:02d}",
+                "customer_id": f"CUST-{n}",
+                "gross_total": 10.0,
+                "net_total": 9.0,
+                "order_channel": "Web",
+            }
+            for day in (15, 16, 17)
+            for n in range(2)
+        ]
+    ).to_csv(source_dir / "orders.csv", index=False)
+
+    runner = CliRunner()
+    outputs = {}
+    for workers in ("1", "2"):
+        target_dir = tmp_path / f"target_{workers}"
+        result = runner.invoke(
+            export_raw_cmd,
+            [
+                "--source",
+                str(source_dir),
+                "--target",
+                str(target_dir),
+                "--start-date",
+                "2024-02-15",
+                "--days",
+                "3",
+                "--batch-id",
+                "batch_workers",
+                "--workers",
+                workers,
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "6 row(s) across 3 partition(s)" in result.output
+        outputs[workers] = target_dir
+
+    for day in (15, 16, 17):
+        relative = f"orders/ingest_dt=2024-02-{day}/part-0000.parquet"
+        serial = pd.read_parquet(outputs["1"] / relative).drop(columns=["ingestion_ts"])
+        parallel = pd.read_parquet(outputs["2"] / relative).drop(columns=["ingestion_ts"])
+        pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_export_raw_cli_compression_override_drops_the_configured_level(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    pd.DataFrame(
+        [
+            {
+                "cart_item_id": n,
+                "cart_id": f"CART-{n}",
+                "product_id": n,
+                "added_at": "2024-02-15T08:00:00",
+                "quantity": 1,
+                "unit_price": 5.0,
+            }
+            for n in range(3)
+        ]
+    ).to_csv(source_dir / "cart_items.csv", index=False)
+
+    runner = CliRunner()
+    # cart_items is configured as zstd level 3; other codecs must not inherit the level
+    for codec, expected in (("snappy", "SNAPPY"), ("none", "UNCOMPRESSED"), ("gzip", "GZIP")):
+        target_dir = tmp_path / codec
+        result = runner.invoke(
+            export_raw_cmd,
+            ["--source", str(source_dir), "--target", str(target_dir)]
+            + ["--dates", "2024-02-15", "--compression", codec],
+        )
+        assert result.exit_code == 0, result.output
+        metadata = pq.ParquetFile(
+            target_dir / "cart_items" / "ingest_dt=2024-02-15" / "part-0000.parquet"
+        ).metadata
+        assert metadata.row_group(0).column(0).compression == expected
+
+
+def test_export_raw_cli_routes_child_tables_via_parent_link(tmp_path):
+    source_dir = tmp_path / "source"
+    target_dir = tmp_path / "target"
+    source_dir.mkdir()
+    pd.DataFrame(
+        [
+            {
+                "return_id": f"RET-{day}",
+                "return_date": f"2024-02-{day:02d}T08:00:00",
+                "order_id": f"ORDER-{day}",
+            }
+            for day in (15, 16)
+        ]
+    ).to_csv(source_dir / "returns.csv", index=False)
+    pd.DataFrame(
+        [
+            {"return_item_id": n, "return_id": return_id, "quantity_returned": 1}
+            for n, return_id in enumerate(["RET-15", "RET-16", "RET-16", "RET-99"])
+        ]
+    ).to_csv(source_dir / "return_items.csv", index=False)
+
+    result = CliRunner().invoke(
+        export_raw_cmd,
+        [
+            "--source",
+            str(source_dir),
+            "--target",
+            str(target_dir),
+            "--dates",
+            "2024-02-15,2024-02-16",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    for day, expected in ((15, [0]), (16, [1, 2])):
+        partition = target_dir / "return_items" / f"ingest_dt=2024-02-{day}"
+        items = pd.read_parquet(partition / "part-0000.parquet")
+        assert items["return_item_id"].tolist() == expected
+
+
+def test_export_raw_cli_incremental_skips_unchanged_partitions(tmp_path):
+    source_dir = tmp_path / "source"
+    target_dir = tmp_path / "target"
+    source_dir.mkdir()
+    orders = pd.DataFrame(
+        [
+            {
+                "order_id": f"ORDER-{day}",
+                "order_date": f"2024-02-{day:02d}",
+                "customer_id": "CUST-1",
+                "gross_total": 10.0,
+                "net_total": 9.0,
+                "order_channel": "Web",
+            }
+            for day in (15, 16)
+        ]
+    )
+    orders.to_csv(source_dir / "orders.csv", index=False)
+    args = ["--source", str(source_dir), "--target", str(target_dir)]
+    args += ["--dates", "2024-02-15,2024-02-16", "--incremental"]
+
+    for engine in ("pandas", "arrow"):
+        runner = CliRunner()
+        first = runner.invoke(export_raw_cmd, [*args, "--engine", engine])
+        assert first.exit_code == 0, first.output
+        manifest_path = target_dir / "orders" / "ingest_dt=2024-02-15" / "_MANIFEST.json"
+        first_manifest = json.loads(manifest_path.read_text())
+        assert first_manifest["input_fingerprint"]
+
+        rerun = runner.invoke(export_raw_cmd, [*args, "--engine", engine])
+        assert rerun.exit_code == 0, rerun.output
+        assert "Skipped 2 unchanged partition(s)" in rerun.output
+        assert json.loads(manifest_path.read_text()) == first_manifest
+
+    orders.loc[1, "net_total"] = 8.0
+    orders.to_csv(source_dir / "orders.csv", index=False)
+    changed = CliRunner().invoke(export_raw_cmd, [*args, "--engine", "arrow"])
+    assert changed.exit_code == 0, changed.output
+    assert "Skipped 1 unchanged partition(s)" in changed.output
+    assert "Wrote 1 file(s) for orders [2024-02-16]" in changed.output
+
+
+def test_export_raw_cli_uploads_committed_partitions(tmp_path):
+    source_dir = tmp_path / "source"
+    target_dir = tmp_path / "target"
+    source_dir.mkdir()
+    pd.DataFrame(
+        [
+            {
+                "order_id": f"ORDER-{day}",
+                "order_date": f"2024-02-{day:02d}",
+                "customer_id": "CUST-1",
+                "gross_total": 10.0,
+                "net_total": 9.0,
+                "order_channel": "Web",
+            }
+            for day in (15, 16)
+        ]
+    ).to_csv(source_dir / "orders.csv", index=False)
+
+    uploaded = []
+    mock_client = MagicMock()
+
+    def make_blob(blob_path):
+        blob = MagicMock()
+        blob.upload_from_filename.side_effect = lambda *args, **kwargs: uploaded.append(blob_path)
+        return blob
+
+    mock_client.bucket.return_value.blob.side_effect = make_blob
+    with patch(
+        "ecom_datalake_extension.gcs_uploader._ensure_storage_client", return_value=mock_client
+    ):
+        result = CliRunner().invoke(
+            export_raw_cmd,
+            ["--source", str(source_dir), "--target", str(target_dir)]
+            + ["--dates", "2024-02-15,2024-02-16", "--engine", "arrow"]
+            + ["--upload-to", "gs://test-bucket/ecom/raw", "--no-csv-cache"],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "across 2 partition(s) → gs://test-bucket/ecom/raw" in result.output
+    for day in (15, 16):
+        prefix = f"ecom/raw/orders/ingest_dt=2024-02-{day}"
+        partition = [path.rsplit("/", 1)[1] for path in uploaded if path.startswith(prefix)]
+        assert partition[-2:] == ["_MANIFEST.json", "_SUCCESS"]
+
+
+def test_export_raw_cli_loads_only_requested_tables_and_parent_keys(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    pd.DataFrame(
+        [
+            {
+                "return_id": f"RET-{day}",
+                "return_date": f"2024-02-{day:02d}T08:00:00",
+                "order_id": f"ORDER-{day}",
+                "refunded_amount": 5.0,
+            }
+            for day in (15, 16)
+        ]
+    ).to_csv(source_dir / "returns.csv", index=False)
+    pd.DataFrame(
+        [
+            {"return_item_id": n, "return_id": return_id, "quantity_returned": 1}
+            for n, return_id in enumerate(["RET-15", "RET-16", "RET-16"])
+        ]
+    ).to_csv(source_dir / "return_items.csv", index=False)
+    pd.DataFrame(
+        [{"order_id": "ORDER-15", "order_date": "2024-02-15", "customer_id": "CUST-1"}]
+    ).to_csv(source_dir / "orders.csv", index=False)
+
+    reads = []
+    real_read = cli_module._read_source_frame
+
+    def recording_read(csv_path, *args, **kwargs):
+        reads.append((csv_path.stem, kwargs.get("columns")))
+        return real_read(csv_path, *args, **kwargs)
+
+    for engine in ("pandas", "arrow"):
+        target_dir = tmp_path / engine
+        with patch.object(cli_module, "_read_source_frame", recording_read):
+            result = CliRunner().invoke(
+                export_raw_cmd,
+                ["--source", str(source_dir), "--target", str(target_dir)]
+                + ["--dates", "2024-02-15,2024-02-16", "--table", "return_items"]
+                + ["--engine", engine],
+            )
+        assert result.exit_code == 0, result.output
+        assert sorted(path.name for path in target_dir.iterdir()) == ["return_items"]
+        for day, expected in ((15, [0]), (16, [1, 2])):
+            partition = target_dir / "return_items" / f"ingest_dt=2024-02-{day}"
+            items = pd.read_parquet(partition / "part-0000.parquet")
+            assert items["return_item_id"].tolist() == expected
+
+    # The parent is read for its join key and date only; orders is never read
+    assert reads == [("return_items", None), ("returns", ["return_id", "return_date"])]
+
+
+@patch("ecom_datalake_extension.cli.upload_partitions")
+def test_upload_raw_cli_uploads_date_range_and_dimensions_in_one_call(mock_upload, tmp_path):
+    source_dir = tmp_path / "output" / "raw"
+    partitions = [
+        "orders/ingest_dt=2024-02-14",
+        "orders/ingest_dt=2024-02-15",
+        "orders/ingest_dt=2024-02-16",
+        "orders/ingest_dt=2024-02-17",
+        "customers/signup_date=2023-12-01",
+        "product_catalog/category=Books",
+    ]
+    for partition in partitions:
+        (source_dir / partition).mkdir(parents=True)
+        (source_dir / partition / "_SUCCESS").write_text("")
+    mock_upload.side_effect = lambda pairs, **kwargs: [
+        UploadResult(files_uploaded=1, bucket="test-bucket", prefix=prefix) for _, prefix in pairs
+    ]
+
+    result = CliRunner().invoke(
+        upload_raw_cmd,
+        ["--source", str(source_dir), "--bucket", "test-bucket"]
+        + ["--start-date", "2024-02-15", "--end-date", "2024-02-16"]
+        + ["--dimensions", "--concurrency", "4"],
+    )
+
+    assert result.exit_code == 0, result.output
+    mock_upload.assert_called_once()
+    prefixes = [prefix for _, prefix in mock_upload.call_args.args[0]]
+    assert prefixes == [
+        "ecom/raw/customers/signup_date=2023-12-01",
+        "ecom/raw/orders/ingest_dt=2024-02-15",
+        "ecom/raw/orders/ingest_dt=2024-02-16",
+        "ecom/raw/product_catalog/category=Books",
+    ]
+    assert mock_upload.call_args.kwargs["concurrency"] == 4
+    assert "Skipped" not in result.output
@@ -0,0 +1,76 @@
+import os
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+from ecom_datalake_extension import csv_cache
+from ecom_datalake_extension.cli import export_raw_cmd
+from ecom_datalake_extension.csv_cache import cache_path_for, load_csv_table
+
+
+def _write_orders(path, net_total=9.0):
+    pd.DataFrame(
+        [
+            {
+                "order_id": f"ORDER-{n}",
+                "order_date": f"2024-02-15T0{n}:00:00",
+                "customer_id": f"CUST-{n}",
+                "gross_total": 10.0,
+                "net_total": net_total,
+                "order_channel": "Web",
+            }
+            for n in range(3)
+        ]
+    ).to_csv(path, index=False)
+
+
+def test_load_csv_table_reuses_cache_until_content_changes(tmp_path, monkeypatch):
+    csv_path = tmp_path / "orders.csv"
+    _write_orders(csv_path)
+    first = load_csv_table(csv_path)
+    assert cache_path_for(csv_path).exists()
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("CSV parsed despite a valid cache")
+
+    monkeypatch.setattr(csv_cache, "read_csv_table", fail_parse)
+    assert load_csv_table(csv_path).equals(first)
+
+    # A touched but identical file is accepted via the content hash
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_csv_table(csv_path).equals(first)
+
+    # ... and the cache now records the new mtime, so the next read skips the hash
+    def fail_hash(*args, **kwargs):
+        raise AssertionError("CSV hashed despite a matching mtime")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(csv_cache, "_content_sha256", fail_hash)
+        assert load_csv_table(csv_path).equals(first)
+
+    _write_orders(csv_path, net_total=8.0)
+    with pytest.raises(AssertionError, match="valid cache"):
+        load_csv_table(csv_path)
+
+
+def test_export_raw_cli_csv_cache_matches_csv_parse(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    _write_orders(source_dir / "orders.csv")
+
+    outputs = {}
+    for mode in ("--no-csv-cache", "--csv-cache", "--csv-cache"):
+        target_dir = tmp_path / f"target{len(outputs)}"
+        result = CliRunner().invoke(
+            export_raw_cmd,
+            ["--source", str(source_dir), "--target", str(target_dir)]
+            + ["--ingest-date", "2024-02-15", "--batch-id", "batch_cache", mode],
+        )
+        assert result.exit_code == 0, result.output
+        partition = target_dir / "orders" / "ingest_dt=2024-02-15" / "part-0000.parquet"
+        outputs[len(outputs)] = pd.read_parquet(partition).drop(columns=["ingestion_ts"])
+
+    assert (source_dir / "orders.arrow").exists()
+    pd.testing.assert_frame_equal(outputs[1], outputs[0])
+    pd.testing.assert_frame_equal(outputs[2], outputs[0])
@@ -0,0 +1,225 @@
+"""
+Tests against the real google-cloud-storage client; skipped without the `gcs` extra.
+"""
+
+import base64
+import datetime
+import functools
+import hashlib
+import http.server
+import json
+import os
+import socket
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+google_crc32c = pytest.importorskip("google_crc32c")
+storage = pytest.importorskip("google.cloud.storage")
+google_credentials = pytest.importorskip("google.auth.credentials")
+google_exceptions = pytest.importorskip("google.auth.exceptions")
+
+from ecom_datalake_extension import gcs_uploader  # noqa: E402
+from ecom_datalake_extension.gcs_uploader import upload_partition  # noqa: E402
+
+AnonymousCredentials = google_credentials.AnonymousCredentials
+
+
+class _FakeGCSHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for GCS object listing and the resumable upload protocol.
+
+    The server drops the connection the first time a chunk starting at an
+    offset in `server.fail_offsets` arrives.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):  # noqa: N802
+        prefix = parse_qs(urlparse(self.path).query).get("prefix", [""])[0]
+        items = [
+            {
+                "name": name,
+                "size": str(len(data)),
+                "crc32c": base64.b64encode(google_crc32c.value(bytes(data)).to_bytes(4, "big")),
+                "md5Hash": base64.b64encode(hashlib.md5(data).digest()),
+            }
+            for name, data in self.server.objects.items()
+            if name.startswith(prefix)
+        ]
+        for item in items:
+            item["crc32c"], item["md5Hash"] = item["crc32c"].decode(), item["md5Hash"].decode()
+        body = json.dumps({"kind": "storage#objects", "items": items}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # noqa: N802
+        metadata = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        session = str(len(self.server.sessions))
+        self.server.sessions[session] = bytearray()
+        self.server.session_names[session] = metadata["name"]
+        location = f"http://127.0.0.1:{self.server.server_port}/session/{session}"
+        self._reply(200, [("Location", location)])
+
+    def do_PUT(self):  # noqa: N802
+        session = self.path.rsplit("/", 1)[1]
+        stored = self.server.sessions[session]
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        span, total = self.headers["Content-Range"].split(" ", 1)[1].split("/")
+        if span != "*":
+            start = int(span.split("-")[0])
+            self.server.chunk_starts.append(start)
+            if start in self.server.fail_offsets:
+                self.server.fail_offsets.discard(start)
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_RDWR)
+                return
+            stored[start:] = data
+        if len(stored) == int(total):
+            self.server.objects[self.server.session_names[session]] = bytes(stored)
+            self._reply(200)
+        else:
+            self._reply(308, [("Range", f"bytes=0-{len(stored) - 1}")] if stored else [])
+
+
+@pytest.fixture
+def fake_gcs():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FakeGCSHandler)
+    server.sessions, server.session_names, server.objects = {}, {}, {}
+    server.chunk_starts, server.fail_offsets = [], set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+def test_upload_partition_resends_only_the_failed_chunk(tmp_path, fake_gcs, monkeypatch):
+    monkeypatch.setattr(gcs_uploader.time, "sleep", lambda seconds: None)
+    partition_dir = tmp_path / "orders" / "ingest_dt=2024-02-15"
+    partition_dir.mkdir(parents=True)
+    payload = os.urandom(1024 * 1024 + 1000)
+    (partition_dir / "part-0000.parquet").write_bytes(payload)
+
+    chunk = 256 * 1024
+    fake_gcs.fail_offsets.add(2 * chunk)
+    client = storage.Client(
+        project="test",
+        credentials=AnonymousCredentials(),
+        client_options={"api_endpoint": f"http://127.0.0.1:{fake_gcs.server_port}"},
+    )
+    result = upload_partition(
+        bucket_name="bucket",
+        prefix="ecom/raw/orders/ingest_dt=2024-02-15",
+        local_partition_dir=partition_dir,
+        chunk_size_mb=0.25,
+        client=client,
+    )
+
+    assert result.files_uploaded == 1
+    assert fake_gcs.objects["ecom/raw/orders/ingest_dt=2024-02-15/part-0000.parquet"] == payload
+    assert fake_gcs.chunk_starts == [0, chunk, 2 * chunk, 2 * chunk, 3 * chunk, 4 * chunk]
+
+
+def test_upload_partition_skips_files_matching_remote_checksums(tmp_path, fake_gcs):
+    partition_dir = tmp_path / "orders" / "ingest_dt=2024-02-15"
+    partition_dir.mkdir(parents=True)
+    (partition_dir / "part-0000.parquet").write_bytes(os.urandom(300 * 1024))
+    (partition_dir / "part-0001.parquet").write_bytes(os.urandom(300 * 1024))
+    client = storage.Client(
+        project="test",
+        credentials=AnonymousCredentials(),
+        client_options={"api_endpoint": f"http://127.0.0.1:{fake_gcs.server_port}"},
+    )
+    upload = functools.partial(
+        upload_partition,
+        bucket_name="bucket",
+        prefix="ecom/raw/orders/ingest_dt=2024-02-15",
+        local_partition_dir=partition_dir,
+        chunk_size_mb=0.25,
+        client=client,
+    )
+    assert upload().files_uploaded == 2
+
+    (partition_dir / "part-0001.parquet").write_bytes(os.urandom(300 * 1024))
+    rerun = upload()
+    assert (rerun.files_uploaded, rerun.files_skipped) == (1, 1)
+    assert (rerun.bytes_uploaded, rerun.bytes_skipped) == (300 * 1024, 300 * 1024)
+    assert len(fake_gcs.sessions) == 3
+
+
+def test_storage_client_is_shared_with_a_pool_sized_for_concurrency(monkeypatch):
+    monkeypatch.setattr(gcs_uploader, "_shared_client", None)
+    monkeypatch.setattr(
+        gcs_uploader.google.auth, "default", lambda scopes: (AnonymousCredentials(), "test")
+    )
+    client = gcs_uploader._ensure_storage_client(2)
+    assert gcs_uploader._ensure_storage_client(16) is client
+    assert gcs_uploader._ensure_storage_client(1) is client
+    assert client._http.get_adapter("https://storage.googleapis.com")._pool_maxsize == 20
+
+
+class _CountingCredentials(google_credentials.Credentials):
+    def __init__(self):
+        super().__init__()
+        self.refreshes = 0
+        self.token = "expired"
+        self.expiry = datetime.datetime(2000, 1, 1)
+
+    def refresh(self, request):
+        time.sleep(0.05)
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+
+
+def test_concurrent_token_refreshes_share_one_request():
+    credentials = _CountingCredentials()
+    gcs_uploader._serialize_refresh(credentials)
+
+    threads = [
+        threading.Thread(target=credentials.before_request, args=(None, "GET", "url", {}))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert credentials.refreshes == 1
+    assert credentials.token == "token-1"
+
+
+def test_missing_credentials_fail_upload_raw_cleanly(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+    from ecom_datalake_extension.cli import upload_raw_cmd
+
+    def no_credentials(scopes):
+        raise google_exceptions.DefaultCredentialsError("not configured")
+
+    monkeypatch.setattr(gcs_uploader, "_shared_client", None)
+    monkeypatch.setattr(gcs_uploader.google.auth, "default", no_credentials)
+    partition_dir = tmp_path / "orders" / "ingest_dt=2024-02-15"
+    partition_dir.mkdir(parents=True)
+    (partition_dir / "_SUCCESS").touch()
+
+    for concurrency in ("1", "4"):
+        result = CliRunner().invoke(
+            upload_raw_cmd,
+            ["--source", str(tmp_path), "--bucket", "test-bucket", "--concurrency", concurrency]
+            + ["--ingest-date", "2024-02-15"],
+        )
+        assert result.exit_code == 1
+        assert "No Google credentials found" in result.output
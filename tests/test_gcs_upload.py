@@ -1,9 +1,17 @@
+import threading
+import time
 from unittest.mock import MagicMock
 
+import pytest
 from ecom_datalake_extension.gcs_uploader import (
+    PartitionUploadError,
+    PartitionUploadPipeline,
     build_partition_prefix,
     upload_partition,
+    upload_partitions,
 )
+from ecom_datalake_extension.storage_backends import LocalBackend
+from ecom_datalake_extension.upload_control import UploadController
 
 
 def test_build_partition_prefix():
@@ -31,3 +39,109 @@ def test_upload_partition(tmp_path):
     assert result.files_uploaded == 2
     assert result.bucket == "bucket"
     mock_bucket.blob.assert_called()
+
+
+def test_upload_partitions_commits_markers_after_part_files(tmp_path):
+    partitions = []
+    for table in ("orders", "order_items"):
+        partition_dir = tmp_path / table / "ingest_dt=2024-02-15"
+        partition_dir.mkdir(parents=True)
+        for name in ("_SUCCESS", "_MANIFEST.json", "part-0000.parquet", "part-0001.parquet"):
+            (partition_dir / name).write_text(name)
+        partitions.append((partition_dir, f"ecom/raw/{table}/ingest_dt=2024-02-15"))
+
+    uploaded = []
+    lock = threading.Lock()
+    mock_client = MagicMock()
+
+    def make_blob(blob_path):
+        blob = MagicMock()
+
+        def upload(path, **kwargs):
+            if blob_path.endswith("order_items/ingest_dt=2024-02-15/part-0001.parquet"):
+                raise ConnectionError("link reset")
+            with lock:
+                uploaded.append(blob_path)
+
+        blob.upload_from_filename.side_effect = upload
+        return blob
+
+    mock_client.bucket.return_value.blob.side_effect = make_blob
+
+    with pytest.raises(PartitionUploadError) as excinfo:
+        upload_partitions(partitions, bucket_name="bucket", concurrency=4, client=mock_client)
+
+    assert list(excinfo.value.failures) == [partitions[1][0].resolve()]
+    orders = [path.rsplit("/", 1)[1] for path in uploaded if "/orders/" in path]
+    assert sorted(orders[:2]) == ["part-0000.parquet", "part-0001.parquet"]
+    assert orders[2:] == ["_MANIFEST.json", "_SUCCESS"]
+    # The failed partition keeps its other part files but is never committed
+    items = [path.rsplit("/", 1)[1] for path in uploaded if "/order_items/" in path]
+    assert items == ["part-0000.parquet"]
+
+
+def test_upload_pipeline_bounds_pending_partitions(tmp_path):
+    partitions = []
+    for day in (15, 16):
+        partition_dir = tmp_path / "orders" / f"ingest_dt=2024-02-{day}"
+        partition_dir.mkdir(parents=True)
+        for name in ("part-0000.parquet", "_MANIFEST.json", "_SUCCESS"):
+            (partition_dir / name).write_text(name)
+        partitions.append((partition_dir, f"ecom/raw/orders/ingest_dt=2024-02-{day}"))
+
+    release = threading.Event()
+    mock_client = MagicMock()
+    mock_client.bucket.return_value.blob.return_value.upload_from_filename.side_effect = (
+        lambda *args, **kwargs: release.wait(5)
+    )
+    pipeline = PartitionUploadPipeline(
+        bucket_name="bucket", concurrency=1, max_pending=1, skip_unchanged=False, client=mock_client
+    )
+    pipeline.submit(*partitions[0])
+
+    # The second partition waits for the first to finish uploading
+    producer = threading.Thread(target=pipeline.submit, args=partitions[1])
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+
+    release.set()
+    producer.join(5)
+    results = pipeline.close()
+    assert [result.prefix for result in results] == [prefix for _, prefix in partitions]
+    assert [result.files_uploaded for result in results] == [3, 3]
+
+
+def test_upload_pipeline_keeps_uploads_within_its_concurrency(tmp_path):
+    lock = threading.Lock()
+    # [uploads in flight, peak]
+    in_flight = [0, 0]
+    threads = set()
+
+    class TrackingBackend(LocalBackend):
+        def upload(self, path, key):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+                threads.add(threading.current_thread().name)
+            time.sleep(0.01)
+            super().upload(path, key)
+            with lock:
+                in_flight[0] -= 1
+
+    controller = UploadController(max_concurrency=2, adaptive=False)
+    pipeline = PartitionUploadPipeline(
+        backend=TrackingBackend(tmp_path / "bucket"), concurrency=2, controller=controller
+    )
+    for day in range(10, 16):
+        partition_dir = tmp_path / "raw" / "orders" / f"ingest_dt=2024-02-{day}"
+        partition_dir.mkdir(parents=True)
+        for name in ("part-0000.parquet", "part-0001.parquet", "part-0002.parquet", "_SUCCESS"):
+            (partition_dir / name).write_text(name)
+        pipeline.submit(partition_dir, f"ecom/raw/orders/ingest_dt=2024-02-{day}")
+    results = pipeline.close()
+
+    assert [result.files_uploaded for result in results] == [4] * 6
+    # Partitions upload file by file on the pipeline's own workers, not nested pools
+    assert in_flight[1] == 2
+    assert all(name.startswith("upload") for name in threads)
@@ -0,0 +1,40 @@
+import math
+
+import pandas as pd
+import pytest
+from ecom_datalake_extension.lineage import compute_event_id, compute_event_ids
+
+
+def _row_wise_event_ids(table_name, df, primary_keys):
+    return df.apply(
+        lambda row: compute_event_id(table_name, row, primary_keys),
+        axis=1,
+    ).tolist()
+
+
+def test_compute_event_ids_matches_row_wise_helper():
+    df = pd.DataFrame(
+        {
+            "order_id": ["ORD-1", 'ORD-é"2', "ORD-3"],
+            "product_id": [101, 202, 303],
+            "unit_price": [9.99, 1e-7, 3.0],
+            "is_gift": [True, False, True],
+            "agent_id": ["A1", None, math.nan],
+            "batch_id": ["batch_x"] * 3,
+        }
+    )
+
+    for keys in [
+        ("order_id",),
+        ("order_id", "product_id"),
+        ("unit_price", "is_gift", "agent_id"),
+    ]:
+        assert compute_event_ids("order_items", df, keys) == _row_wise_event_ids(
+            "order_items", df, keys
+        )
+
+
+def test_compute_event_ids_missing_key_raises():
+    df = pd.DataFrame({"order_id": ["ORD-1"], "batch_id": ["b"]})
+    with pytest.raises(KeyError):
+        compute_event_ids("orders", df, ("missing",))
@@ -1,8 +1,19 @@
+import uuid
 from datetime import date
 
+import numpy as np
 import pandas as pd
-from ecom_datalake_extension.config import require_table_config
-from ecom_datalake_extension.parquet_writer import write_partitioned_parquet
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from ecom_datalake_extension import parquet_writer
+from ecom_datalake_extension.config import apply_encoding_overrides, require_table_config
+from ecom_datalake_extension.parquet_writer import (
+    event_date_bounds,
+    write_dimension_partitions,
+    write_partitioned_parquet,
+)
+from ecom_datalake_extension.utils import verify_checksum
 
 
 def test_write_partitioned_parquet(tmp_path):
@@ -55,3 +66,308 @@ def test_write_partitioned_parquet(tmp_path):
     written_df = pd.read_parquet(parquet_path)
     assert {"event_id", "batch_id", "ingestion_ts"}.issubset(written_df.columns)
     assert written_df.iloc[0]["batch_id"] == "batch_test"
+
+
+def test_write_partitioned_parquet_checksum_modes(tmp_path):
+    table_config = require_table_config("orders")
+    df = pd.DataFrame(
+        [{"order_id": "ORDER-1", "order_date": "2024-01-10", "net_total": 10.0}],
+    )
+
+    for mode in ("parquet", "json"):
+        output_root = tmp_path / mode
+        manifest_files, *_, checksums = write_partitioned_parquet(
+            df,
+            table_config=table_config,
+            output_root=output_root,
+            ingest_dt=date(2024, 1, 15),
+            batch_id="batch_test",
+            checksum_mode=mode,
+        )
+        assert checksums[0].startswith("sha256-parquet:") == (mode == "parquet")
+        assert verify_checksum(output_root / manifest_files[0].path, checksums[0])
+
+
+def test_write_partitioned_parquet_rolls_on_written_bytes(tmp_path):
+    table_config = require_table_config("orders")
+    df = pd.DataFrame(
+        {
+            "order_id": [f"ORDER-{n}" for n in range(20000)],
+            "order_date": "2024-01-10",
+            "notes": [uuid.uuid4().hex for _ in range(20000)],
+        }
+    )
+    target_size_mb = 0.25
+    manifest_files, *_, total_rows, _ = write_partitioned_parquet(
+        df,
+        table_config=table_config,
+        output_root=tmp_path,
+        ingest_dt=date(2024, 1, 15),
+        batch_id="batch_test",
+        target_size_mb=target_size_mb,
+    )
+
+    target_bytes = target_size_mb * 1024 * 1024
+    sizes = [(tmp_path / item.path).stat().st_size for item in manifest_files]
+    assert len(sizes) > 2
+    assert total_rows == len(df)
+    for size in sizes[:-1]:
+        assert 0.9 * target_bytes <= size <= 1.1 * target_bytes
+
+
+def test_write_partitioned_parquet_applies_encoding_profile(tmp_path):
+    table_config = apply_encoding_overrides(
+        require_table_config("cart_items"),
+        {"row_group_size": 2},
+    )
+    df = pd.DataFrame(
+        {
+            "cart_item_id": [f"CI-{n}" for n in range(5)],
+            "added_at": "2024-01-10T08:00:00",
+            "quantity": range(5),
+        }
+    )
+    manifest_files, *_ = write_partitioned_parquet(
+        df,
+        table_config=table_config,
+        output_root=tmp_path,
+        ingest_dt=date(2024, 1, 15),
+        batch_id="batch_test",
+    )
+
+    metadata = pq.ParquetFile(tmp_path / manifest_files[0].path).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_write_partitioned_parquet_sorts_by_default_columns(tmp_path):
+    table_config = require_table_config("orders")
+    df = pd.DataFrame(
+        {
+            "order_id": ["ORDER-3", "ORDER-1", "ORDER-2"],
+            "order_date": ["2024-01-10T09:00:00", "2024-01-10T07:00:00", "2024-01-10T07:00:00"],
+        }
+    )
+    manifest_files, *_ = write_partitioned_parquet(
+        df,
+        table_config=table_config,
+        output_root=tmp_path,
+        ingest_dt=date(2024, 1, 15),
+        batch_id="batch_test",
+        sort=True,
+    )
+
+    parquet_file = pq.ParquetFile(tmp_path / manifest_files[0].path)
+    assert parquet_file.read().column("order_id").to_pylist() == ["ORDER-1", "ORDER-2", "ORDER-3"]
+    row_group = parquet_file.metadata.row_group(0)
+    assert [column.column_index for column in row_group.sorting_columns] == [1, 0]
+    assert row_group.column(0).statistics.min == "ORDER-1"
+    assert row_group.column(0).has_offset_index
+
+
+def test_write_partitioned_parquet_sorted_frames_keep_declared_types(tmp_path):
+    table_config = require_table_config("orders")
+    df = pd.DataFrame(
+        {
+            "order_id": ["ORDER-2", "ORDER-1"],
+            "order_date": ["2024-01-10T09:00:00", "2024-01-10T07:00:00"],
+            "order_channel": ["Web", "App"],
+            "net_total": [10, 12],
+        }
+    )
+    schemas = []
+    for sort in (False, True):
+        manifest_files, *_ = write_partitioned_parquet(
+            df,
+            table_config=table_config,
+            output_root=tmp_path / str(sort),
+            ingest_dt=date(2024, 1, 15),
+            batch_id="batch_test",
+            sort=sort,
+        )
+        schemas.append(pq.read_schema(tmp_path / str(sort) / manifest_files[0].path))
+
+    assert schemas[1].field("net_total").type == pa.float64()
+    assert schemas[1].field("order_channel").type == pa.dictionary(pa.int32(), pa.string())
+    assert schemas[1].remove_metadata() == schemas[0].remove_metadata()
+
+
+def test_write_frame_never_holds_the_whole_frame_as_arrow(tmp_path, monkeypatch):
+    table_config = apply_encoding_overrides(
+        require_table_config("orders"), {"row_group_size": 1000}
+    )
+    df = pd.DataFrame(
+        {
+            "order_id": [f"ORDER-{n:05d}" for n in reversed(range(20_000))],
+            "order_date": "2024-02-15T08:00:00",
+            "shipping_address": [
+                f"{n} Long Street, Some Town, Some County " * 6 for n in range(20_000)
+            ],
+            "gross_total": np.arange(20_000, dtype="float64"),
+        }
+    )
+    frame_bytes = pa.Table.from_pandas(df, preserve_index=False).nbytes
+    source = df["gross_total"].to_numpy()
+    # (rows, address of the gross_total buffer) of each group; holding the
+    # pieces themselves would keep them allocated
+    pieces = []
+    write_group = parquet_writer.PartitionStreamWriter._write_group
+
+    def capture(self, piece):
+        buffer = piece.column("gross_total").chunks[0].buffers()[1]
+        pieces.append((piece.num_rows, buffer.address))
+        write_group(self, piece)
+
+    monkeypatch.setattr(parquet_writer.PartitionStreamWriter, "_write_group", capture)
+    default_pool = pa.default_memory_pool()
+    for sort in (False, True):
+        pieces.clear()
+        pool = pa.proxy_memory_pool(default_pool)
+        pa.set_memory_pool(pool)
+        try:
+            manifest_files, *_ = write_partitioned_parquet(
+                df,
+                table_config=table_config,
+                output_root=tmp_path / str(sort),
+                ingest_dt=date(2024, 2, 15),
+                batch_id="batch_views",
+                sort=sort,
+            )
+        finally:
+            pa.set_memory_pool(default_pool)
+
+        # Converted one row group at a time (the sort only converts its key columns)
+        assert pool.max_memory() < frame_bytes
+        assert [rows for rows, _ in pieces] == [1000] * 20
+        written = pq.read_table(tmp_path / str(sort) / manifest_files[0].path, columns=["order_id"])
+        expected = sorted(df["order_id"]) if sort else list(df["order_id"])
+        assert written.column("order_id").to_pylist() == expected
+        if not sort:
+            # Unsorted groups are views of the frame: numeric buffers point into its memory
+            for _, address in pieces:
+                assert source.ctypes.data <= address < source.ctypes.data + source.nbytes
+
+
+def test_write_dimension_partitions_matches_per_partition_writes(tmp_path):
+    table_config = require_table_config("customers")
+    customers = pd.DataFrame(
+        {
+            "customer_id": [f"CUST-{n}" for n in range(6)],
+            "signup_date": [
+                "2024-01-02",
+                "2024-01-01",
+                "2024-01-02",
+                None,
+                "2024-01-03",
+                "2024-01-01",
+            ],
+            "age": [30, 41, 25, 52, 38, 29],
+            "is_guest": [False, True, False, False, True, False],
+        }
+    )
+    signup_dates = pd.to_datetime(customers["signup_date"]).dt.date
+
+    results = write_dimension_partitions(
+        customers,
+        signup_dates,
+        table_config=table_config,
+        output_root=tmp_path / "bulk",
+        partition_column="signup_date",
+        batch_id="batch_dims",
+        source_prefix="gs://bucket/raw",
+    )
+
+    assert list(results) == [f"customers/signup_date=2024-01-0{day}" for day in (1, 2, 3)]
+    for partition_path, (files, min_dt, max_dt, total_rows, _) in results.items():
+        signup_dt = partition_path.rsplit("=", 1)[1]
+        expected = write_partitioned_parquet(
+            customers[customers["signup_date"] == signup_dt],
+            table_config=table_config,
+            output_root=tmp_path / "per_group",
+            ingest_dt=None,
+            batch_id="batch_dims",
+            source_prefix=f"gs://bucket/raw/{partition_path}",
+            partition_path_override=partition_path,
+        )
+        assert [f.path for f in files] == [f.path for f in expected[0]]
+        assert (min_dt, max_dt, total_rows) == (signup_dt, signup_dt, expected[3])
+        bulk = pd.read_parquet(tmp_path / "bulk" / files[0].path)
+        per_group = pd.read_parquet(tmp_path / "per_group" / expected[0][0].path)
+        pd.testing.assert_frame_equal(
+            bulk.drop(columns=["ingestion_ts"]), per_group.drop(columns=["ingestion_ts"])
+        )
+
+
+def test_write_dimension_partitions_orders_categorical_values(tmp_path):
+    products = pd.DataFrame(
+        {
+            "product_id": [1, 2, 3],
+            "category": pd.Categorical(
+                ["Toys", "Books", "Games"], categories=["Toys", "Books", "Games"]
+            ),
+        }
+    )
+    results = write_dimension_partitions(
+        products,
+        products["category"],
+        table_config=require_table_config("product_catalog"),
+        output_root=tmp_path,
+        partition_column="category",
+        batch_id="batch_dims",
+    )
+    assert list(results) == [
+        f"product_catalog/category={value}" for value in ("Books", "Games", "Toys")
+    ]
+
+
+def test_event_date_bounds_reduces_iso_values_without_mixed_parsing(monkeypatch):
+    def fail_mixed(values):
+        raise AssertionError(f"mixed parsing used for {values.tolist()}")
+
+    monkeypatch.setattr(parquet_writer, "_mixed_date_bounds", fail_mixed)
+    values = ["2024-02-15T08:00:00", "2024-02-14", None, "2024-02-16 10:00:00+01:00"]
+    assert event_date_bounds(pd.Series(values)) == ("2024-02-14", "2024-02-16")
+    assert event_date_bounds(pa.array(values)) == ("2024-02-14", "2024-02-16")
+    assert event_date_bounds(pd.Series(["2024-01-03", "2024-01-01"], dtype="category")) == (
+        "2024-01-01",
+        "2024-01-03",
+    )
+    assert event_date_bounds(
+        pd.Series(pd.to_datetime(["2024-03-01 10:00", "2024-01-01 00:00"]))
+    ) == (
+        "2024-01-01",
+        "2024-03-01",
+    )
+    assert event_date_bounds(pa.array([None], type=pa.string())) == (None, None)
+    with pytest.raises(AssertionError, match="02/20/2024"):
+        event_date_bounds(pd.Series(["2024-02-15", "02/20/2024"]))
+
+
+def test_event_date_bounds_falls_back_for_messy_rows():
+    values = pd.Series(["2024-02-15T08:00:00", "02/20/2024", "2024-02-30", "garbage", None])
+    assert event_date_bounds(values) == ("2024-02-15", "2024-02-20")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-02-15",
+        "2024-02-15T08:00",
+        "2024-02-15 08:00:00.123456",
+        "2024-02-15T08:00:00Z",
+        "2024-02-15T23:30:00-05:00",
+        "2024-02-15 garbage",
+        "2024-02-15Z",
+        "2024-02-15T25:00:00",
+        "2024-02-15T08:61:00",
+        "2024-02-15T08:00:00+05:00 trailing",
+        "2024-02-30T08:00:00",
+    ],
+)
+def test_event_date_bounds_matches_mixed_parsing(value):
+    # The Arrow fast path must agree with pandas on every single value it accepts
+    expected = parquet_writer._mixed_date_bounds(pd.Series([value]))
+    assert event_date_bounds(pa.array([value])) == expected
+    assert event_date_bounds(pd.Series(["2024-03-01", value])) == parquet_writer._merge_bounds(
+        ("2024-03-01", "2024-03-01"), expected
+    )
@@ -0,0 +1,72 @@
+from click.testing import CliRunner
+from ecom_datalake_extension.cli import upload_raw_cmd
+from ecom_datalake_extension.gcs_uploader import open_backend, upload_partitions
+from ecom_datalake_extension.storage_backends import LocalBackend
+
+
+def _partition(root, table, day):
+    partition_dir = root / table / f"ingest_dt=2024-02-{day}"
+    partition_dir.mkdir(parents=True)
+    for name in ("part-0000.parquet", "part-0001.parquet", "_MANIFEST.json", "_SUCCESS"):
+        (partition_dir / name).write_text(f"{table}/{day}/{name}")
+    return partition_dir
+
+
+def test_local_backend_uploads_and_skips_unchanged_files(tmp_path):
+    partitions = [
+        (_partition(tmp_path / "raw", table, 15), f"ecom/raw/{table}/ingest_dt=2024-02-15")
+        for table in ("orders", "returns")
+    ]
+    backend = LocalBackend(tmp_path / "bucket")
+
+    first = upload_partitions(partitions, backend=backend, concurrency=4)
+    assert [result.files_uploaded for result in first] == [4, 4]
+    uploaded = tmp_path / "bucket" / "ecom" / "raw" / "orders" / "ingest_dt=2024-02-15"
+    assert sorted(path.name for path in uploaded.iterdir()) == [
+        "_MANIFEST.json",
+        "_SUCCESS",
+        "part-0000.parquet",
+        "part-0001.parquet",
+    ]
+
+    (partitions[0][0] / "part-0001.parquet").write_text("rewritten")
+    second = upload_partitions(partitions, backend=backend, concurrency=4)
+    assert [(result.files_uploaded, result.files_skipped) for result in second] == [(1, 3), (0, 4)]
+    assert (uploaded / "part-0001.parquet").read_text() == "rewritten"
+
+
+def test_upload_raw_cli_uploads_to_a_file_url(tmp_path):
+    source_dir = tmp_path / "raw"
+    _partition(source_dir, "orders", 15)
+    bucket_dir = tmp_path / "bucket"
+    backend, prefix = open_backend(bucket_dir.as_uri())
+    assert isinstance(backend, LocalBackend)
+    assert prefix == ""
+
+    result = CliRunner().invoke(
+        upload_raw_cmd,
+        ["--source", str(source_dir), "--bucket", bucket_dir.as_uri()]
+        + ["--ingest-date", "2024-02-15", "--concurrency", "2"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert f"→ {bucket_dir.as_uri()}/ecom/raw/orders/ingest_dt=2024-02-15" in result.output
+    assert (bucket_dir / "ecom/raw/orders/ingest_dt=2024-02-15/_SUCCESS").exists()
+
+
+def test_upload_raw_cli_dry_run_leaves_a_url_bucket_unopened(tmp_path, monkeypatch):
+    _partition(tmp_path / "raw", "orders", 15)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("backend opened on a dry run")
+
+    monkeypatch.setattr("ecom_datalake_extension.cli.open_backend", fail)
+    monkeypatch.setattr("ecom_datalake_extension.gcs_uploader.GCSBackend", fail)
+    result = CliRunner().invoke(
+        upload_raw_cmd,
+        ["--source", str(tmp_path / "raw"), "--bucket", (tmp_path / "bucket").as_uri()]
+        + ["--ingest-date", "2024-02-15", "--dry-run"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert not (tmp_path / "bucket").exists()
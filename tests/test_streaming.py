@@ -0,0 +1,211 @@
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from click.testing import CliRunner
+from ecom_datalake_extension.cli import export_raw_cmd
+from ecom_datalake_extension.config import require_table_config
+from ecom_datalake_extension.parquet_writer import PartitionStreamWriter
+from ecom_datalake_extension.streaming import iter_csv_batches, read_csv_table
+from ecom_datalake_extension.utils import (
+    ChecksumAccumulator,
+    compute_checksum,
+    file_checksum,
+)
+
+
+def _write_sources(source_dir):
+    orders = pd.DataFrame(
+        [
+            {
+                "order_id": f"ORDER-{day}-{n}",
+                "order_date": f"2024-02-{day:02d}T0{n}:15:00",
+                # Missing string, int, and float cells must stay null in every engine
+                "customer_id": None if n == 1 else f"CUST-{n}",
+                "total_items": None if n == 2 else n + 1,
+                "gross_total": 10.0 + n,
+                "net_total": None if n == 0 else 9.0 + n,
+                "order_channel": "Web",
+            }
+            for day in (15, 16)
+            for n in range(3)
+        ]
+    )
+    order_items = pd.DataFrame(
+        [
+            {
+                "order_id": order_id,
+                "product_id": product_id,
+                "quantity": None if product_id == 2 else 1,
+                "unit_price": 5.0,
+            }
+            for order_id in orders["order_id"]
+            for product_id in (1, 2)
+        ]
+    )
+    orders.to_csv(source_dir / "orders.csv", index=False)
+    order_items.to_csv(source_dir / "order_items.csv", index=False)
+
+
+def _read_partition(target_dir, table, ingest_dt):
+    partition_dir = target_dir / table / f"ingest_dt={ingest_dt}"
+    manifest = json.loads((partition_dir / "_MANIFEST.json").read_text())
+    frames = [pd.read_parquet(target_dir / item["path"]) for item in manifest["files"]]
+    return manifest, pd.concat(frames, ignore_index=True).drop(columns=["ingestion_ts"])
+
+
+def test_checksum_accumulator_matches_compute_checksum():
+    df = pd.DataFrame({"id": [1, 2, 3, 4, 5], "name": list("abcde"), "value": [0.5] * 5})
+    accumulator = ChecksumAccumulator()
+    for start in range(0, len(df), 2):
+        accumulator.update(df.iloc[start : start + 2])
+    assert accumulator.hexdigest() == compute_checksum(df)
+    assert ChecksumAccumulator().hexdigest() == compute_checksum(df.iloc[0:0])
+
+
+def test_csv_readers_null_values_match_pandas(tmp_path):
+    csv_path = tmp_path / "orders.csv"
+    csv_path.write_text(
+        "order_id,email,agent_id,total_items,net_total\n"
+        "ORDER-1,,NA,,1.5\n"
+        "ORDER-2,a@example.com,None,2,\n"
+        "ORDER-3,<NA>,AGENT-7,3,2.5\n"
+    )
+    expected = pd.read_csv(csv_path)
+
+    for table in (
+        read_csv_table(csv_path, block_size_mb=1),
+        pa.concat_tables(iter_csv_batches(csv_path, block_size_mb=1)),
+    ):
+        actual = table.to_pandas()
+        pd.testing.assert_frame_equal(actual.isna(), expected.isna())
+        pd.testing.assert_frame_equal(
+            actual.astype(object).where(actual.notna(), None),
+            expected.astype(object).where(expected.notna(), None),
+        )
+
+
+def test_export_raw_engines_match(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    _write_sources(source_dir)
+
+    runner = CliRunner()
+    outputs = {}
+    modes = {
+        "--no-streaming": [],
+        "--streaming": [],
+        "--engine=arrow": ["--sort"],
+        "--engine=pandas": ["--sort"],
+    }
+    for mode, extra in modes.items():
+        target_dir = tmp_path / mode.strip("-").replace("=", "_")
+        result = runner.invoke(
+            export_raw_cmd,
+            [
+                "--source",
+                str(source_dir),
+                "--target",
+                str(target_dir),
+                "--dates",
+                "2024-02-15,2024-02-16",
+                "--batch-id",
+                "batch_parity",
+                mode,
+                *extra,
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        outputs[mode] = target_dir
+
+    for table in ("orders", "order_items"):
+        for ingest_dt in ("2024-02-15", "2024-02-16"):
+            expected_manifest, expected = _read_partition(
+                outputs["--no-streaming"], table, ingest_dt
+            )
+            actual_manifest, actual = _read_partition(outputs["--streaming"], table, ingest_dt)
+            pd.testing.assert_frame_equal(actual, expected)
+            assert actual_manifest["total_rows"] == expected_manifest["total_rows"]
+            assert actual_manifest["min_event_dt"] == expected_manifest["min_event_dt"]
+
+            arrow_manifest, arrow = _read_partition(outputs["--engine=arrow"], table, ingest_dt)
+            sorted_manifest, pandas_sorted = _read_partition(
+                outputs["--engine=pandas"], table, ingest_dt
+            )
+            pd.testing.assert_frame_equal(arrow, pandas_sorted)
+            # Both engines parse configured tables with Arrow, so check nulls directly too
+            expected_nulls = {
+                "orders": {"customer_id": 1, "total_items": 1, "net_total": 1},
+                "order_items": {"quantity": 3},
+            }[table]
+            for frame in (expected, arrow):
+                assert {column: int(frame[column].isna().sum()) for column in expected_nulls} == (
+                    expected_nulls
+                )
+            assert arrow_manifest["total_rows"] == sorted_manifest["total_rows"]
+            assert arrow_manifest["max_event_dt"] == sorted_manifest["max_event_dt"]
+
+
+def test_partition_stream_writer_checksums(tmp_path):
+    rows = [{"order_id": f"ORDER-{n}", "order_date": "2024-02-15"} for n in range(3)]
+    for mode in ("parquet", "json"):
+        writer = PartitionStreamWriter(
+            table_config=require_table_config("orders"),
+            output_root=tmp_path / mode,
+            partition_path="orders/ingest_dt=2024-02-15",
+            batch_id="batch_stream",
+            checksum_mode=mode,
+        )
+        writer.write(pa.Table.from_pylist(rows[:1]))
+        writer.write(pa.Table.from_pylist(rows[1:]))
+        manifest_files, *_, checksums = writer.close()
+
+        written = tmp_path / mode / manifest_files[0].path
+        expected = (
+            file_checksum(written)
+            if mode == "parquet"
+            else compute_checksum(pd.read_parquet(written))
+        )
+        assert checksums == [expected]
+
+
+def test_declared_columns_keep_partition_schemas_identical(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    pd.DataFrame(
+        [
+            {
+                "order_id": f"ORDER-{day}",
+                "order_date": f"2024-02-{day:02d}T09:00:00",
+                "total_items": None if day == 15 else 2,
+                "agent_id": None if day == 15 else "AGENT-7",
+                "order_channel": "Web",
+            }
+            for day in (15, 16)
+        ]
+    ).to_csv(source_dir / "orders.csv", index=False)
+
+    schemas = []
+    for mode in ("--engine=pandas", "--engine=arrow", "--streaming", "--csv-cache"):
+        target_dir = tmp_path / mode.strip("-")
+        result = CliRunner().invoke(
+            export_raw_cmd,
+            ["--source", str(source_dir), "--target", str(target_dir), mode]
+            + ["--dates", "2024-02-15,2024-02-16"],
+        )
+        assert result.exit_code == 0, result.output
+        for day in (15, 16):
+            path = target_dir / "orders" / f"ingest_dt=2024-02-{day}" / "part-0000.parquet"
+            schemas.append(pq.read_schema(path).remove_metadata())
+        missing = pq.read_table(
+            target_dir / "orders" / "ingest_dt=2024-02-15" / "part-0000.parquet",
+            columns=["total_items", "agent_id"],
+        )
+        # Empty cells stay null, not "" or 0, whichever reader parsed the CSV
+        assert missing.to_pylist() == [{"total_items": None, "agent_id": None}], mode
+
+    assert all(schema.equals(schemas[0]) for schema in schemas)
+    assert schemas[0].field("total_items").type == pa.int64()
+    assert schemas[0].field("agent_id").type == pa.string()
+    assert pa.types.is_dictionary(schemas[0].field("order_channel").type)
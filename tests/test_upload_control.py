@@ -0,0 +1,104 @@
+from click.testing import CliRunner
+from ecom_datalake_extension.cli import upload_raw_cmd
+from ecom_datalake_extension.gcs_uploader import upload_partitions
+from ecom_datalake_extension.storage_backends import LocalBackend
+from ecom_datalake_extension.upload_control import UploadController, report_throttle
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds
+
+
+def _upload(controller, clock, seconds, nbytes=1024):
+    with controller.slot(nbytes):
+        clock.now += seconds
+
+
+def test_adaptive_limit_grows_until_throttled_then_backs_off():
+    clock = _FakeClock()
+    controller = UploadController(max_concurrency=8, clock=clock, sleep=clock.sleep)
+    for _ in range(7):
+        _upload(controller, clock, 0.1)
+    assert controller.limit == 8
+
+    # Retries within one upload are one burst: a single cut
+    with controller.slot(1024):
+        report_throttle()
+        report_throttle()
+    assert (controller.limit, controller.throttle_events) == (5, 2)
+    with controller.slot(1024):
+        report_throttle()
+    assert controller.limit == 3
+
+    # Past slow start the limit grows by one per round of fast uploads
+    for _ in range(3):
+        _upload(controller, clock, 0.1)
+    assert controller.limit == 4
+
+    # Latency well above the best seen gives back one slot
+    _upload(controller, clock, 0.5)
+    assert controller.limit == 3
+
+
+def test_bandwidth_cap_paces_upload_starts():
+    clock = _FakeClock()
+    controller = UploadController(
+        max_concurrency=4, adaptive=False, max_bandwidth_mbps=2, clock=clock, sleep=clock.sleep
+    )
+    for _ in range(4):
+        _upload(controller, clock, 0.0, nbytes=1024 * 1024)
+    # 4 MiB at 2 MiB/s: the last upload may start 1.5s after the first
+    assert clock.slept == 1.5
+    assert controller.limit == 4
+
+
+def test_upload_partitions_backs_off_on_throttling(tmp_path):
+    partition_dir = tmp_path / "raw" / "orders" / "ingest_dt=2024-02-15"
+    partition_dir.mkdir(parents=True)
+    for index in range(6):
+        (partition_dir / f"part-{index:04d}.parquet").write_text(str(index))
+    (partition_dir / "_SUCCESS").touch()
+
+    class ThrottlingBackend(LocalBackend):
+        def upload(self, path, key):
+            report_throttle()
+            super().upload(path, key)
+
+    controller = UploadController(max_concurrency=8, initial=8)
+    (result,) = upload_partitions(
+        [(partition_dir, "ecom/raw/orders/ingest_dt=2024-02-15")],
+        backend=ThrottlingBackend(tmp_path / "bucket"),
+        controller=controller,
+    )
+
+    assert result.files_uploaded == 7
+    assert controller.throttle_events == 7
+    # At least one cut for the part files' burst and one for the commit markers after it
+    assert controller.limit <= 3
+
+
+def test_upload_raw_cli_reports_adaptive_concurrency(tmp_path):
+    partition_dir = tmp_path / "raw" / "orders" / "ingest_dt=2024-02-15"
+    partition_dir.mkdir(parents=True)
+    (partition_dir / "part-0000.parquet").write_text("data")
+    (partition_dir / "_SUCCESS").touch()
+
+    result = CliRunner().invoke(
+        upload_raw_cmd,
+        ["--source", str(tmp_path / "raw"), "--bucket", (tmp_path / "bucket").as_uri()]
+        + ["--ingest-date", "2024-02-15", "--concurrency", "4", "--adaptive"]
+        + ["--max-bandwidth", "100"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Adaptive concurrency settled at" in result.output
+    assert "of 4, 0 throttle signal(s)" in result.output